@@ -0,0 +1,39 @@
+"""Add structured price columns to events"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20241018_0002"
+down_revision = "20240526_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("events", sa.Column("min_price", sa.Integer(), nullable=True))
+    op.add_column("events", sa.Column("max_price", sa.Integer(), nullable=True))
+    op.add_column(
+        "events",
+        sa.Column("is_free_normalized", sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+    op.create_index("ix_events_min_price", "events", ["min_price"], unique=False)
+    op.create_index("ix_events_max_price", "events", ["max_price"], unique=False)
+    op.create_index("ix_events_is_free_normalized", "events", ["is_free_normalized"], unique=False)
+
+    # Seed the obvious free events; paid price ranges are filled in by the next sync.
+    op.execute(
+        "UPDATE events SET is_free_normalized = true, min_price = 0, max_price = 0 "
+        "WHERE is_free IN ('무료', 'free')"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_is_free_normalized", table_name="events")
+    op.drop_index("ix_events_max_price", table_name="events")
+    op.drop_index("ix_events_min_price", table_name="events")
+    op.drop_column("events", "is_free_normalized")
+    op.drop_column("events", "max_price")
+    op.drop_column("events", "min_price")
@@ -0,0 +1,42 @@
+"""Move large event text columns into event_details"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20241018_0003"
+down_revision = "20241018_0002"
+branch_labels = None
+depends_on = None
+
+DETAIL_COLUMNS = ("use_fee", "player", "program", "etc_desc")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_details",
+        sa.Column("event_id", sa.Integer(), primary_key=True),
+        sa.Column("use_fee", sa.Text(), nullable=True),
+        sa.Column("player", sa.Text(), nullable=True),
+        sa.Column("program", sa.Text(), nullable=True),
+        sa.Column("etc_desc", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"], ondelete="CASCADE"),
+    )
+
+    columns = ", ".join(DETAIL_COLUMNS)
+    op.execute(f"INSERT INTO event_details (event_id, {columns}) SELECT id, {columns} FROM events")
+
+    for column in DETAIL_COLUMNS:
+        op.drop_column("events", column)
+
+
+def downgrade() -> None:
+    for column in DETAIL_COLUMNS:
+        op.add_column("events", sa.Column(column, sa.Text(), nullable=True))
+
+    assignments = ", ".join(f"{column} = d.{column}" for column in DETAIL_COLUMNS)
+    op.execute(f"UPDATE events SET {assignments} FROM event_details AS d WHERE d.event_id = events.id")
+
+    op.drop_table("event_details")
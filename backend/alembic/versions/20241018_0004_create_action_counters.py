@@ -0,0 +1,37 @@
+"""Create hourly action counters for popularity rankings"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20241018_0004"
+down_revision = "20241018_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "action_counters",
+        sa.Column("action_type", sa.String(length=50), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("target_id", sa.Integer(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("action_type", "bucket_start", "target_id", name="pk_action_counters"),
+    )
+
+    op.execute(
+        """
+        INSERT INTO action_counters (action_type, bucket_start, target_id, count)
+        SELECT action_type, date_trunc('hour', timestamp AT TIME ZONE 'UTC') AT TIME ZONE 'UTC', target_id, count(*)
+        FROM user_actions
+        WHERE target_id IS NOT NULL
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("action_counters")
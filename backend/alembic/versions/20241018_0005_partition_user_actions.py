@@ -0,0 +1,120 @@
+"""Partition user_actions by month on timestamp"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20241018_0005"
+down_revision = "20241018_0004"
+branch_labels = None
+depends_on = None
+
+# Matches the USER_ACTIONS_PARTITIONS_AHEAD default used by partition maintenance.
+MONTHS_AHEAD = 3
+
+COLUMNS = "id, user_id, action_type, target_id, timestamp, metadata"
+
+
+def upgrade() -> None:
+    # Partition bounds and names are computed in UTC.
+    op.execute("SET LOCAL TIME ZONE 'UTC'")
+
+    op.execute("ALTER TABLE user_actions RENAME TO user_actions_old")
+    op.execute("ALTER TABLE user_actions_old RENAME CONSTRAINT user_actions_pkey TO user_actions_old_pkey")
+    op.drop_index("ix_user_actions_target_id", table_name="user_actions_old")
+    op.drop_index("ix_user_actions_action_type", table_name="user_actions_old")
+    op.drop_index("ix_user_actions_user_id", table_name="user_actions_old")
+    op.drop_index("ix_user_actions_id", table_name="user_actions_old")
+
+    op.execute(
+        """
+        CREATE TABLE user_actions (
+            id INTEGER NOT NULL DEFAULT nextval('user_actions_id_seq'),
+            user_id INTEGER REFERENCES users (id) ON DELETE SET NULL,
+            action_type VARCHAR(50) NOT NULL,
+            target_id INTEGER,
+            timestamp TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            metadata JSONB,
+            CONSTRAINT user_actions_pkey PRIMARY KEY (id, timestamp)
+        ) PARTITION BY RANGE (timestamp)
+        """
+    )
+    op.execute("ALTER SEQUENCE user_actions_id_seq OWNED BY user_actions.id")
+
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            month_start timestamptz := date_trunc(
+                'month', COALESCE((SELECT min(timestamp) FROM user_actions_old), now())
+            );
+            last_month timestamptz := greatest(
+                date_trunc('month', now()) + interval '{MONTHS_AHEAD} months',
+                date_trunc('month', COALESCE((SELECT max(timestamp) FROM user_actions_old), now()))
+            );
+        BEGIN
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF user_actions FOR VALUES FROM (%L) TO (%L)',
+                    'user_actions_p' || to_char(month_start, 'YYYY_MM'),
+                    month_start,
+                    month_start + interval '1 month'
+                );
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END $$;
+        """
+    )
+
+    op.execute(f"INSERT INTO user_actions ({COLUMNS}) SELECT {COLUMNS} FROM user_actions_old")
+    op.drop_table("user_actions_old")
+
+    # The primary key already covers id; action_type is too unselective to be
+    # worth a B-tree, and time-ordered inserts make BRIN a good fit for timestamp.
+    op.create_index("ix_user_actions_user_id", "user_actions", ["user_id"], unique=False)
+    op.create_index("ix_user_actions_target_id", "user_actions", ["target_id"], unique=False)
+    op.create_index(
+        "ix_user_actions_timestamp_brin",
+        "user_actions",
+        ["timestamp"],
+        unique=False,
+        postgresql_using="brin",
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE user_actions RENAME TO user_actions_partitioned")
+    op.execute(
+        "ALTER TABLE user_actions_partitioned RENAME CONSTRAINT user_actions_pkey TO user_actions_partitioned_pkey"
+    )
+    op.drop_index("ix_user_actions_timestamp_brin", table_name="user_actions_partitioned")
+    op.drop_index("ix_user_actions_target_id", table_name="user_actions_partitioned")
+    op.drop_index("ix_user_actions_user_id", table_name="user_actions_partitioned")
+
+    op.create_table(
+        "user_actions",
+        sa.Column("id", sa.Integer(), nullable=False, server_default=sa.text("nextval('user_actions_id_seq')")),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("action_type", sa.String(length=50), nullable=False),
+        sa.Column("target_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "timestamp",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("metadata", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id", name="user_actions_pkey"),
+    )
+    op.execute("ALTER SEQUENCE user_actions_id_seq OWNED BY user_actions.id")
+    op.execute(f"INSERT INTO user_actions ({COLUMNS}) SELECT {COLUMNS} FROM user_actions_partitioned")
+    op.drop_table("user_actions_partitioned")
+
+    op.create_index("ix_user_actions_id", "user_actions", ["id"], unique=False)
+    op.create_index("ix_user_actions_user_id", "user_actions", ["user_id"], unique=False)
+    op.create_index("ix_user_actions_action_type", "user_actions", ["action_type"], unique=False)
+    op.create_index("ix_user_actions_target_id", "user_actions", ["target_id"], unique=False)
@@ -0,0 +1,50 @@
+"""Create HyperLogLog visitor sketches per event and day"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20241018_0007"
+down_revision = "20241018_0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Register-wise max of two equally sized HyperLogLog sketches.
+    op.execute(
+        """
+        CREATE FUNCTION hll_merge(a bytea, b bytea) RETURNS bytea
+        LANGUAGE plpgsql IMMUTABLE STRICT PARALLEL SAFE AS $$
+        DECLARE
+            merged bytea := a;
+            i integer;
+        BEGIN
+            FOR i IN 0 .. length(b) - 1 LOOP
+                IF get_byte(b, i) > get_byte(merged, i) THEN
+                    merged := set_byte(merged, i, get_byte(b, i));
+                END IF;
+            END LOOP;
+            RETURN merged;
+        END
+        $$
+        """
+    )
+
+    op.create_table(
+        "event_visitor_sketches",
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("registers", sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("event_id", "day", name="pk_event_visitor_sketches"),
+    )
+    op.create_index("ix_event_visitor_sketches_day", "event_visitor_sketches", ["day"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_visitor_sketches_day", table_name="event_visitor_sketches")
+    op.drop_table("event_visitor_sketches")
+    op.execute("DROP FUNCTION hll_merge(bytea, bytea)")
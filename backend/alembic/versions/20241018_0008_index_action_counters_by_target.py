@@ -0,0 +1,24 @@
+"""Index action counters by target for engagement time series"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20241018_0008"
+down_revision = "20241018_0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_action_counters_target_type_bucket",
+        "action_counters",
+        ["target_id", "action_type", "bucket_start"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_action_counters_target_type_bucket", table_name="action_counters")
@@ -0,0 +1,39 @@
+"""Create sync run ledger"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20241018_0009"
+down_revision = "20241018_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sync_runs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("kind", sa.String(length=32), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("duration_ms", sa.Integer(), nullable=False),
+        sa.Column("stage_durations_ms", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("pages", sa.Integer(), nullable=False),
+        sa.Column("rows_fetched", sa.Integer(), nullable=False),
+        sa.Column("rows_upserted", sa.Integer(), nullable=False),
+        sa.Column("bytes_downloaded", sa.BigInteger(), nullable=False),
+        sa.Column("retries", sa.Integer(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("id", name="pk_sync_runs"),
+    )
+    op.create_index("ix_sync_runs_kind_started_at", "sync_runs", ["kind", "started_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sync_runs_kind_started_at", table_name="sync_runs")
+    op.drop_table("sync_runs")
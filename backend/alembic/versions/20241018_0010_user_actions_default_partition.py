@@ -0,0 +1,32 @@
+"""Add a DEFAULT partition to user_actions"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20241018_0010"
+down_revision = "20241018_0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Client-supplied timestamps outside the monthly partitions land here
+    # instead of failing the insert; partition maintenance moves them into
+    # their month once it is created and purges them after retention.
+    op.execute("CREATE TABLE user_actions_default PARTITION OF user_actions DEFAULT")
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM user_actions_default) THEN
+                RAISE EXCEPTION 'user_actions_default still holds rows; move them into monthly partitions first';
+            END IF;
+        END $$;
+        """
+    )
+    op.execute("DROP TABLE user_actions_default")
@@ -0,0 +1,21 @@
+"""Store the partial-paid note parsed from event fees"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20241018_0011"
+down_revision = "20241018_0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Filled in by the next sync, which re-parses every event's fee text.
+    op.add_column("events", sa.Column("price_note", sa.String(length=255), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("events", "price_note")
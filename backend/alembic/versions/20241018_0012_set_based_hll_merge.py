@@ -0,0 +1,48 @@
+"""Replace the hll_merge register loop with a set-based SQL function"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20241018_0012"
+down_revision = "20241018_0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Register-wise max of two equally sized HyperLogLog sketches, built in one
+    # aggregate over the register offsets instead of an interpreted loop.
+    op.execute(
+        r"""
+        CREATE OR REPLACE FUNCTION hll_merge(a bytea, b bytea) RETURNS bytea
+        LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+            SELECT string_agg(
+                set_byte('\x00'::bytea, 0, greatest(get_byte(a, i), get_byte(b, i))), ''::bytea ORDER BY i
+            )
+            FROM generate_series(0, length(a) - 1) AS i
+        $$
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION hll_merge(a bytea, b bytea) RETURNS bytea
+        LANGUAGE plpgsql IMMUTABLE STRICT PARALLEL SAFE AS $$
+        DECLARE
+            merged bytea := a;
+            i integer;
+        BEGIN
+            FOR i IN 0 .. length(b) - 1 LOOP
+                IF get_byte(b, i) > get_byte(merged, i) THEN
+                    merged := set_byte(merged, i, get_byte(b, i));
+                END IF;
+            END LOOP;
+            RETURN merged;
+        END
+        $$
+        """
+    )
@@ -0,0 +1,23 @@
+"""Drop the never-populated retries column from sync_runs"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20241018_0013"
+down_revision = "20241018_0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Neither sync retries requests yet, so the column only ever held 0.
+    op.drop_column("sync_runs", "retries")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "sync_runs", sa.Column("retries", sa.Integer(), nullable=False, server_default="0")
+    )
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from fastapi import Header, HTTPException, status
+
+from app.core.profiling import is_admin_token
+
+
+async def require_admin(x_admin_token: str | None = Header(default=None)) -> None:
+    """Reject requests without the configured ``ADMIN_TOKEN``."""
+
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin token required")
@@ -1,6 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from app.api.routes import events, weather, user_actions, images
+from app.api.deps import require_admin
+from app.api.routes import events, weather, user_actions, images, profiles, sync
 
 api_router = APIRouter()
 
@@ -8,3 +9,7 @@ api_router.include_router(events.router, prefix="/events", tags=["events"])
 api_router.include_router(weather.router, prefix="/weather", tags=["weather"])
 api_router.include_router(user_actions.router, prefix="/actions", tags=["user-actions"])
 api_router.include_router(images.router, prefix="/images", tags=["images"])
+api_router.include_router(sync.router, prefix="/sync", tags=["sync"], dependencies=[Depends(require_admin)])
+api_router.include_router(
+    profiles.router, prefix="/profiles", tags=["profiles"], dependencies=[Depends(require_admin)]
+)
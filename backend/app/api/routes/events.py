@@ -1,17 +1,30 @@
 from __future__ import annotations
 
 from datetime import date, datetime, time, timezone
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
 from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
+from app.api.deps import require_admin
+from app.core.profiling import is_admin_token, new_profile_name, sampling_profile
 from app.db.models.event import Event
+from app.db.models.event_relation import EventRelation
 from app.db.session import get_session
-from app.schemas.event import EventListResponse, EventLocation, EventRead, EventWithWeather
+from app.schemas.event import (
+    EventDetailRead,
+    EventListResponse,
+    EventLocation,
+    EventRead,
+    EventWithWeather,
+)
 from app.schemas.weather import WeatherRead
 from app.services.event_sync import EventSyncError, sync_events
+from app.services.content_similarity import content_index
 from app.services.integration import get_event_with_weather
+from app.services.recommendations import rebuild_event_relations
 
 router = APIRouter()
 
@@ -24,6 +37,8 @@ def _apply_event_filters(
     search: str | None,
     start_after: date | None,
     end_before: date | None,
+    price_min: int | None = None,
+    price_max: int | None = None,
 ) -> Select:
     if guname:
         statement = statement.where(Event.guname == guname)
@@ -40,9 +55,25 @@ def _apply_event_filters(
     if end_before:
         end_dt = datetime.combine(end_before, time.max, tzinfo=timezone.utc)
         statement = statement.where(Event.end_date <= end_dt)
+    if price_min is not None:
+        # Overlap semantics: a 5,000-50,000원 event matches price_min=10000.
+        statement = statement.where(func.coalesce(Event.max_price, Event.min_price) >= price_min)
+    if price_max is not None:
+        statement = statement.where(Event.min_price <= price_max)
     return statement
 
 
+EventSort = Literal["start_date", "price_asc", "price_desc"]
+
+
+def _apply_event_ordering(statement: Select, sort: EventSort) -> Select:
+    if sort == "price_asc":
+        return statement.order_by(Event.min_price.asc().nulls_last(), Event.id.asc())
+    if sort == "price_desc":
+        return statement.order_by(Event.max_price.desc().nulls_last(), Event.id.asc())
+    return statement.order_by(Event.start_date.asc().nulls_last(), Event.id.asc())
+
+
 @router.get("/", response_model=EventListResponse)
 async def list_events(
     *,
@@ -53,6 +84,9 @@ async def list_events(
     search: str | None = Query(default=None, description="행사명 텍스트 검색"),
     start_after: date | None = Query(default=None, description="이 날짜 이후 시작하는 행사"),
     end_before: date | None = Query(default=None, description="이 날짜 이전 종료하는 행사"),
+    price_min: int | None = Query(default=None, ge=0, description="가격 범위의 상한이 이 금액 이상인 행사 (원)"),
+    price_max: int | None = Query(default=None, ge=0, description="최저 가격이 이 금액 이하인 행사 (원, 0이면 무료)"),
+    sort: EventSort = Query(default="start_date", description="정렬 기준"),
     limit: int | None = Query(default=None),
     offset: int = Query(default=0, ge=0),
 ) -> EventListResponse:
@@ -60,7 +94,7 @@ async def list_events(
 
     base_statement: Select = select(Event)
     filtered_statement = _apply_event_filters(
-        base_statement, guname, codename, is_free, search, start_after, end_before
+        base_statement, guname, codename, is_free, search, start_after, end_before, price_min, price_max
     )
 
     count_statement: Select = _apply_event_filters(
@@ -71,11 +105,13 @@ async def list_events(
         search,
         start_after,
         end_before,
+        price_min,
+        price_max,
     )
     total_result = await session.execute(count_statement)
     total = total_result.scalar_one()
 
-    paginated_statement = filtered_statement.order_by(Event.start_date.asc().nulls_last(), Event.id.asc()).offset(offset)
+    paginated_statement = _apply_event_ordering(filtered_statement, sort).offset(offset)
     
     if limit is not None:
         paginated_statement = paginated_statement.limit(limit)
@@ -100,13 +136,15 @@ async def list_event_locations(
     search: str | None = Query(default=None, description="행사명 텍스트 검색"),
     start_after: date | None = Query(default=None, description="이 날짜 이후 시작하는 행사"),
     end_before: date | None = Query(default=None, description="이 날짜 이전 종료하는 행사"),
+    price_min: int | None = Query(default=None, ge=0, description="가격 범위의 상한이 이 금액 이상인 행사 (원)"),
+    price_max: int | None = Query(default=None, ge=0, description="최저 가격이 이 금액 이하인 행사 (원, 0이면 무료)"),
     limit: int = Query(default=1000, ge=1, le=5000),
 ) -> list[EventLocation]:
     """Return event coordinates for map rendering."""
 
     statement: Select[tuple[Event]] = select(Event)
     statement = _apply_event_filters(
-        statement, guname, codename, is_free, search, start_after, end_before
+        statement, guname, codename, is_free, search, start_after, end_before, price_min, price_max
     )
     statement = statement.where(Event.lat.isnot(None), Event.lot.isnot(None))
     statement = statement.order_by(Event.start_date.asc().nulls_last(), Event.id.asc())
@@ -117,19 +155,34 @@ async def list_event_locations(
     return [EventLocation.model_validate(event) for event in events]
 
 
-@router.get("/{event_id}", response_model=EventRead)
-async def get_event(*, session: AsyncSession = Depends(get_session), event_id: int) -> EventRead:
-    """Retrieve a single event by identifier."""
+@router.post(
+    "/related/rebuild", status_code=status.HTTP_202_ACCEPTED, dependencies=[Depends(require_admin)]
+)
+async def trigger_related_rebuild(*, session: AsyncSession = Depends(get_session)) -> dict[str, int | str]:
+    """Recompute the item-to-item related events table from recent user actions."""
+
+    result = await rebuild_event_relations(session)
+    return {"status": "rebuild-complete", **result}
+
+
+@router.get("/{event_id}", response_model=EventDetailRead)
+async def get_event(*, session: AsyncSession = Depends(get_session), event_id: int) -> EventDetailRead:
+    """Retrieve a single event, including its detail text, by identifier."""
 
-    event = await session.get(Event, event_id)
+    event = await session.get(Event, event_id, options=[joinedload(Event.details)])
     if not event:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
 
-    return EventRead.model_validate(event)
+    return EventDetailRead.model_validate(event)
 
 
 @router.post("/sync", status_code=status.HTTP_202_ACCEPTED)
-async def trigger_event_sync(*, session: AsyncSession = Depends(get_session)) -> dict[str, int | str]:
+async def trigger_event_sync(
+    *,
+    session: AsyncSession = Depends(get_session),
+    profile: bool = Query(default=False, description="CPU 프로파일 저장 (관리자 전용)"),
+    x_admin_token: str | None = Header(default=None),
+) -> dict[str, int | str]:
     """Trigger a background synchronization with the Seoul public API.
 
     This endpoint currently performs the fetch inline and returns the number of
@@ -137,8 +190,17 @@ async def trigger_event_sync(*, session: AsyncSession = Depends(get_session)) ->
     APScheduler) is introduced.
     """
 
+    if profile and not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin token required")
+
     try:
-        result = await sync_events(session)
+        if profile:
+            profile_name = new_profile_name("sync_events")
+            with sampling_profile(profile_name):
+                result = await sync_events(session)
+            result = {**result, "profile": profile_name}
+        else:
+            result = await sync_events(session)
     except EventSyncError as exc:
         raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
     return {"status": "sync-complete", **result}
@@ -157,4 +219,43 @@ async def read_event_with_weather(
         session, event_id=event_id, location_override=location
     )
     weather_payload = WeatherRead.model_validate(weather) if weather else None
-    return EventWithWeather(event=EventRead.model_validate(event), weather=weather_payload)
+    return EventWithWeather(event=EventDetailRead.model_validate(event), weather=weather_payload)
+
+
+@router.get("/{event_id}/related", response_model=list[EventRead])
+async def list_related_events(
+    *,
+    session: AsyncSession = Depends(get_session),
+    event_id: int,
+    limit: int = Query(default=10, ge=1, le=50),
+) -> list[EventRead]:
+    """Return events frequently interacted with alongside the given event."""
+
+    statement = (
+        select(Event)
+        .join(EventRelation, EventRelation.related_event_id == Event.id)
+        .where(EventRelation.event_id == event_id)
+        .order_by(EventRelation.rank.asc())
+        .limit(limit)
+    )
+    result = await session.execute(statement)
+    return [EventRead.model_validate(event) for event in result.scalars().all()]
+
+
+@router.get("/{event_id}/similar", response_model=list[EventRead])
+async def list_similar_events(
+    *,
+    session: AsyncSession = Depends(get_session),
+    event_id: int,
+    limit: int = Query(default=10, ge=1, le=50),
+) -> list[EventRead]:
+    """Return events whose text and categories most resemble the given event."""
+
+    matches = await content_index.similar(session, event_id, limit)
+    if not matches:
+        return []
+
+    ranked_ids = [match_id for match_id, _ in matches]
+    result = await session.execute(select(Event).where(Event.id.in_(ranked_ids)))
+    events_by_id = {event.id: event for event in result.scalars().all()}
+    return [EventRead.model_validate(events_by_id[match_id]) for match_id in ranked_ids if match_id in events_by_id]
@@ -1,54 +1,61 @@
+import asyncio
 import httpx
-import imghdr
 import logging
-from typing import Optional
+from collections.abc import AsyncIterator
+from typing import BinaryIO, Optional
+from urllib.parse import urlparse
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from fastapi.responses import StreamingResponse
 
+from app.core.metrics import record_upstream_error
+
+from app.services.image_proxy import (
+    ImageFetchError,
+    image_ttl,
+    is_allowed_domain,
+    is_not_modified,
+    open_image,
+    response_etag,
+)
+from app.services.image_transform import (
+    ImageFit,
+    ImageFormat,
+    ImageTransformError,
+    ImageTransformUnavailable,
+    ImageVariant,
+)
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-ALLOWED_DOMAINS = [
-    "culture.seoul.go.kr",
-    "data.seoul.go.kr", 
-    "www.seoul.go.kr",
-    "*.seoul.go.kr"
-]
+STREAM_CHUNK_SIZE = 64 * 1024
 
-def is_allowed_domain(url: str) -> bool:
-    """Check if the image URL domain is allowed"""
+
+async def _stream_file(body: BinaryIO) -> AsyncIterator[bytes]:
     try:
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        domain = parsed.hostname
-        
-        if not domain:
-            return False
-            
-        # Check exact matches and wildcard matches
-        for allowed in ALLOWED_DOMAINS:
-            if allowed.startswith("*."):
-                # Wildcard domain check
-                allowed_suffix = allowed[2:]  # Remove "*."
-                if domain.endswith(allowed_suffix):
-                    return True
-            elif domain == allowed:
-                return True
-                
-        return False
-    except Exception:
-        return False
+        while chunk := await asyncio.to_thread(body.read, STREAM_CHUNK_SIZE):
+            yield chunk
+    finally:
+        body.close()
+
 
 @router.get("/proxy")
 async def proxy_image(
+    request: Request,
     url: str = Query(..., description="Original image URL to proxy"),
-    timeout: Optional[int] = Query(10, description="Request timeout in seconds")
+    timeout: Optional[int] = Query(10, description="Request timeout in seconds"),
+    w: Optional[int] = Query(None, ge=16, le=2048, description="Maximum output width in pixels"),
+    h: Optional[int] = Query(None, ge=16, le=2048, description="Maximum output height in pixels"),
+    fit: ImageFit = Query("contain", description="contain keeps the whole image, cover crops to fill w x h"),
+    format: Optional[ImageFormat] = Query(None, description="Output format; defaults to the source format"),
 ):
     """
     Proxy external images to avoid CORS and connection issues.
     Only allows images from trusted Seoul government domains.
+    Responses are served from a local disk cache when possible, optionally
+    resized and transcoded, and conditional requests are answered with 304.
     """
     
     # Validate the URL domain
@@ -60,70 +67,33 @@ async def proxy_image(
         )
     
     try:
-        # Set headers to mimic a browser request
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Referer": "https://culture.seoul.go.kr/",
-            "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
-            "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1"
-        }
-        
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            logger.info(f"Proxying image request: {url}")
-            response = await client.get(url, headers=headers, follow_redirects=True)
-            
-            if response.status_code == 200:
-                raw_content = response.content
-                content_type = response.headers.get("content-type", "").lower()
-
-                if not content_type.startswith("image/"):
-                    detected_format = imghdr.what(None, raw_content)
-                    if detected_format:
-                        content_type = f"image/{detected_format}"
-                        logger.debug(
-                            "Adjusted content-type for proxied image", 
-                            extra={"url": url, "detected_format": detected_format}
-                        )
-                    else:
-                        logger.warning(
-                            "Non-image content returned from proxy source",
-                            extra={"url": url, "content_type": content_type or "<missing>"}
-                        )
-                        raise HTTPException(
-                            status_code=400,
-                            detail="URL does not return image content"
-                        )
-
-                headers_to_forward = {
-                    "Cache-Control": "public, max-age=3600",
-                    "Access-Control-Allow-Origin": "*",
-                }
-                content_length = response.headers.get("content-length")
-                if content_length is not None:
-                    headers_to_forward["Content-Length"] = content_length
-
-                return StreamingResponse(
-                    iter([raw_content]),
-                    media_type=content_type or "image/jpeg",
-                    headers=headers_to_forward,
-                )
-            else:
-                logger.error(f"Failed to fetch image: {url} - Status: {response.status_code}")
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Failed to fetch image: HTTP {response.status_code}"
-                )
-                
+        cached, body = await open_image(url, ImageVariant(w, h, fit, format), timeout)
+    except ImageFetchError as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=e.detail
+        )
+    except ImageTransformError as e:
+        logger.warning(f"Could not transform image {url}: {str(e)}")
+        raise HTTPException(
+            status_code=422,
+            detail="Image could not be resized or converted"
+        )
+    except ImageTransformUnavailable as e:
+        logger.error(f"Image transform unavailable for {url}: {str(e)}")
+        raise HTTPException(
+            status_code=503,
+            detail="Image processing temporarily unavailable"
+        )
     except httpx.TimeoutException:
+        record_upstream_error(urlparse(url).hostname or "unknown")
         logger.error(f"Timeout while fetching image: {url}")
         raise HTTPException(
             status_code=408,
             detail="Timeout while fetching image"
         )
     except httpx.RequestError as e:
+        record_upstream_error(urlparse(url).hostname or "unknown")
         logger.error(f"Request error while fetching image {url}: {str(e)}")
         raise HTTPException(
             status_code=502,
@@ -135,3 +105,23 @@ async def proxy_image(
             status_code=500,
             detail="Internal server error while processing image"
         )
+
+    etag = response_etag(cached)
+    headers_to_forward = {
+        "Cache-Control": f"public, max-age={int(image_ttl(url))}",
+        "Access-Control-Allow-Origin": "*",
+        "ETag": etag,
+    }
+    if cached.last_modified:
+        headers_to_forward["Last-Modified"] = cached.last_modified
+
+    if is_not_modified(request.headers, etag, cached.last_modified):
+        body.close()
+        return Response(status_code=304, headers=headers_to_forward)
+
+    headers_to_forward["Content-Length"] = str(cached.size)
+    return StreamingResponse(
+        _stream_file(body),
+        media_type=cached.content_type,
+        headers=headers_to_forward,
+    )
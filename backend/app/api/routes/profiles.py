@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import FileResponse
+
+from app.core.profiling import list_profiles, resolve_profile
+
+router = APIRouter()
+
+
+@router.get("")
+async def read_profiles() -> list[dict[str, object]]:
+    """List stored CPU profiles, newest first."""
+
+    return [profile._asdict() for profile in list_profiles()]
+
+
+@router.get("/{name}")
+async def download_profile(name: str) -> FileResponse:
+    """Download a collapsed-stack profile (flamegraph.pl / speedscope input)."""
+
+    path = resolve_profile(name)
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return FileResponse(path, media_type="text/plain; charset=utf-8", filename=name)
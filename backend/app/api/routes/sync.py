@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_session
+from app.schemas.sync_run import SyncRunRead
+from app.services.sync_ledger import list_sync_runs
+
+router = APIRouter()
+
+
+@router.get("/runs", response_model=list[SyncRunRead])
+async def read_sync_runs(
+    *,
+    session: AsyncSession = Depends(get_session),
+    kind: Literal["events", "weather"] | None = Query(default=None, description="동기화 종류"),
+    limit: int = Query(default=50, ge=1, le=500, description="최근 실행 개수"),
+) -> list[SyncRunRead]:
+    """Return recent sync runs, newest first, with per-stage timings."""
+
+    runs = await list_sync_runs(session, kind=kind, limit=limit)
+    return [SyncRunRead.model_validate(run) for run in runs]
@@ -1,67 +1,170 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from typing import Any
 
-from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.user_action import UserAction
+from app.core.config import get_settings
 from app.db.session import get_session
-from app.schemas.user_action import UserActionCreate, UserActionRead
+from app.schemas.user_action import UserActionBatchAccepted, UserActionCreate, UserActionRead
+from app.services.action_buffer import (
+    ActionBufferFull,
+    defer_action_aggregates,
+    get_action_buffer,
+    insert_actions,
+)
+from app.services.action_dedup import get_action_deduplicator
+from app.services.engagement import Granularity, TimeseriesRangeError, engagement_timeseries
+from app.services.popularity import PopularityWindow, get_popular_targets
+from app.services.visitor_sketches import estimate_unique_visitors
 
 router = APIRouter()
 
+MAX_BATCH_SIZE = 1000
 
-@router.post("/", response_model=UserActionRead, status_code=status.HTTP_201_CREATED)
-async def create_action(
-    *, session: AsyncSession = Depends(get_session), payload: UserActionCreate
-) -> UserActionRead:
-    """Persist a user action for analytics purposes."""
 
+def _action_row(payload: UserActionCreate) -> dict[str, Any]:
     data = payload.model_dump()
     if data.get("timestamp") is None:
         data["timestamp"] = datetime.now(timezone.utc)
+    data["metadata_json"] = data.pop("metadata", None)
+    return data
+
+
+@router.post(
+    "/",
+    response_model=UserActionRead,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_204_NO_CONTENT: {"description": "Duplicate action suppressed"}},
+)
+async def create_action(
+    *, session: AsyncSession = Depends(get_session), payload: UserActionCreate
+) -> UserActionRead | Response:
+    """Persist a user action for analytics purposes.
+
+    Repeats of the same view within the dedup window are dropped and
+    answered with 204 instead of being stored. Only the raw row is written
+    here; counters and visitor sketches are updated by the aggregate buffer.
+    """
 
-    metadata_payload = data.pop("metadata", None)
+    row = _action_row(payload)
+    deduplicator = get_action_deduplicator()
+    if not deduplicator.admit(row):
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
 
-    action = UserAction(metadata_json=metadata_payload, **data)
-    session.add(action)
-    await session.commit()
-    await session.refresh(action)
+    try:
+        (action_id,) = await insert_actions(session, [row])
+        await session.commit()
+    except BaseException:
+        deduplicator.release([row])
+        raise
+    await defer_action_aggregates(session, [row])
 
     return UserActionRead.model_validate(
         {
-            "id": action.id,
-            "user_id": action.user_id,
-            "action_type": action.action_type,
-            "target_id": action.target_id,
-            "timestamp": action.timestamp,
-            "metadata": action.metadata_json,
+            "id": action_id,
+            "user_id": row["user_id"],
+            "action_type": row["action_type"],
+            "target_id": row["target_id"],
+            "timestamp": row["timestamp"],
+            "metadata": row["metadata_json"],
         }
     )
 
 
+@router.post("/batch", response_model=UserActionBatchAccepted, status_code=status.HTTP_202_ACCEPTED)
+async def create_actions_batch(
+    *,
+    payload: list[UserActionCreate] = Body(..., max_length=MAX_BATCH_SIZE),
+) -> UserActionBatchAccepted:
+    """Queue several user actions for buffered, batched persistence."""
+
+    candidates = [_action_row(item) for item in payload]
+    deduplicator = get_action_deduplicator()
+    rows = deduplicator.filter(candidates)
+    try:
+        await get_action_buffer().submit(rows, timeout=get_settings().action_buffer_enqueue_timeout)
+    except BaseException as exc:
+        # Nothing was queued, so the client's retry must not be suppressed.
+        deduplicator.release(rows)
+        if not isinstance(exc, ActionBufferFull):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+            headers={"Retry-After": "1"},
+        ) from exc
+    return UserActionBatchAccepted(accepted=len(rows), suppressed=len(candidates) - len(rows))
+
+
 @router.get("/popular")
 async def read_popular(
     *,
     session: AsyncSession = Depends(get_session),
     limit: int = Query(default=10, ge=1, le=50),
     action_type: str = Query(default="view", description="Count actions of this type only"),
-) -> list[dict[str, int | None]]:
-    """Return the most interacted-with targets based on user actions."""
-
-    statement = (
-        select(UserAction.target_id, func.count(UserAction.id).label("hits"))
-        .where(UserAction.action_type == action_type, UserAction.target_id.isnot(None))
-        .group_by(UserAction.target_id)
-        .order_by(func.count(UserAction.id).desc())
-        .limit(limit)
+    window: PopularityWindow = Query(default="all", description="집계 기간 (1h, 24h, 7d, all)"),
+    half_life_hours: float | None = Query(
+        default=None, gt=0, description="지정 시 이 반감기(시간)로 오래된 행동의 가중치를 감쇠"
+    ),
+) -> list[dict[str, int | float | None]]:
+    """Return the most interacted-with targets from the hourly action counters."""
+
+    return await get_popular_targets(
+        session,
+        action_type=action_type,
+        window=window,
+        limit=limit,
+        half_life_hours=half_life_hours,
     )
 
-    result = await session.execute(statement)
-    rows = result.all()
-    return [
-        {"target_id": row.target_id, "action_count": int(row.hits)}  # type: ignore[misc]
-        for row in rows
-    ]
+
+@router.get("/unique-visitors")
+async def read_unique_visitors(
+    *,
+    session: AsyncSession = Depends(get_session),
+    event_id: list[int] = Query(default=[], description="대상 행사 ID (여러 개 지정 가능)"),
+    guname: str | None = Query(default=None, description="대상 자치구"),
+    date_from: date = Query(..., alias="from", description="집계 시작일 (KST)"),
+    date_to: date = Query(..., alias="to", description="집계 종료일 (KST)"),
+) -> dict[str, int]:
+    """Estimate distinct viewers across events and days using HyperLogLog sketches."""
+
+    if date_to < date_from:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="'to' must not precede 'from'")
+
+    return await estimate_unique_visitors(
+        session, event_ids=event_id, guname=guname, date_from=date_from, date_to=date_to
+    )
+
+
+@router.get("/timeseries")
+async def read_timeseries(
+    *,
+    session: AsyncSession = Depends(get_session),
+    target_id: int | None = Query(default=None, description="대상 행사 ID"),
+    guname: str | None = Query(default=None, description="대상 자치구"),
+    action_type: str = Query(default="view", description="Count actions of this type only"),
+    start: datetime = Query(..., alias="from", description="조회 시작 시각"),
+    end: datetime = Query(..., alias="to", description="조회 종료 시각 (미포함)"),
+    granularity: Granularity = Query(default="hour", description="집계 단위 (hour, day, week)"),
+) -> list[dict[str, datetime | int]]:
+    """Return action counts over time, answered from the hourly rollups."""
+
+    if end <= start:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="'to' must be after 'from'")
+
+    try:
+        return await engagement_timeseries(
+            session,
+            action_type=action_type,
+            start=start,
+            end=end,
+            granularity=granularity,
+            target_id=target_id,
+            guname=guname,
+        )
+    except TimeseriesRangeError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
@@ -1,5 +1,7 @@
 from functools import lru_cache
 import json
+import os
+import tempfile
 from typing import Annotated
 
 from pydantic import Field, field_validator
@@ -40,6 +42,58 @@ class Settings(BaseSettings):
     kma_default_nx: int = Field(default=60, alias="KMA_DEFAULT_NX")
     kma_default_ny: int = Field(default=127, alias="KMA_DEFAULT_NY")
 
+    action_buffer_max_pending: int = Field(default=10000, alias="ACTION_BUFFER_MAX_PENDING")
+    action_buffer_batch_size: int = Field(default=500, alias="ACTION_BUFFER_BATCH_SIZE")
+    action_buffer_flush_interval: float = Field(default=1.0, alias="ACTION_BUFFER_FLUSH_INTERVAL")
+    action_buffer_enqueue_timeout: float = Field(default=2.0, alias="ACTION_BUFFER_ENQUEUE_TIMEOUT")
+
+    action_dedup_window_seconds: float = Field(default=30.0, alias="ACTION_DEDUP_WINDOW_SECONDS")
+    action_dedup_max_entries: int = Field(default=100000, alias="ACTION_DEDUP_MAX_ENTRIES")
+
+    user_actions_partitions_ahead: int = Field(default=3, alias="USER_ACTIONS_PARTITIONS_AHEAD")
+    user_actions_retention_months: int | None = Field(default=None, alias="USER_ACTIONS_RETENTION_MONTHS")
+    partition_maintenance_interval_hours: float = Field(
+        default=6.0, alias="PARTITION_MAINTENANCE_INTERVAL_HOURS"
+    )
+
+    related_events_top_n: int = Field(default=20, alias="RELATED_EVENTS_TOP_N")
+    related_events_lookback_days: int = Field(default=90, alias="RELATED_EVENTS_LOOKBACK_DAYS")
+
+    image_cache_dir: str = Field(
+        default=os.path.join(tempfile.gettempdir(), "seoulnow-image-cache"),
+        alias="IMAGE_CACHE_DIR",
+    )
+    image_proxy_max_bytes: int = Field(default=20 * 1024 * 1024, alias="IMAGE_PROXY_MAX_BYTES")
+    image_cache_max_bytes: int = Field(default=512 * 1024 * 1024, alias="IMAGE_CACHE_MAX_BYTES")
+    image_cache_ttl_seconds: float = Field(default=86400.0, alias="IMAGE_CACHE_TTL_SECONDS")
+    image_cache_domain_ttls: dict[str, float] = Field(default_factory=dict, alias="IMAGE_CACHE_DOMAIN_TTLS")
+    image_cache_stale_seconds: float = Field(default=7 * 86400.0, alias="IMAGE_CACHE_STALE_SECONDS")
+
+    image_transform_workers: int = Field(default=2, alias="IMAGE_TRANSFORM_WORKERS")
+    image_transform_max_pending: int = Field(default=16, alias="IMAGE_TRANSFORM_MAX_PENDING")
+
+    image_warm_after_sync: bool = Field(default=False, alias="IMAGE_WARM_AFTER_SYNC")
+    image_warm_concurrency: int = Field(default=2, alias="IMAGE_WARM_CONCURRENCY")
+    image_warm_bytes_per_second: float = Field(default=2 * 1024 * 1024, alias="IMAGE_WARM_BYTES_PER_SECOND")
+
+    sql_profiling_enabled: bool = Field(default=False, alias="SQL_PROFILING_ENABLED")
+    sql_slow_query_ms: float = Field(default=100.0, alias="SQL_SLOW_QUERY_MS")
+    sql_n_plus_one_threshold: int = Field(default=5, alias="SQL_N_PLUS_ONE_THRESHOLD")
+
+    admin_token: str | None = Field(default=None, alias="ADMIN_TOKEN")
+    profile_dir: str = Field(
+        default=os.path.join(tempfile.gettempdir(), "seoulnow-profiles"),
+        alias="PROFILE_DIR",
+    )
+    profile_sample_interval_ms: float = Field(default=5.0, alias="PROFILE_SAMPLE_INTERVAL_MS")
+    profile_max_files: int = Field(default=50, alias="PROFILE_MAX_FILES")
+
+    loop_lag_sample_interval: float = Field(default=0.5, alias="LOOP_LAG_SAMPLE_INTERVAL")
+    loop_blocking_threshold_ms: float | None = Field(default=None, alias="LOOP_BLOCKING_THRESHOLD_MS")
+
+    trace_export_path: str | None = Field(default=None, alias="TRACE_EXPORT_PATH")
+    trace_sample_rate: float = Field(default=0.1, alias="TRACE_SAMPLE_RATE")
+
     external_api_verify_ssl: bool = Field(default=True, alias="EXTERNAL_API_VERIFY_SSL")
     cors_origins: Annotated[str | list[str], Field(alias="CORS_ORIGINS", default="http://localhost:3000")]
 
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+
+from app.core.metrics import EVENT_LOOP_BLOCKED, EVENT_LOOP_LAG
+
+logger = logging.getLogger(__name__)
+
+
+class LoopMonitor:
+    """Measure event loop lag and optionally report what is blocking it.
+
+    A coroutine sleeps for ``interval`` and records how late it wakes up.
+    With ``blocking_threshold`` set, a watchdog thread also watches that
+    coroutine's heartbeat; when the loop has not run it for longer than the
+    threshold, the loop thread's current stack is logged once per stall,
+    pointing at the synchronous code holding the loop.
+    """
+
+    def __init__(self, *, interval: float, blocking_threshold: float | None) -> None:
+        self._blocking_threshold = blocking_threshold
+        # The heartbeat must tick faster than the threshold to avoid false alarms.
+        self._interval = min(interval, blocking_threshold / 2) if blocking_threshold else interval
+        self._heartbeat = time.perf_counter()
+        self._loop_thread_id: int | None = None
+        self._stop = threading.Event()
+
+    async def run(self) -> None:
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.perf_counter()
+        watchdog: threading.Thread | None = None
+        if self._blocking_threshold:
+            watchdog = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+            watchdog.start()
+        try:
+            while True:
+                expected = time.perf_counter() + self._interval
+                await asyncio.sleep(self._interval)
+                now = time.perf_counter()
+                EVENT_LOOP_LAG.observe(max(now - expected, 0.0))
+                self._heartbeat = now
+        finally:
+            self._stop.set()
+            if watchdog is not None:
+                watchdog.join()
+
+    def _watch(self) -> None:
+        assert self._blocking_threshold is not None
+        reported_heartbeat = None
+        while not self._stop.wait(self._blocking_threshold / 4):
+            heartbeat = self._heartbeat
+            stalled = time.perf_counter() - heartbeat - self._interval
+            if stalled < self._blocking_threshold or heartbeat == reported_heartbeat:
+                continue
+            reported_heartbeat = heartbeat
+            EVENT_LOOP_BLOCKED.inc()
+            frame = sys._current_frames().get(self._loop_thread_id or 0)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else "<unavailable>\n"
+            logger.warning(
+                "Event loop blocked for more than %.0f ms; loop thread stack:\n%s",
+                stalled * 1000,
+                stack,
+            )
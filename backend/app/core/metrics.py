@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+from urllib.parse import urlparse
+
+import httpx
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.tracing import inject_traceparent
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling HTTP requests.",
+    ("method", "route", "status"),
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "Size of HTTP response bodies.",
+    ("method", "route"),
+    buckets=SIZE_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being handled.",
+    ("method",),
+)
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent obtaining a connection from the SQLAlchemy pool, including new connections.",
+    buckets=DB_BUCKETS,
+)
+DB_POOL_CHECKED_OUT = Gauge("db_pool_connections_checked_out", "Connections currently checked out.")
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Time spent executing SQL statements, by statement verb.",
+    ("operation",),
+    buckets=DB_BUCKETS,
+)
+
+UPSTREAM_REQUEST_DURATION = Histogram(
+    "upstream_request_duration_seconds",
+    "Time until response headers from upstream HTTP APIs.",
+    ("upstream", "status"),
+    buckets=LATENCY_BUCKETS,
+)
+UPSTREAM_REQUEST_ERRORS = Counter(
+    "upstream_request_errors_total",
+    "Upstream HTTP requests that failed without a response.",
+    ("upstream",),
+)
+
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop runs a timer callback.",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+EVENT_LOOP_BLOCKED = Counter(
+    "event_loop_blocked_total",
+    "Stalls longer than the blocking threshold seen by the loop watchdog.",
+)
+
+ACTION_BUFFER_PENDING = Gauge(
+    "action_buffer_pending", "Rows waiting in the action write buffers (actions, aggregates).", ("buffer",)
+)
+ACTION_BUFFER_DROPPED = Counter(
+    "action_buffer_dropped_rows",
+    "Buffered rows that could not be written, by reason (rejected row or database unavailable).",
+    ("buffer", "reason"),
+)
+ACTION_DEDUP_DECISIONS = Counter(
+    "action_dedup_decisions", "Actions admitted or suppressed by the deduplicator.", ("decision",)
+)
+IMAGE_CACHE_BYTES = Gauge("image_cache_bytes", "Bytes stored in the image disk cache.")
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording latency, size and in-flight requests.
+
+    Routes are labelled with their path template (``/api/events/{event_id}``)
+    so label cardinality stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_progress.dec()
+            route = scope.get("route")
+            template = getattr(route, "path_format", None) or "<unmatched>"
+            HTTP_REQUEST_DURATION.labels(method, template, str(status_code)).observe(elapsed)
+            HTTP_RESPONSE_SIZE.labels(method, template).observe(response_size)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait for a free connection."""
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Record statement timings and checked-out connections for ``engine``."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+        DB_QUERY_DURATION.labels(operation).observe(elapsed)
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(context) -> None:
+        if context.connection is not None and context.connection.info.get("query_start"):
+            context.connection.info["query_start"].pop()
+
+    @event.listens_for(engine.pool, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        DB_POOL_CHECKED_OUT.inc()
+
+    @event.listens_for(engine.pool, "checkin")
+    def _checkin(dbapi_connection, connection_record) -> None:
+        DB_POOL_CHECKED_OUT.dec()
+
+
+def upstream_event_hooks(upstream: str | None = None) -> dict[str, list[Any]]:
+    """httpx ``event_hooks`` timing requests per upstream.
+
+    Without an explicit name the request host is used as the label, which
+    suits the small, allow-listed set of image hosts. The current trace is
+    propagated to the upstream as a ``traceparent`` header.
+    """
+
+    async def on_request(request: httpx.Request) -> None:
+        request.extensions["metrics_start"] = time.perf_counter()
+
+    async def on_response(response: httpx.Response) -> None:
+        start = response.request.extensions.get("metrics_start")
+        if start is None:
+            return
+        label = upstream or urlparse(str(response.request.url)).hostname or "unknown"
+        UPSTREAM_REQUEST_DURATION.labels(label, str(response.status_code)).observe(time.perf_counter() - start)
+
+    return {"request": [on_request, inject_traceparent], "response": [on_response]}
+
+
+def record_upstream_error(upstream: str) -> None:
+    UPSTREAM_REQUEST_ERRORS.labels(upstream).inc()
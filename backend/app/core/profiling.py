@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import hmac
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from types import FrameType
+from typing import NamedTuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_SUFFIX = ".collapsed"
+MAX_STACK_DEPTH = 128
+_UNSAFE_LABEL = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+class ProfileInfo(NamedTuple):
+    name: str
+    size: int
+    created_at: datetime
+
+
+class SamplingProfiler:
+    """Periodically sample one thread's Python stack from a helper thread.
+
+    Samples are aggregated as collapsed stacks (``outer;inner count``), the
+    input format of flamegraph.pl and speedscope. Only the target thread is
+    sampled, so work offloaded with ``asyncio.to_thread`` is not included,
+    and on the event loop thread concurrent requests share the samples.
+    ``on_stop`` receives the stacks on the helper thread once sampling ends,
+    so saving them never blocks the sampled thread.
+    """
+
+    def __init__(
+        self, thread_id: int, *, interval: float, on_stop: Callable[[Counter[str]], None] | None = None
+    ) -> None:
+        self._thread_id = thread_id
+        self._interval = interval
+        self._on_stop = on_stop
+        self._stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is not None:
+                self._stacks[_collapse(frame)] += 1
+        if self._on_stop is not None:
+            self._on_stop(self._stacks)
+
+
+def _collapse(frame: FrameType | None) -> str:
+    names: list[str] = []
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+def profile_dir() -> Path:
+    return Path(get_settings().profile_dir)
+
+
+def new_profile_name(label: str) -> str:
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    return f"{stamp}-{_UNSAFE_LABEL.sub('_', label).strip('_')[:80]}{PROFILE_SUFFIX}"
+
+
+@contextmanager
+def sampling_profile(name: str) -> Iterator[None]:
+    """Sample the current thread while the block runs and save the result as ``name``.
+
+    The profile is written by the profiler thread shortly after the block
+    exits, keeping file IO off the event loop.
+    """
+
+    settings = get_settings()
+    started = time.perf_counter()
+
+    def save(stacks: Counter[str]) -> None:
+        elapsed = time.perf_counter() - started
+        try:
+            _save(name, stacks)
+        except OSError:
+            logger.exception("Could not save profile %s", name)
+        else:
+            logger.info("Saved profile %s (%d samples over %.2fs)", name, sum(stacks.values()), elapsed)
+
+    profiler = SamplingProfiler(
+        threading.get_ident(), interval=settings.profile_sample_interval_ms / 1000, on_stop=save
+    )
+    profiler.start()
+    try:
+        yield
+    finally:
+        profiler.stop()
+
+
+def _save(name: str, stacks: Counter[str]) -> None:
+    directory = profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    lines = (f"{stack} {count}\n" for stack, count in stacks.most_common())
+    (directory / name).write_text("".join(lines), encoding="utf-8")
+
+    keep = get_settings().profile_max_files
+    profiles = sorted(directory.glob(f"*{PROFILE_SUFFIX}"))
+    for old in profiles[: max(len(profiles) - keep, 0)]:
+        old.unlink(missing_ok=True)
+
+
+def list_profiles() -> list[ProfileInfo]:
+    directory = profile_dir()
+    if not directory.is_dir():
+        return []
+    profiles = []
+    for path in sorted(directory.glob(f"*{PROFILE_SUFFIX}"), reverse=True):
+        stat = path.stat()
+        profiles.append(
+            ProfileInfo(path.name, stat.st_size, datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc))
+        )
+    return profiles
+
+
+def resolve_profile(name: str) -> Path | None:
+    """Return the path of a stored profile, rejecting anything outside the directory."""
+
+    if "/" in name or "\\" in name or not name.endswith(PROFILE_SUFFIX):
+        return None
+    path = profile_dir() / name
+    return path if path.is_file() else None
+
+
+def is_admin_token(token: str | None) -> bool:
+    expected = get_settings().admin_token
+    if not expected or token is None:
+        return False
+    return hmac.compare_digest(token.encode(), expected.encode())
+
+
+class ProfilingMiddleware:
+    """Profile single requests sent with ``X-Profile: 1`` and a valid admin token.
+
+    The stored profile's name is returned in the ``X-Profile-Id`` header.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        if headers.get("x-profile") != "1" or not is_admin_token(headers.get("x-admin-token")):
+            await self.app(scope, receive, send)
+            return
+
+        name = new_profile_name(f"{scope['method']}-{scope['path']}")
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Profile-Id", name)
+            await send(message)
+
+        with sampling_profile(name):
+            await self.app(scope, receive, send_wrapper)
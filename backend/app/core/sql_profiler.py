@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|\?")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+
+MAX_SLOW_PARAMETERS_LENGTH = 500
+
+
+def statement_shape(statement: str) -> str:
+    """Normalise a statement so calls differing only in bound values compare equal."""
+
+    shape = _PLACEHOLDER.sub("?", statement)
+    return " ".join(_PLACEHOLDER_LIST.sub("?", shape).split())
+
+
+class QueryProfile:
+    """SQL statements executed while handling one request."""
+
+    __slots__ = ("count", "duration", "shapes", "slow", "_starts")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: Counter[str] = Counter()
+        self.slow: list[tuple[float, str, Any]] = []
+        self._starts: list[float] = []
+
+    def repeated_shapes(self, threshold: int) -> list[tuple[str, int]]:
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+
+_current_profile: ContextVar[QueryProfile | None] = ContextVar("sql_query_profile", default=None)
+
+
+def instrument_query_profiling(engine: Engine, *, slow_query_seconds: float) -> None:
+    """Attribute statements on ``engine`` to the active request's profile."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        profile = _current_profile.get()
+        if profile is not None:
+            profile._starts.append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        profile = _current_profile.get()
+        if profile is None or not profile._starts:
+            return
+        elapsed = time.perf_counter() - profile._starts.pop()
+        profile.count += 1
+        profile.duration += elapsed
+        profile.shapes[statement_shape(statement)] += 1
+        if elapsed >= slow_query_seconds:
+            profile.slow.append((elapsed, statement, parameters))
+
+
+class SqlProfilingMiddleware:
+    """Profile the SQL issued by each request.
+
+    Adds ``Server-Timing`` and ``X-Query-Count`` response headers, logs
+    statements slower than the configured threshold with their parameters,
+    and warns when one statement shape repeats often enough within a request
+    to suggest an N+1 pattern.
+    """
+
+    def __init__(self, app: ASGIApp, *, n_plus_one_threshold: int) -> None:
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = QueryProfile()
+        token = _current_profile.set(profile)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Query-Count", str(profile.count))
+                headers.append(
+                    "Server-Timing", f'db;dur={profile.duration * 1000:.1f};desc="{profile.count} queries"'
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_profile.reset(token)
+            self._report(scope, profile)
+
+    def _report(self, scope: Scope, profile: QueryProfile) -> None:
+        request_line = f"{scope['method']} {scope['path']}"
+        for elapsed, statement, parameters in profile.slow:
+            logger.warning(
+                "Slow SQL (%.1f ms) during %s: %s | parameters=%s",
+                elapsed * 1000,
+                request_line,
+                " ".join(statement.split()),
+                repr(parameters)[:MAX_SLOW_PARAMETERS_LENGTH],
+            )
+        for shape, count in profile.repeated_shapes(self.n_plus_one_threshold):
+            logger.warning("Possible N+1: %d executions during %s of: %s", count, request_line, shape)
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import logging
+import queue
+import random
+import re
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar
+
+import httpx
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# W3C Trace Context: version-traceid-parentid-flags
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+# Upstream URLs carry credentials (the Seoul API key is a path segment, the
+# KMA key a query parameter), so only the scheme and host are kept.
+_URL = re.compile(r"(https?://[^/\s?#'\"]+)[^\s'\"]*")
+
+
+def describe_error(exc: BaseException) -> str:
+    """Summarise ``exc`` for spans, the sync ledger or API responses without upstream URLs."""
+
+    if isinstance(exc, httpx.HTTPStatusError):
+        return f"{type(exc).__name__}: HTTP {exc.response.status_code}"
+    message = _URL.sub(r"\1", str(exc))
+    return f"{type(exc).__name__}: {message}"
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "kind", "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(self, trace_id: str, parent_id: str | None, name: str, kind: str) -> None:
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes: dict[str, Any] = {}
+        self.error: str | None = None
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def to_json(self) -> str:
+        """Serialise in the shape of an OTLP/JSON span."""
+
+        return json.dumps(
+            {
+                "traceId": self.trace_id,
+                "spanId": self.span_id,
+                "parentSpanId": self.parent_id or "",
+                "name": self.name,
+                "kind": self.kind,
+                "startTimeUnixNano": self.start_ns,
+                "endTimeUnixNano": self.end_ns,
+                "attributes": self.attributes,
+                "status": {"code": "ERROR", "message": self.error} if self.error else {"code": "OK"},
+            },
+            ensure_ascii=False,
+            default=str,
+        )
+
+
+class _Unsampled:
+    """Marks a trace whose root decided not to record, so children skip it too.
+
+    Keeps the trace context so it can still be propagated, flagged unsampled.
+    """
+
+    __slots__ = ("trace_id", "parent_id")
+
+    def __init__(self, trace_id: str, parent_id: str) -> None:
+        self.trace_id = trace_id
+        self.parent_id = parent_id
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.parent_id}-00"
+
+
+_current_span: ContextVar[Span | _Unsampled | None] = ContextVar("current_span", default=None)
+
+
+class JsonlSpanExporter:
+    """Append finished spans to a JSON Lines file from a background thread."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._queue: queue.SimpleQueue[Span | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def export(self, span: Span) -> None:
+        self._queue.put(span)
+
+    def shutdown(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._path.open("a", encoding="utf-8") as output:
+            while True:
+                span = self._queue.get()
+                if span is None:
+                    return
+                lines = [span.to_json()]
+                # Drain whatever else is queued before touching the file.
+                while True:
+                    try:
+                        span = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if span is None:
+                        output.write("\n".join(lines) + "\n")
+                        return
+                    lines.append(span.to_json())
+                output.write("\n".join(lines) + "\n")
+                output.flush()
+
+
+@lru_cache(maxsize=1)
+def get_span_exporter() -> JsonlSpanExporter | None:
+    settings = get_settings()
+    if not settings.trace_export_path:
+        return None
+    return JsonlSpanExporter(Path(settings.trace_export_path))
+
+
+def current_span() -> Span | None:
+    span = _current_span.get()
+    return span if isinstance(span, Span) else None
+
+
+@contextmanager
+def start_span(
+    name: str, *, kind: str = "internal", traceparent: str | None = None, **attributes: Any
+) -> Iterator[Span | None]:
+    """Record ``name`` as a child of the current span.
+
+    Without a current trace a new one is started, subject to
+    ``TRACE_SAMPLE_RATE``; an incoming ``traceparent`` is continued if it is
+    marked as sampled. A trace that is not sampled stays unsampled for
+    everything nested in it. Yields ``None`` when the operation is not traced.
+    """
+
+    parent = _current_span.get()
+    exporter = get_span_exporter()
+    if exporter is None or isinstance(parent, _Unsampled):
+        yield None
+        return
+
+    if parent is not None:
+        span = Span(parent.trace_id, parent.span_id, name, kind)
+    else:
+        match = _TRACEPARENT.match(traceparent or "")
+        if match is not None and int(match.group(3), 16) & 0x01:
+            span = Span(match.group(1), match.group(2), name, kind)
+        elif match is None and random.random() < get_settings().trace_sample_rate:
+            span = Span(f"{random.getrandbits(128):032x}", None, name, kind)
+        else:
+            if match is not None:
+                unsampled = _Unsampled(match.group(1), match.group(2))
+            else:
+                unsampled = _Unsampled(f"{random.getrandbits(128):032x}", f"{random.getrandbits(64):016x}")
+            token = _current_span.set(unsampled)
+            try:
+                yield None
+            finally:
+                _current_span.reset(token)
+            return
+
+    span.attributes.update(attributes)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as exc:
+        span.error = describe_error(exc)
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end_ns = time.time_ns()
+        exporter.export(span)
+
+
+def traced(name: str) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Decorate a coroutine function so each call is recorded as a span."""
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not isinstance(_current_span.get(), Span):
+                return await func(*args, **kwargs)
+            with start_span(name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+async def inject_traceparent(request: httpx.Request) -> None:
+    """httpx request hook propagating the current trace to upstream calls.
+
+    Unsampled traces are propagated too, so upstreams do not sample them.
+    """
+
+    span = _current_span.get()
+    if span is not None:
+        request.headers["traceparent"] = span.traceparent
+
+
+class TracingMiddleware:
+    """Open a server span per request, continuing an incoming ``traceparent``.
+
+    The trace id is echoed in the ``X-Trace-Id`` response header.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = Headers(scope=scope).get("traceparent")
+        with start_span(
+            f"{scope['method']} {scope['path']}",
+            kind="server",
+            traceparent=traceparent,
+            **{"http.method": scope["method"], "http.target": scope["path"]},
+        ) as span:
+            if span is None:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set(**{"http.status_code": message["status"]})
+                    MutableHeaders(scope=message).append("X-Trace-Id", span.trace_id)
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                template = getattr(route, "path_format", None)
+                if template:
+                    span.name = f"{scope['method']} {template}"
+                    span.set(**{"http.route": template})
@@ -1,6 +1,11 @@
 """Model package for SQLAlchemy tables."""
 
+from .action_counter import ActionCounter  # noqa: F401
 from .event import Event  # noqa: F401
+from .event_detail import EventDetail  # noqa: F401
+from .event_relation import EventRelation  # noqa: F401
+from .event_visitor_sketch import EventVisitorSketch  # noqa: F401
+from .sync_run import SyncRun  # noqa: F401
 from .user import User  # noqa: F401
 from .user_action import UserAction  # noqa: F401
 from .weather import Weather  # noqa: F401
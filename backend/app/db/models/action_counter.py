@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ActionCounter(Base):
+    """Hourly action counts per target, maintained as actions are ingested.
+
+    Serves both popularity rankings (primary key order) and per-event
+    engagement time series (``target_id``-first index).
+    """
+
+    __tablename__ = "action_counters"
+    __table_args__ = (
+        Index("ix_action_counters_target_type_bucket", "target_id", "action_type", "bucket_start"),
+    )
+
+    action_type: Mapped[str] = mapped_column(String(50), primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    target_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from collections import namedtuple
 from datetime import date, datetime
 
-from sqlalchemy import Date, DateTime, Float, Integer, String, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.models.event_detail import EventDetail
 from app.db.utils import utcnow
 
 
@@ -24,10 +26,6 @@ class Event(Base):
     place: Mapped[str | None] = mapped_column(String(255), nullable=True)
     org_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     use_trgt: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    use_fee: Mapped[str | None] = mapped_column(Text, nullable=True)
-    player: Mapped[str | None] = mapped_column(Text, nullable=True)
-    program: Mapped[str | None] = mapped_column(Text, nullable=True)
-    etc_desc: Mapped[str | None] = mapped_column(Text, nullable=True)
     ticket: Mapped[str | None] = mapped_column(String(255), nullable=True)
     theme_code: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
     org_link: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -37,9 +35,29 @@ class Event(Base):
     lot: Mapped[float | None] = mapped_column(Float, nullable=True)
     lat: Mapped[float | None] = mapped_column(Float, nullable=True)
     is_free: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    min_price: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
+    max_price: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
+    price_note: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    is_free_normalized: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=utcnow, nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=utcnow, onupdate=utcnow, nullable=False
     )
+
+    # Never lazy-loaded: AsyncSession cannot do implicit IO, so queries that
+    # need the cold columns must ``joinedload(Event.details)``.
+    details: Mapped[EventDetail | None] = relationship(
+        back_populates="event", uselist=False, cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
+    )
+
+
+EVENT_COLUMN_ORDER = tuple(column.key for column in Event.__table__.columns)
+EVENT_DETAIL_COLUMN_ORDER = tuple(
+    column.key for column in EventDetail.__table__.columns if column.key != "event_id"
+)
+
+# One synced event: the ``events`` columns in table order, then its
+# ``event_details`` columns, so slices feed multi-row INSERTs directly.
+EventRow = namedtuple("EventRow", EVENT_COLUMN_ORDER + EVENT_DETAIL_COLUMN_ORDER)
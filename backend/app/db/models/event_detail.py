@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import ForeignKey, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+
+if TYPE_CHECKING:
+    from app.db.models.event import Event
+
+
+class EventDetail(Base):
+    """Large free-text event fields that only the detail views read.
+
+    Kept out of ``events`` so list and map scans stay on a narrow heap.
+    """
+
+    __tablename__ = "event_details"
+
+    event_id: Mapped[int] = mapped_column(
+        ForeignKey("events.id", ondelete="CASCADE"), primary_key=True
+    )
+    use_fee: Mapped[str | None] = mapped_column(Text, nullable=True)
+    player: Mapped[str | None] = mapped_column(Text, nullable=True)
+    program: Mapped[str | None] = mapped_column(Text, nullable=True)
+    etc_desc: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    event: Mapped["Event"] = relationship(back_populates="details", lazy="raise")
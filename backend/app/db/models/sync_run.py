@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class SyncRun(Base):
+    """One execution of an upstream synchronisation job and its timings."""
+
+    __tablename__ = "sync_runs"
+    __table_args__ = (Index("ix_sync_runs_kind_started_at", "kind", "started_at"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(32), nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False)
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    finished_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    duration_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+    stage_durations_ms: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    pages: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rows_fetched: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rows_upserted: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    bytes_downloaded: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -11,13 +11,23 @@ from app.db.utils import utcnow
 
 
 class UserAction(Base):
-    """User interaction logs used for analytics and recommendations."""
+    """User interaction logs used for analytics and recommendations.
+
+    The table is range-partitioned by month on ``timestamp``; partitions are
+    created and retired by ``app.services.partition_maintenance``.
+    """
 
     __tablename__ = "user_actions"
+    __table_args__ = (
+        Index("ix_user_actions_timestamp_brin", "timestamp", postgresql_using="brin"),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int | None] = mapped_column(ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
-    action_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    action_type: Mapped[str] = mapped_column(String(50), nullable=False)
     target_id: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
-    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow, nullable=False)
+    timestamp: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True, default=utcnow, nullable=False
+    )
     metadata_json: Mapped[dict | None] = mapped_column("metadata", JSONB, nullable=True)
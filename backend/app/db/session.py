@@ -3,10 +3,12 @@ from collections.abc import AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import get_settings
+from app.core.metrics import InstrumentedPool, instrument_engine
 
 settings = get_settings()
 
-engine = create_async_engine(settings.database_url, future=True, echo=False)
+engine = create_async_engine(settings.database_url, future=True, echo=False, poolclass=InstrumentedPool)
+instrument_engine(engine.sync_engine)
 async_session_factory = async_sessionmaker(engine, expire_on_commit=False)
 
 
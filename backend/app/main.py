@@ -1,12 +1,59 @@
-from fastapi import FastAPI
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from app.api.router import api_router
 from app.core.config import get_settings
+from app.core.metrics import (
+    ACTION_BUFFER_PENDING,
+    IMAGE_CACHE_BYTES,
+    MetricsMiddleware,
+)
+from app.core.loop_monitor import LoopMonitor
+from app.core.profiling import ProfilingMiddleware
+from app.core.sql_profiler import SqlProfilingMiddleware, instrument_query_profiling
+from app.core.tracing import TracingMiddleware
+from app.db.session import engine
+from app.services.action_buffer import get_action_buffer, get_aggregate_buffer
+from app.services.image_cache import get_image_cache
+from app.services.image_transform import get_image_transformer
+from app.services.image_warming import cancel_image_warming
+from app.services.partition_maintenance import partition_maintenance_loop
 
 settings = get_settings()
 
-app = FastAPI(title=settings.app_name)
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    action_buffers = (get_action_buffer(), get_aggregate_buffer())
+    for action_buffer in action_buffers:
+        action_buffer.start()
+    maintenance_task = asyncio.create_task(partition_maintenance_loop(), name="partition-maintenance")
+    loop_monitor = LoopMonitor(
+        interval=settings.loop_lag_sample_interval,
+        blocking_threshold=(
+            settings.loop_blocking_threshold_ms / 1000 if settings.loop_blocking_threshold_ms else None
+        ),
+    )
+    monitor_task = asyncio.create_task(loop_monitor.run(), name="event-loop-monitor")
+    try:
+        yield
+    finally:
+        for task in (maintenance_task, monitor_task):
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        await cancel_image_warming()
+        for action_buffer in action_buffers:
+            await action_buffer.stop()
+        get_image_transformer().shutdown()
+
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
 cors_origins = settings.allowed_cors_origins
 allow_credentials = True
@@ -22,10 +69,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(ProfilingMiddleware)
+
+if settings.sql_profiling_enabled:
+    instrument_query_profiling(engine.sync_engine, slow_query_seconds=settings.sql_slow_query_ms / 1000)
+    app.add_middleware(SqlProfilingMiddleware, n_plus_one_threshold=settings.sql_n_plus_one_threshold)
+
+app.add_middleware(TracingMiddleware)
+
 app.include_router(api_router, prefix=settings.api_prefix)
 
+ACTION_BUFFER_PENDING.labels("actions").set_function(lambda: get_action_buffer().pending)
+ACTION_BUFFER_PENDING.labels("aggregates").set_function(lambda: get_aggregate_buffer().pending)
+IMAGE_CACHE_BYTES.set_function(lambda: get_image_cache().total_bytes)
+
 
 @app.get("/healthz", tags=["health"])
 def read_health() -> dict[str, str]:
     """Simple healthcheck endpoint for monitoring."""
     return {"status": "ok"}
+
+
+@app.get("/metrics", tags=["health"], include_in_schema=False)
+def read_metrics() -> Response:
+    """Expose Prometheus metrics for scraping."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -6,7 +6,9 @@ from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.event import Event
+from app.core.tracing import traced
+from app.db.models.event import EVENT_COLUMN_ORDER, EVENT_DETAIL_COLUMN_ORDER, Event, EventRow
+from app.db.models.event_detail import EventDetail
 
 
 class EventRepository:
@@ -15,21 +17,31 @@ class EventRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    async def upsert_many(self, payloads: Iterable[dict]) -> int:
-        """Insert or update events using PostgreSQL upsert semantics."""
+    @traced("EventRepository.upsert_many")
+    async def upsert_many(self, rows: Iterable[EventRow]) -> int:
+        """Insert or update events using PostgreSQL upsert semantics.
 
-        payloads = list(payloads)
-        if not payloads:
+        Each row is split into its ``events`` tuple and its ``event_details``
+        tuple, both already in table column order; both tables are written in
+        the same transaction.
+        """
+
+        rows = list(rows)
+        if not rows:
             return 0
 
         total_processed = 0
+        split = len(EVENT_COLUMN_ORDER)
 
-        def chunk(items: list[dict], size: int) -> Iterable[list[dict]]:
+        def chunk(items: list[EventRow], size: int) -> Iterable[list[EventRow]]:
             for index in range(0, len(items), size):
                 yield items[index : index + size]
 
-        for batch in chunk(payloads, 500):
-            insert_stmt = insert(Event).values(batch)
+        for batch in chunk(rows, 500):
+            event_rows = [row[:split] for row in batch]
+            detail_rows = [(row.id, *row[split:]) for row in batch]
+
+            insert_stmt = insert(Event).values(event_rows)
             update_columns = {
                 column.key: getattr(insert_stmt.excluded, column.key)
                 for column in Event.__table__.columns
@@ -46,9 +58,18 @@ class EventRepository:
             else:
                 total_processed += rowcount
 
+            detail_stmt = insert(EventDetail).values(detail_rows)
+            await self.session.execute(
+                detail_stmt.on_conflict_do_update(
+                    index_elements=[EventDetail.event_id],
+                    set_={key: getattr(detail_stmt.excluded, key) for key in EVENT_DETAIL_COLUMN_ORDER},
+                )
+            )
+
         await self.session.commit()
         return total_processed
 
+    @traced("EventRepository.list_existing_ids")
     async def list_existing_ids(self) -> set[int]:
         """Return the set of event IDs currently stored."""
 
@@ -5,6 +5,7 @@ from typing import Iterable
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.tracing import traced
 from app.db.models.weather import Weather
 
 
@@ -14,6 +15,7 @@ class WeatherRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
+    @traced("WeatherRepository.upsert_many")
     async def upsert_many(self, payloads: Iterable[dict]) -> int:
         payloads = list(payloads)
         if not payloads:
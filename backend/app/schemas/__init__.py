@@ -1,6 +1,19 @@
 """Pydantic schema definitions for API payloads."""
 
-from .event import EventBase, EventCreate, EventRead, EventWithWeather, EventLocation  # noqa: F401
+from .event import (  # noqa: F401
+    EventBase,
+    EventCreate,
+    EventDetailRead,
+    EventLocation,
+    EventRead,
+    EventWithWeather,
+)
+from .sync_run import SyncRunRead  # noqa: F401
 from .user import UserBase, UserCreate, UserRead  # noqa: F401
-from .user_action import UserActionBase, UserActionCreate, UserActionRead  # noqa: F401
+from .user_action import (  # noqa: F401
+    UserActionBase,
+    UserActionBatchAccepted,
+    UserActionCreate,
+    UserActionRead,
+)
 from .weather import WeatherBase, WeatherCreate, WeatherRead  # noqa: F401
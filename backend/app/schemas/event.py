@@ -1,5 +1,7 @@
 from datetime import date as date_type, datetime
-from typing import Optional
+from typing import Any, Optional
+
+from pydantic import model_validator
 
 from app.schemas.base import ORMBase
 from app.schemas.weather import WeatherRead
@@ -15,10 +17,6 @@ class EventBase(ORMBase):
     place: Optional[str] = None
     org_name: Optional[str] = None
     use_trgt: Optional[str] = None
-    use_fee: Optional[str] = None
-    player: Optional[str] = None
-    program: Optional[str] = None
-    etc_desc: Optional[str] = None
     ticket: Optional[str] = None
     theme_code: Optional[str] = None
     org_link: Optional[str] = None
@@ -28,6 +26,10 @@ class EventBase(ORMBase):
     lot: Optional[float] = None
     lat: Optional[float] = None
     is_free: Optional[str] = None
+    min_price: Optional[int] = None
+    max_price: Optional[int] = None
+    price_note: Optional[str] = None
+    is_free_normalized: bool = False
 
 
 class EventCreate(EventBase):
@@ -40,8 +42,28 @@ class EventRead(EventBase):
     updated_at: datetime
 
 
+class EventDetailRead(EventRead):
+    use_fee: Optional[str] = None
+    player: Optional[str] = None
+    program: Optional[str] = None
+    etc_desc: Optional[str] = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def _flatten_details(cls, data: Any) -> Any:
+        """Read the cold columns from an ORM ``Event``'s eager-loaded ``details``."""
+
+        if isinstance(data, dict) or not hasattr(data, "details"):
+            return data
+        details = data.details
+        flattened = {name: getattr(data, name) for name in EventRead.model_fields}
+        for name in ("use_fee", "player", "program", "etc_desc"):
+            flattened[name] = getattr(details, name) if details is not None else None
+        return flattened
+
+
 class EventWithWeather(ORMBase):
-    event: EventRead
+    event: EventDetailRead
     weather: Optional[WeatherRead] = None
 
 
@@ -55,6 +77,9 @@ class EventLocation(ORMBase):
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
     is_free: Optional[str] = None
+    min_price: Optional[int] = None
+    max_price: Optional[int] = None
+    is_free_normalized: bool = False
 
 
 class EventListResponse(ORMBase):
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from app.schemas.base import ORMBase
+
+
+class SyncRunRead(ORMBase):
+    id: int
+    kind: str
+    status: str
+    started_at: datetime
+    finished_at: datetime
+    duration_ms: int
+    stage_durations_ms: dict[str, int]
+    pages: int
+    rows_fetched: int
+    rows_upserted: int
+    bytes_downloaded: int
+    error: Optional[str] = None
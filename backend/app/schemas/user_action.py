@@ -21,3 +21,8 @@ class UserActionCreate(UserActionBase):
 class UserActionRead(UserActionBase):
     id: int
     timestamp: datetime
+
+
+class UserActionBatchAccepted(ORMBase):
+    accepted: int
+    suppressed: int = 0
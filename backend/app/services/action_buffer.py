@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.core.metrics import ACTION_BUFFER_DROPPED
+from app.db.models.user_action import UserAction
+from app.db.session import async_session_factory
+from app.services.popularity import popularity_cache, record_action_counts
+from app.services.visitor_sketches import record_visitor_sketches
+
+logger = logging.getLogger(__name__)
+
+
+async def insert_actions(session: AsyncSession, rows: Sequence[dict[str, Any]]) -> list[int]:
+    """Insert raw action rows and return their ids; the caller commits."""
+
+    result = await session.execute(insert(UserAction).values(list(rows)).returning(UserAction.id))
+    return list(result.scalars().all())
+
+
+async def record_action_aggregates(session: AsyncSession, rows: Sequence[dict[str, Any]]) -> None:
+    """Update the counters and visitor sketches derived from ``rows``.
+
+    The caller commits; call ``actions_committed`` afterwards.
+    """
+
+    await record_action_counts(session, rows)
+    await record_visitor_sketches(session, rows)
+
+
+async def persist_actions(session: AsyncSession, rows: Sequence[dict[str, Any]]) -> None:
+    """Insert action rows and update derived aggregates in one transaction."""
+
+    await insert_actions(session, rows)
+    await record_action_aggregates(session, rows)
+
+
+def actions_committed() -> None:
+    """Drop in-memory read caches that depend on the action aggregates."""
+
+    popularity_cache.invalidate()
+
+
+class ActionBufferFull(RuntimeError):
+    """Raised when the write buffer cannot accept more actions in time."""
+
+
+# Writes one batch inside the given session; the buffer commits.
+BatchWriter = Callable[[AsyncSession, Sequence[dict[str, Any]]], Awaitable[None]]
+
+# Transient database failures are retried as a whole batch; anything else is
+# assumed to come from the rows themselves and is isolated by bisection.
+FLUSH_RETRIES = 3
+FLUSH_RETRY_BACKOFF = 0.5
+
+
+def _is_transient(exc: Exception) -> bool:
+    if isinstance(exc, (OperationalError, InterfaceError, OSError)):
+        return True
+    return isinstance(exc, DBAPIError) and exc.connection_invalidated
+
+
+class ActionWriteBuffer:
+    """In-process buffer that persists user actions in multi-row batches.
+
+    Rows are queued by ``submit`` and passed to ``writer`` (by default
+    ``persist_actions``) by a single background task, which flushes
+    whenever ``batch_size`` rows are pending or ``flush_interval`` seconds
+    have passed since the first queued row. The
+    buffer is bounded and a submission is queued all at once or not at all,
+    so producers wait (and eventually fail without side effects) instead of
+    growing memory when the database falls behind.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        name: str = "actions",
+        writer: BatchWriter = persist_actions,
+        max_pending: int,
+        batch_size: int,
+        flush_interval: float,
+    ) -> None:
+        self._session_factory = session_factory
+        self.name = name
+        self._writer = writer
+        self._rows: deque[dict[str, Any]] = deque()
+        self._changed = asyncio.Condition()
+        self._max_pending = max_pending
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._task: asyncio.Task[None] | None = None
+        self._closing = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._rows)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._closing = False
+            self._task = asyncio.create_task(self._run(), name=f"action-write-buffer-{self.name}")
+
+    async def submit(self, rows: Sequence[dict[str, Any]], *, timeout: float) -> None:
+        """Queue all ``rows`` for persistence, waiting up to ``timeout`` for space.
+
+        On ``ActionBufferFull`` nothing has been queued, so the caller can
+        safely retry the same rows.
+        """
+
+        if self._closing or self._task is None:
+            raise ActionBufferFull("Action buffer is not accepting writes")
+        if len(rows) > self._max_pending:
+            raise ActionBufferFull("Batch is larger than the action buffer")
+        if not rows:
+            return
+        async with self._changed:
+            try:
+                await asyncio.wait_for(
+                    self._changed.wait_for(
+                        lambda: self._closing or self._max_pending - len(self._rows) >= len(rows)
+                    ),
+                    timeout,
+                )
+            except asyncio.TimeoutError as exc:
+                raise ActionBufferFull("Action buffer is full") from exc
+            if self._closing:
+                raise ActionBufferFull("Action buffer is not accepting writes")
+            self._rows.extend(rows)
+            self._changed.notify_all()
+
+    async def stop(self) -> None:
+        """Stop accepting rows and flush everything already queued."""
+
+        if self._task is None:
+            return
+        async with self._changed:
+            self._closing = True
+            self._changed.notify_all()
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: self._rows or self._closing)
+                if not self._rows:
+                    return
+            deadline = loop.time() + self._flush_interval
+            async with self._changed:
+                try:
+                    await asyncio.wait_for(
+                        self._changed.wait_for(lambda: len(self._rows) >= self._batch_size or self._closing),
+                        max(deadline - loop.time(), 0),
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                batch = [self._rows.popleft() for _ in range(min(self._batch_size, len(self._rows)))]
+                self._changed.notify_all()
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[dict[str, Any]]) -> None:
+        """Write ``batch``, retrying outages and isolating rows that cannot be written."""
+
+        for attempt in range(FLUSH_RETRIES + 1):
+            try:
+                await self._write(batch)
+            except Exception as exc:  # pragma: no cover - database failure
+                if not _is_transient(exc):
+                    await self._bisect(batch, exc)
+                    return
+                if attempt == FLUSH_RETRIES:
+                    ACTION_BUFFER_DROPPED.labels(self.name, "unavailable").inc(len(batch))
+                    logger.exception(
+                        "Dropped %d buffered %s rows after %d attempts", len(batch), self.name, attempt + 1
+                    )
+                    return
+                await asyncio.sleep(FLUSH_RETRY_BACKOFF * 2**attempt)
+            else:
+                actions_committed()
+                return
+
+    async def _bisect(self, batch: list[dict[str, Any]], exc: Exception) -> None:
+        if len(batch) == 1:
+            ACTION_BUFFER_DROPPED.labels(self.name, "rejected").inc()
+            logger.error("Dropped buffered %s row %r: %s", self.name, batch[0], exc)
+            return
+        middle = len(batch) // 2
+        await self._flush(batch[:middle])
+        await self._flush(batch[middle:])
+
+    async def _write(self, batch: list[dict[str, Any]]) -> None:
+        async with self._session_factory() as session:
+            await self._writer(session, batch)
+            await session.commit()
+
+
+@lru_cache(maxsize=1)
+def get_action_buffer() -> ActionWriteBuffer:
+    """Provide the process-wide action write buffer."""
+
+    settings = get_settings()
+    return ActionWriteBuffer(
+        async_session_factory,
+        max_pending=settings.action_buffer_max_pending,
+        batch_size=settings.action_buffer_batch_size,
+        flush_interval=settings.action_buffer_flush_interval,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_aggregate_buffer() -> ActionWriteBuffer:
+    """Provide the buffer applying aggregates of actions already inserted one by one."""
+
+    settings = get_settings()
+    return ActionWriteBuffer(
+        async_session_factory,
+        name="aggregates",
+        writer=record_action_aggregates,
+        max_pending=settings.action_buffer_max_pending,
+        batch_size=settings.action_buffer_batch_size,
+        flush_interval=settings.action_buffer_flush_interval,
+    )
+
+
+async def defer_action_aggregates(session: AsyncSession, rows: Sequence[dict[str, Any]]) -> None:
+    """Queue aggregate updates for committed ``rows``, or apply them now if the buffer is full."""
+
+    try:
+        await get_aggregate_buffer().submit(rows, timeout=get_settings().action_buffer_enqueue_timeout)
+    except ActionBufferFull:
+        await record_action_aggregates(session, rows)
+        await session.commit()
+        actions_committed()
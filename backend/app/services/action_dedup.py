@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from typing import Any
+
+from app.core.config import get_settings
+from app.core.metrics import ACTION_DEDUP_DECISIONS
+from app.services.visitor_sketches import visitor_key
+
+# Only passive, repeatable signals are collapsed; deliberate actions such as
+# favorites or clicks are always persisted.
+DEDUP_ACTION_TYPES = frozenset({"view"})
+
+
+class ActionDeduplicator:
+    """Suppress repeats of the same (visitor, action, target) within a window.
+
+    Entries live in an ``OrderedDict`` ordered by last admission, which acts
+    as an LRU with TTL: expired and overflow entries are evicted from the
+    head, so memory is bounded by ``max_entries``. State is per process.
+    """
+
+    def __init__(self, *, window_seconds: float, max_entries: int) -> None:
+        self._window = window_seconds
+        self._max_entries = max_entries
+        self._seen: OrderedDict[tuple[str, str, int], float] = OrderedDict()
+
+    def _key(self, row: Mapping[str, Any]) -> tuple[str, str, int] | None:
+        if self._window <= 0 or row["action_type"] not in DEDUP_ACTION_TYPES or row.get("target_id") is None:
+            return None
+        visitor = visitor_key(row)
+        if visitor is None:
+            return None
+        return (visitor, row["action_type"], row["target_id"])
+
+    def admit(self, row: Mapping[str, Any]) -> bool:
+        """Return ``False`` if ``row`` duplicates a recently admitted action.
+
+        Admission is recorded immediately so duplicates within one request are
+        caught too; call ``release`` if the admitted rows are then not stored.
+        """
+
+        key = self._key(row)
+        if key is None:
+            ACTION_DEDUP_DECISIONS.labels("admitted").inc()
+            return True
+
+        now = time.monotonic()
+        last_seen = self._seen.get(key)
+        if last_seen is not None and now - last_seen < self._window:
+            ACTION_DEDUP_DECISIONS.labels("suppressed").inc()
+            return False
+
+        self._seen[key] = now
+        self._seen.move_to_end(key)
+        self._evict(now)
+        ACTION_DEDUP_DECISIONS.labels("admitted").inc()
+        return True
+
+    def filter(self, rows: Sequence[Mapping[str, Any]]) -> list[Mapping[str, Any]]:
+        return [row for row in rows if self.admit(row)]
+
+    def release(self, rows: Sequence[Mapping[str, Any]]) -> None:
+        """Forget admitted ``rows`` whose write failed, so a retry is not suppressed.
+
+        An admitted key had no live entry before, so removing it restores the
+        previous state.
+        """
+
+        for row in rows:
+            key = self._key(row)
+            if key is not None:
+                self._seen.pop(key, None)
+
+    def _evict(self, now: float) -> None:
+        seen = self._seen
+        while seen:
+            oldest_key, oldest_time = next(iter(seen.items()))
+            if now - oldest_time < self._window and len(seen) <= self._max_entries:
+                break
+            del seen[oldest_key]
+
+
+@lru_cache(maxsize=1)
+def get_action_deduplicator() -> ActionDeduplicator:
+    """Provide the process-wide action deduplicator."""
+
+    settings = get_settings()
+    return ActionDeduplicator(
+        window_seconds=settings.action_dedup_window_seconds,
+        max_entries=settings.action_dedup_max_entries,
+    )
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+import time
+import zlib
+from collections import Counter
+from collections.abc import Sequence
+from typing import NamedTuple
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.event import Event
+from app.db.models.event_detail import EventDetail
+
+# Hashed feature space: no vocabulary to maintain, so documents can be
+# vectorised independently and reused across rebuilds.
+N_FEATURES = 1 << 18
+NGRAM_SIZES = (2, 3)
+
+# How often a query may check the database for changes made by other workers.
+FRESHNESS_CHECK_SECONDS = 300.0
+
+
+class EventText(NamedTuple):
+    event_id: int
+    texts: tuple[str, ...]
+    categories: tuple[str, ...]
+
+
+class _DocumentVector(NamedTuple):
+    fingerprint: bytes
+    indices: np.ndarray
+    counts: np.ndarray
+
+
+class ContentIndexSnapshot(NamedTuple):
+    event_ids: np.ndarray
+    positions: dict[int, int]
+    rows: sparse.csr_matrix
+    columns: sparse.csc_matrix
+
+
+def _feature(token: str) -> int:
+    return zlib.crc32(token.encode("utf-8")) & (N_FEATURES - 1)
+
+
+def _fingerprint(document: EventText) -> bytes:
+    payload = "\x1f".join((*document.texts, "\x1e", *document.categories))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+def vectorize_document(document: EventText) -> _DocumentVector:
+    """Turn one event into hashed character n-gram counts.
+
+    Character n-grams work well for Korean, where word boundaries and
+    particles make whole-word tokens sparse. Categorical fields (category,
+    district, theme) are added as whole tokens instead.
+    """
+
+    counts: Counter[int] = Counter()
+    for text in document.texts:
+        normalized = f" {' '.join(text.lower().split())} "
+        for size in NGRAM_SIZES:
+            counts.update(_feature(normalized[i : i + size]) for i in range(len(normalized) - size + 1))
+    for category in document.categories:
+        counts[_feature(f"\x00{category}")] += 1
+
+    indices = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+    values = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+    order = np.argsort(indices)
+    return _DocumentVector(_fingerprint(document), indices[order], values[order])
+
+
+def build_matrix(event_ids: Sequence[int], vectors: Sequence[_DocumentVector]) -> ContentIndexSnapshot:
+    """Stack per-document counts into an L2-normalised TF-IDF CSR matrix."""
+
+    lengths = np.fromiter((len(vector.indices) for vector in vectors), dtype=np.int64, count=len(vectors))
+    indptr = np.zeros(len(vectors) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=indptr[1:])
+    indices = np.concatenate([vector.indices for vector in vectors]) if vectors else np.zeros(0, np.int32)
+    data = np.concatenate([vector.counts for vector in vectors]) if vectors else np.zeros(0, np.float32)
+
+    matrix = sparse.csr_matrix((data, indices, indptr), shape=(len(vectors), N_FEATURES), dtype=np.float32)
+    matrix.data = 1.0 + np.log(matrix.data)
+
+    document_frequency = np.bincount(matrix.indices, minlength=N_FEATURES)
+    idf = (np.log((1.0 + len(vectors)) / (1.0 + document_frequency)) + 1.0).astype(np.float32)
+    matrix.data *= idf[matrix.indices]
+
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    inverse_norms = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+    matrix = (sparse.diags(inverse_norms.astype(np.float32)) @ matrix).tocsr()
+
+    ids = np.asarray(event_ids, dtype=np.int64)
+    # The CSC copy lets a query touch only the columns of its own n-grams.
+    return ContentIndexSnapshot(
+        ids, {int(event_id): row for row, event_id in enumerate(ids)}, matrix, matrix.tocsc()
+    )
+
+
+def top_similar(snapshot: ContentIndexSnapshot, event_id: int, limit: int) -> list[tuple[int, float]]:
+    """Return ``(event_id, cosine)`` pairs most similar to ``event_id``."""
+
+    row = snapshot.positions.get(event_id)
+    if row is None:
+        return []
+    query = snapshot.rows[row]
+    scores = np.asarray(snapshot.columns[:, query.indices] @ query.data).ravel()
+    scores[row] = -math.inf
+    limit = min(limit, len(scores) - 1)
+    if limit <= 0:
+        return []
+    candidates = np.argpartition(-scores, limit - 1)[:limit]
+    ordered = candidates[np.argsort(-scores[candidates], kind="stable")]
+    return [(int(snapshot.event_ids[i]), float(scores[i])) for i in ordered if scores[i] > 0]
+
+
+async def load_event_texts(session: AsyncSession) -> list[EventText]:
+    statement = select(
+        Event.id,
+        Event.title,
+        Event.codename,
+        Event.guname,
+        Event.theme_code,
+        EventDetail.program,
+        EventDetail.player,
+    ).outerjoin(EventDetail, EventDetail.event_id == Event.id)
+    result = await session.execute(statement)
+
+    documents: list[EventText] = []
+    for row in result:
+        texts = tuple(text for text in (row.title, row.program, row.player) if text)
+        categories = [f"codename:{row.codename}"] if row.codename else []
+        if row.guname:
+            categories.append(f"guname:{row.guname}")
+        if row.theme_code:
+            categories.extend(
+                f"theme:{theme.strip()}" for theme in row.theme_code.split(",") if theme.strip()
+            )
+        documents.append(EventText(row.id, texts, tuple(categories)))
+    return documents
+
+
+class ContentSimilarityIndex:
+    """In-memory similar-events index, refreshed incrementally.
+
+    Per-event vectors are cached with a content fingerprint, so a refresh
+    only re-tokenises new or changed events; the IDF weighting and
+    normalisation are then recomputed over the whole matrix with sparse ops.
+    """
+
+    def __init__(self) -> None:
+        self._vectors: dict[int, _DocumentVector] = {}
+        self._snapshot: ContentIndexSnapshot | None = None
+        self._signature: tuple[int, object] | None = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def refresh(self, session: AsyncSession) -> dict[str, int]:
+        async with self._lock:
+            signature = await self._current_signature(session)
+            documents = await load_event_texts(session)
+            stats = await asyncio.to_thread(self._rebuild, documents)
+            self._signature = signature
+            self._checked_at = time.monotonic()
+            return stats
+
+    async def ensure_fresh(self, session: AsyncSession) -> None:
+        """Build the index on first use and pick up syncs run by other workers."""
+
+        if self._snapshot is not None and time.monotonic() - self._checked_at < FRESHNESS_CHECK_SECONDS:
+            return
+        if self._snapshot is None or await self._current_signature(session) != self._signature:
+            await self.refresh(session)
+        self._checked_at = time.monotonic()
+
+    async def similar(self, session: AsyncSession, event_id: int, limit: int) -> list[tuple[int, float]]:
+        await self.ensure_fresh(session)
+        if self._snapshot is None:
+            return []
+        return top_similar(self._snapshot, event_id, limit)
+
+    async def _current_signature(self, session: AsyncSession) -> tuple[int, object]:
+        result = await session.execute(select(func.count(Event.id), func.max(Event.updated_at)))
+        count, latest = result.one()
+        return int(count), latest
+
+    def _rebuild(self, documents: list[EventText]) -> dict[str, int]:
+        vectors: dict[int, _DocumentVector] = {}
+        vectorized = 0
+        for document in documents:
+            cached = self._vectors.get(document.event_id)
+            if cached is not None and cached.fingerprint == _fingerprint(document):
+                vectors[document.event_id] = cached
+                continue
+            vectors[document.event_id] = vectorize_document(document)
+            vectorized += 1
+
+        event_ids = list(vectors)
+        self._snapshot = build_matrix(event_ids, [vectors[event_id] for event_id in event_ids])
+        self._vectors = vectors
+        return {"indexed": len(vectors), "vectorized": vectorized}
+
+
+content_index = ContentSimilarityIndex()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Literal
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.action_counter import ActionCounter
+from app.db.models.event import Event
+from app.services.popularity import bucket_start
+
+Granularity = Literal["hour", "day", "week"]
+
+KST = timezone(timedelta(hours=9))
+KST_NAME = "Asia/Seoul"
+
+STEP = {"hour": timedelta(hours=1), "day": timedelta(days=1), "week": timedelta(weeks=1)}
+MAX_POINTS = 2000
+
+
+class TimeseriesRangeError(ValueError):
+    """Raised when a timeseries request would produce too many buckets."""
+
+
+def _align(moment: datetime, granularity: Granularity) -> datetime:
+    """Floor ``moment`` to the start of its bucket (days and weeks in KST)."""
+
+    if granularity == "hour":
+        return bucket_start(moment)
+    local = moment.astimezone(KST).replace(hour=0, minute=0, second=0, microsecond=0)
+    if granularity == "week":
+        local -= timedelta(days=local.weekday())
+    return local
+
+
+async def engagement_timeseries(
+    session: AsyncSession,
+    *,
+    action_type: str,
+    start: datetime,
+    end: datetime,
+    granularity: Granularity,
+    target_id: int | None = None,
+    guname: str | None = None,
+) -> list[dict[str, Any]]:
+    """Return zero-filled action counts per bucket from the hourly counters.
+
+    Day and week buckets are re-aggregated in SQL from the hourly rows,
+    using Seoul local time for the bucket boundaries.
+    """
+
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    first = _align(start, granularity)
+    if (end - first) / STEP[granularity] > MAX_POINTS:
+        raise TimeseriesRangeError(f"Range spans more than {MAX_POINTS} {granularity} buckets")
+
+    if granularity == "hour":
+        bucket = ActionCounter.bucket_start
+    else:
+        local_bucket = func.date_trunc(granularity, func.timezone(KST_NAME, ActionCounter.bucket_start))
+        bucket = func.timezone(KST_NAME, local_bucket)
+
+    statement = (
+        select(bucket.label("bucket"), func.sum(ActionCounter.count).label("hits"))
+        .where(
+            ActionCounter.action_type == action_type,
+            ActionCounter.bucket_start >= bucket_start(start),
+            ActionCounter.bucket_start < end,
+        )
+        .group_by(bucket)
+    )
+    if target_id is not None:
+        statement = statement.where(ActionCounter.target_id == target_id)
+    if guname:
+        statement = statement.join(Event, Event.id == ActionCounter.target_id).where(Event.guname == guname)
+
+    result = await session.execute(statement)
+    counts = {row.bucket: int(row.hits) for row in result}
+
+    points: list[dict[str, Any]] = []
+    step = STEP[granularity]
+    current = first
+    while current < end:
+        points.append({"bucket": current, "count": counts.get(current, 0)})
+        current += step
+    return points
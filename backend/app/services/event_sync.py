@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from datetime import date, datetime, timezone
+from functools import lru_cache
 import hashlib
+import logging
+from typing import Any, NamedTuple
 from urllib.parse import parse_qs, urlparse
 
 from dateutil import parser as dateutil_parser
@@ -12,7 +15,17 @@ from httpx import RequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
+from app.core.metrics import record_upstream_error, upstream_event_hooks
+from app.core.tracing import describe_error, start_span
+from app.db.models.event import EventRow
 from app.repositories import EventRepository
+from app.services.content_similarity import content_index
+from app.services.image_warming import changed_image_urls, load_image_urls, schedule_image_warming
+from app.services.parsers import match_date, match_datetime
+from app.services.pricing import parse_price_info
+from app.services.sync_ledger import SyncRunRecorder, track_sync_run
+
+logger = logging.getLogger(__name__)
 
 
 class EventSyncError(RuntimeError):
@@ -31,7 +44,9 @@ def _build_request_url(start: int, end: int) -> str:
     )
 
 
-async def fetch_seoul_events(client: httpx.AsyncClient) -> list[Mapping[str, object]]:
+async def fetch_seoul_events(
+    client: httpx.AsyncClient, recorder: SyncRunRecorder | None = None
+) -> list[Mapping[str, object]]:
     """Fetch cultural event data from the Seoul public API with pagination."""
 
     start = 1
@@ -40,11 +55,17 @@ async def fetch_seoul_events(client: httpx.AsyncClient) -> list[Mapping[str, obj
 
     while True:
         url = _build_request_url(start, end)
-        try:
-            response = await client.get(url, timeout=30.0)
-        except RequestError as exc:  # pragma: no cover - network failure
-            raise EventSyncError(f"서울 열린데이터 API 호출 실패: {exc}") from exc
+        with start_span("seoul_open_data.culturalEventInfo", kind="client", start=start, end=end) as span:
+            try:
+                response = await client.get(url, timeout=30.0)
+            except RequestError as exc:  # pragma: no cover - network failure
+                record_upstream_error("seoul_open_data")
+                raise EventSyncError(f"서울 열린데이터 API 호출 실패: {describe_error(exc)}") from exc
+            if span is not None:
+                span.set(**{"http.status_code": response.status_code, "http.response_size": len(response.content)})
         response.raise_for_status()
+        if recorder is not None:
+            recorder.page(len(response.content))
 
         payload = response.json()
         items = payload.get("culturalEventInfo", {}).get("row", [])  # type: ignore[arg-type]
@@ -72,9 +93,18 @@ def _parse_float(value: str | None) -> float | None:
         return None
 
 
+# Date and fee texts repeat across events (most runs share a handful of fee
+# strings and start dates), so their parsers are memoised for the sync.
+PARSE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def _parse_datetime(value: str | None) -> datetime | None:
     if not value:
         return None
+    parsed = match_datetime(value)
+    if parsed is not None:
+        return parsed.replace(tzinfo=timezone.utc)
     for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S.%f"):
         try:
             parsed = datetime.strptime(value, fmt)
@@ -90,9 +120,13 @@ def _parse_datetime(value: str | None) -> datetime | None:
     return parsed.astimezone(timezone.utc)
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def _parse_date(value: str | None) -> date | None:
     if not value:
         return None
+    parsed = match_date(value)
+    if parsed is not None:
+        return parsed
     for fmt in ("%Y-%m-%d", "%Y%m%d"):
         try:
             parsed = datetime.strptime(value, fmt)
@@ -102,91 +136,151 @@ def _parse_date(value: str | None) -> date | None:
     return None
 
 
-def transform_event(record: Mapping[str, object]) -> dict:
-    """Map raw API fields to the Event model schema."""
-
-    def get_str(key: str) -> str | None:
-        value = record.get(key)
-        if value is None:
-            return None
-        value = str(value).strip()
-        return value or None
-
-    def get_int(key: str) -> int | None:
-        value = record.get(key)
-        try:
-            return int(value) if value is not None else None
-        except (ValueError, TypeError):
-            return None
-
-    event_id = get_int("CULTCODE")
-    if event_id is None:
+def _title(value: str | None) -> str:
+    return value or "제목 미정"
+
+
+class FieldSpec(NamedTuple):
+    """Where an ``EventRow`` field comes from in a culturalEventInfo record."""
+
+    source: str
+    convert: Callable[[str | None], Any] | None = None
+
+
+# Fields copied from the API record. Values are stripped, blanks become None,
+# then ``convert`` is applied; the remaining ``EventRow`` fields are derived.
+EVENT_FIELD_SPEC: dict[str, FieldSpec] = {
+    "codename": FieldSpec("CODENAME"),
+    "guname": FieldSpec("GUNAME"),
+    "title": FieldSpec("TITLE", _title),
+    "date": FieldSpec("DATE"),
+    "start_date": FieldSpec("STRTDATE", _parse_datetime),
+    "end_date": FieldSpec("END_DATE", _parse_datetime),
+    "place": FieldSpec("PLACE"),
+    "org_name": FieldSpec("ORG_NAME"),
+    "use_trgt": FieldSpec("USE_TRGT"),
+    "ticket": FieldSpec("TICKET"),
+    "theme_code": FieldSpec("THEMECODE"),
+    "org_link": FieldSpec("ORG_LINK"),
+    "main_img": FieldSpec("MAIN_IMG"),
+    "hmpg_addr": FieldSpec("HMPG_ADDR"),
+    "rgst_date": FieldSpec("RGSTDATE", _parse_date),
+    "lot": FieldSpec("LOT", _parse_float),
+    "lat": FieldSpec("LAT", _parse_float),
+    "is_free": FieldSpec("IS_FREE"),
+    "use_fee": FieldSpec("USE_FEE"),
+    "player": FieldSpec("PLAYER"),
+    "program": FieldSpec("PROGRAM"),
+    "etc_desc": FieldSpec("ETC_DESC"),
+}
+DERIVED_FIELDS = frozenset(
+    {"id", "min_price", "max_price", "price_note", "is_free_normalized", "created_at", "updated_at"}
+)
+# Raw inputs of the derived fields that no spec entry reads.
+_DERIVED_SOURCES = ("TITLE", "STRTDATE", "END_DATE", "PLACE", "HMPG_ADDR", "USE_FEE", "TICKET", "IS_FREE")
+
+
+_price_info = lru_cache(maxsize=PARSE_CACHE_SIZE)(parse_price_info)
+
+_CULTCODE_KEYS = ("cultcode", "CULTCODE")
+
+
+def _query_params(url: str) -> dict[str, list[str]]:
+    """``parse_qs(urlparse(url).query)`` without the URL parsing for plain URLs.
+
+    Falls back to the library when the URL has escapes, ``+``, brackets,
+    non-ASCII or control characters, where splitting by hand could differ.
+    """
+
+    if "%" in url or "+" in url or "[" in url or "]" in url or not (url.isascii() and url.isprintable()):
+        return parse_qs(urlparse(url).query)
+    query = url.split("#", 1)[0].partition("?")[2]
+    params: dict[str, list[str]] = {}
+    for pair in query.split("&"):
+        key, separator, value = pair.partition("=")
+        if separator and value:
+            params.setdefault(key, []).append(value)
+    return params
+
+
+def _event_id(cultcode: object, hmpg_addr: str | None, digest_parts: Iterable[str | None]) -> int:
+    try:
+        if cultcode is not None:
+            return int(cultcode)  # type: ignore[call-overload]
+    except (ValueError, TypeError):
+        pass
+    if hmpg_addr:
         # Extract from homepage address query parameter ex) ?cultcode=12345
-        hmpg_addr = get_str("HMPG_ADDR")
-        if hmpg_addr:
-            parsed = urlparse(hmpg_addr)
-            query = parse_qs(parsed.query)
-            for key in ("cultcode", "CULTCODE"):
-                values = query.get(key)
-                if values:
-                    try:
-                        event_id = int(values[0])
-                        break
-                    except (TypeError, ValueError):
-                        continue
-        if event_id is None:
-            # Stable hash fallback based on title + start/end dates.
-            digest_source = "|".join(
-                filter(
-                    None,
-                    [
-                        get_str("TITLE") or "",
-                        get_str("STRTDATE") or "",
-                        get_str("END_DATE") or "",
-                        get_str("PLACE") or "",
-                    ],
-                )
-            )
-            digest = hashlib.sha1(digest_source.encode("utf-8"), usedforsecurity=False).hexdigest()
-            event_id = int(digest[:12], 16)
-
-    start_date = _parse_datetime(get_str("STRTDATE"))
-    end_date = _parse_datetime(get_str("END_DATE"))
-    timestamp = datetime.now(timezone.utc)
-
-    transformed = {
-        "id": event_id,
-        "codename": get_str("CODENAME"),
-        "guname": get_str("GUNAME"),
-        "title": get_str("TITLE") or "제목 미정",
-        "date": get_str("DATE"),
-        "start_date": start_date,
-        "end_date": end_date,
-        "place": get_str("PLACE"),
-        "org_name": get_str("ORG_NAME"),
-        "use_trgt": get_str("USE_TRGT"),
-        "use_fee": get_str("USE_FEE"),
-        "player": get_str("PLAYER"),
-        "program": get_str("PROGRAM"),
-        "etc_desc": get_str("ETC_DESC"),
-        "ticket": get_str("TICKET"),
-        "theme_code": get_str("THEMECODE"),
-        "org_link": get_str("ORG_LINK"),
-        "main_img": get_str("MAIN_IMG"),
-        "hmpg_addr": get_str("HMPG_ADDR"),
-        "rgst_date": _parse_date(get_str("RGSTDATE")),
-        "lot": _parse_float(get_str("LOT")),
-        "lat": _parse_float(get_str("LAT")),
-        "is_free": get_str("IS_FREE"),
-        "created_at": timestamp,
-        "updated_at": timestamp,
-    }
-
-    return transformed
-
-
-def transform_events(records: Iterable[Mapping[str, object]]) -> list[dict]:
-    transformed: list[dict] = []
+        query = _query_params(hmpg_addr)
+        for key in _CULTCODE_KEYS:
+            values = query.get(key)
+            if values:
+                try:
+                    return int(values[0])
+                except (TypeError, ValueError):
+                    continue
+    # Stable hash fallback based on title + start/end dates.
+    digest_source = "|".join(filter(None, digest_parts))
+    digest = hashlib.sha1(digest_source.encode("utf-8"), usedforsecurity=False).hexdigest()
+    return int(digest[:12], 16)
+
+
+def compile_event_transformer(
+    spec: Mapping[str, FieldSpec] = EVENT_FIELD_SPEC,
+) -> Callable[[Mapping[str, object]], EventRow]:
+    """Build a function mapping one API record to an ``EventRow``.
+
+    Each distinct source key is read and cleaned once per record, and the
+    row is assembled positionally from a precomputed plan.
+    """
+
+    missing = set(EventRow._fields) - set(spec) - DERIVED_FIELDS
+    if missing:
+        raise ValueError(f"No field spec for: {', '.join(sorted(missing))}")
+
+    sources = tuple(dict.fromkeys([*(field.source for field in spec.values()), *_DERIVED_SOURCES]))
+    position = {key: index for index, key in enumerate(sources)}
+    plan = tuple(
+        (position[spec[name].source], spec[name].convert) if name in spec else (0, None)
+        for name in EventRow._fields
+    )
+    title, start, end, place, hmpg_addr, use_fee, ticket, is_free = (position[key] for key in _DERIVED_SOURCES)
+    fields = EventRow._fields
+    id_index = fields.index("id")
+    min_price_index = fields.index("min_price")
+    max_price_index = fields.index("max_price")
+    price_note_index = fields.index("price_note")
+    is_free_index = fields.index("is_free_normalized")
+    created_index = fields.index("created_at")
+    updated_index = fields.index("updated_at")
+
+    def transform(record: Mapping[str, object]) -> EventRow:
+        get = record.get
+        raw = [None if (value := get(key)) is None else (str(value).strip() or None) for key in sources]
+        values = [raw[index] if convert is None else convert(raw[index]) for index, convert in plan]
+
+        price_info = _price_info(raw[use_fee], raw[ticket], raw[is_free])
+        timestamp = datetime.now(timezone.utc)
+        values[id_index] = _event_id(
+            get("CULTCODE"), raw[hmpg_addr], (raw[title] or "", raw[start] or "", raw[end] or "", raw[place] or "")
+        )
+        values[min_price_index] = price_info.min_price
+        values[max_price_index] = price_info.max_price
+        values[price_note_index] = price_info.note
+        values[is_free_index] = price_info.is_free
+        values[created_index] = timestamp
+        values[updated_index] = timestamp
+        return EventRow._make(values)
+
+    return transform
+
+
+# Maps one raw API record to an ``EventRow``.
+transform_event = compile_event_transformer()
+
+
+def transform_events(records: Iterable[Mapping[str, object]]) -> list[EventRow]:
+    transformed: list[EventRow] = []
     for record in records:
         try:
             transformed.append(transform_event(record))
@@ -200,12 +294,42 @@ async def sync_events(session: AsyncSession) -> dict[str, int]:
 
     settings = get_settings()
 
-    async with httpx.AsyncClient(verify=settings.external_api_verify_ssl) as client:
-        raw_records = await fetch_seoul_events(client)
-
-    payloads = transform_events(raw_records)
-
-    repository = EventRepository(session)
-    processed = await repository.upsert_many(payloads)
-
-    return {"fetched": len(raw_records), "processed": processed}
+    async with track_sync_run("events") as recorder:
+        with recorder.stage("fetch"):
+            async with httpx.AsyncClient(
+                verify=settings.external_api_verify_ssl,
+                event_hooks=upstream_event_hooks("seoul_open_data"),
+            ) as client:
+                raw_records = await fetch_seoul_events(client, recorder)
+        recorder.rows_fetched = len(raw_records)
+
+        with recorder.stage("transform", records=len(raw_records)):
+            payloads = transform_events(raw_records)
+
+        previous_images = await load_image_urls(session) if settings.image_warm_after_sync else {}
+
+        with recorder.stage("upsert", rows=len(payloads)):
+            repository = EventRepository(session)
+            processed = await repository.upsert_many(payloads)
+        recorder.rows_upserted = processed
+
+        # The events are already committed, so a failed in-memory rebuild must
+        # not fail the sync. The index retries on its next freshness check.
+        similarity_indexed = 0
+        with recorder.stage("similarity_index"):
+            try:
+                similarity_indexed = (await content_index.refresh(session))["indexed"]
+            except Exception:
+                await session.rollback()
+                logger.exception("Could not refresh the similarity index after the event sync")
+
+    images_queued = 0
+    if settings.image_warm_after_sync:
+        images_queued = schedule_image_warming(changed_image_urls(previous_images, payloads))
+
+    return {
+        "fetched": len(raw_records),
+        "processed": processed,
+        "similarity_indexed": similarity_indexed,
+        "images_queued": images_queued,
+    }
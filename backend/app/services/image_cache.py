@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class CachedImage(NamedTuple):
+    key: str
+    path: Path
+    content_type: str
+    size: int
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    source_version: str | None = None
+
+
+# Writes a fetched body to the given temporary path and returns the metadata
+# to store alongside it (at least ``content_type``). Receives the current
+# entry, if any, and may return ``None`` to keep it after a revalidation.
+ImageFetcher = Callable[[Path, CachedImage | None], Awaitable[dict[str, Any] | None]]
+
+
+def cache_key(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+class ImageDiskCache:
+    """Size-bounded on-disk cache for proxied images.
+
+    Bodies are stored under their URL hash with a JSON sidecar for metadata.
+    Entries are fresh for ``ttl`` seconds (overridable per call) and may then
+    be served for another ``stale_while_revalidate`` seconds while a
+    background refresh runs. Concurrent misses for the same key share one
+    upstream fetch, and the least recently used entries are evicted once
+    ``max_bytes`` is exceeded.
+    The LRU order is kept in memory and rebuilt from file times on startup.
+    """
+
+    def __init__(self, root: Path, *, max_bytes: int, ttl: float, stale_while_revalidate: float) -> None:
+        self._root = root
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._stale_while_revalidate = stale_while_revalidate
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._inflight: dict[str, asyncio.Task[CachedImage]] = {}
+        self._background: set[asyncio.Task[Any]] = set()
+        # Serialises file replacement and removal (in worker threads) with
+        # ``open``, so an opened body always matches the metadata read with it.
+        self._files_lock = threading.Lock()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    async def get(self, key: str, fetcher: ImageFetcher, *, ttl: float | None = None) -> CachedImage:
+        """Return a servable entry for ``key``, fetching or refreshing as needed."""
+
+        ttl = self._ttl if ttl is None else ttl
+        entry = await self.lookup(key)
+        if entry is not None:
+            age = time.time() - entry.stored_at
+            if age < ttl:
+                return entry
+            if age < ttl + self._stale_while_revalidate:
+                self._refresh_in_background(key, fetcher)
+                return entry
+        try:
+            return await self.fetch(key, fetcher)
+        except Exception:
+            if entry is None:
+                raise
+            logger.warning("Serving expired cached image after refresh failure", extra={"key": key})
+            return entry
+
+    async def lookup(self, key: str) -> CachedImage | None:
+        await self._ensure_loaded()
+        if key not in self._entries:
+            return None
+        try:
+            entry = await asyncio.to_thread(self._read_entry, key)
+        except (OSError, ValueError, KeyError):
+            self._forget(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def open(self, key: str) -> tuple[CachedImage, BinaryIO]:
+        """Open the stored body of ``key`` together with its current metadata.
+
+        The handle stays readable even if the entry is evicted or refreshed
+        afterwards. Raises ``FileNotFoundError`` if the entry is gone.
+        """
+
+        return await asyncio.to_thread(self._open, key)
+
+    async def fetch(self, key: str, fetcher: ImageFetcher) -> CachedImage:
+        """Fetch ``key`` upstream, sharing the work with concurrent callers."""
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(key, fetcher), name=f"image-cache-fetch-{key[:12]}")
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # A disconnecting client must not cancel a fetch other requests wait on.
+        return await asyncio.shield(task)
+
+    def _refresh_in_background(self, key: str, fetcher: ImageFetcher) -> None:
+        if key in self._inflight:
+            return
+        task = asyncio.create_task(self.fetch(key, fetcher))
+        self._background.add(task)
+        task.add_done_callback(self._background_done)
+
+    def _background_done(self, task: asyncio.Task[Any]) -> None:
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Background image refresh failed: %s", task.exception())
+
+    async def _fetch(self, key: str, fetcher: ImageFetcher) -> CachedImage:
+        previous = await self.lookup(key)
+        body_path = self._body_path(key)
+        temporary = body_path.with_name(f"{body_path.name}.{os.getpid()}.{id(asyncio.current_task())}.tmp")
+        await asyncio.to_thread(body_path.parent.mkdir, parents=True, exist_ok=True)
+        try:
+            metadata = await fetcher(temporary, previous)
+            if metadata is None and previous is not None:
+                await asyncio.to_thread(temporary.unlink, missing_ok=True)
+                return await asyncio.to_thread(self._touch, key)
+            if metadata is None:
+                raise RuntimeError(f"Fetcher returned no metadata for uncached key {key}")
+            entry = await asyncio.to_thread(self._commit, key, temporary, metadata)
+        except BaseException:
+            await asyncio.to_thread(temporary.unlink, missing_ok=True)
+            raise
+
+        self._total_bytes += entry.size - self._entries.pop(key, 0)
+        self._entries[key] = entry.size
+        await self._evict()
+        return entry
+
+    def _commit(self, key: str, temporary: Path, metadata: dict[str, Any]) -> CachedImage:
+        body_path = self._body_path(key)
+        metadata = {**metadata, "size": temporary.stat().st_size, "stored_at": time.time()}
+        meta_temporary = temporary.with_suffix(".meta.tmp")
+        meta_temporary.write_text(json.dumps(metadata), encoding="utf-8")
+        with self._files_lock:
+            os.replace(temporary, body_path)
+            os.replace(meta_temporary, self._meta_path(key))
+        return self._entry(key, metadata)
+
+    def _touch(self, key: str) -> CachedImage:
+        """Mark an unchanged entry as fresh again."""
+
+        meta_path = self._meta_path(key)
+        metadata = {**json.loads(meta_path.read_text(encoding="utf-8")), "stored_at": time.time()}
+        meta_temporary = meta_path.with_name(f"{meta_path.name}.{os.getpid()}.touch.tmp")
+        meta_temporary.write_text(json.dumps(metadata), encoding="utf-8")
+        with self._files_lock:
+            os.replace(meta_temporary, meta_path)
+        return self._entry(key, metadata)
+
+    def _open(self, key: str) -> tuple[CachedImage, BinaryIO]:
+        with self._files_lock:
+            body = self._body_path(key).open("rb")
+            try:
+                entry = self._read_entry(key)
+            except BaseException:
+                body.close()
+                raise
+        return entry, body
+
+    def _read_entry(self, key: str) -> CachedImage:
+        metadata = json.loads(self._meta_path(key).read_text(encoding="utf-8"))
+        return self._entry(key, metadata)
+
+    def _entry(self, key: str, metadata: dict[str, Any]) -> CachedImage:
+        return CachedImage(
+            key=key,
+            path=self._body_path(key),
+            content_type=metadata["content_type"],
+            size=int(metadata["size"]),
+            stored_at=float(metadata["stored_at"]),
+            etag=metadata.get("etag"),
+            last_modified=metadata.get("last_modified"),
+            source_version=metadata.get("source_version"),
+        )
+
+    async def _evict(self) -> None:
+        victims: list[str] = []
+        while self._total_bytes > self._max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            victims.append(key)
+        if victims:
+            await asyncio.to_thread(self._remove_files, victims)
+
+    def _forget(self, key: str) -> None:
+        self._total_bytes -= self._entries.pop(key, 0)
+
+    def _remove_files(self, keys: list[str]) -> None:
+        for key in keys:
+            with self._files_lock:
+                self._meta_path(key).unlink(missing_ok=True)
+                self._body_path(key).unlink(missing_ok=True)
+
+    async def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            entries = await asyncio.to_thread(self._scan)
+            for key, size in entries:
+                self._entries[key] = size
+                self._total_bytes += size
+            self._loaded = True
+            await self._evict()
+
+    def _scan(self) -> list[tuple[str, int]]:
+        """List cached entries, least recently written first."""
+
+        found: list[tuple[float, str, int]] = []
+        if not self._root.is_dir():
+            return []
+        for meta_path in self._root.glob("*/*.json"):
+            key = meta_path.stem
+            try:
+                stat = self._body_path(key).stat()
+            except OSError:
+                meta_path.unlink(missing_ok=True)
+                continue
+            found.append((stat.st_mtime, key, stat.st_size))
+        # Leftovers from fetches interrupted by a restart.
+        for temporary in self._root.glob("*/*.tmp"):
+            temporary.unlink(missing_ok=True)
+        found.sort()
+        return [(key, size) for _, key, size in found]
+
+    def _body_path(self, key: str) -> Path:
+        return self._root / key[:2] / key
+
+    def _meta_path(self, key: str) -> Path:
+        return self._root / key[:2] / f"{key}.json"
+
+
+@lru_cache(maxsize=1)
+def get_image_cache() -> ImageDiskCache:
+    """Provide the process-wide image cache."""
+
+    settings = get_settings()
+    return ImageDiskCache(
+        Path(settings.image_cache_dir),
+        max_bytes=settings.image_cache_max_bytes,
+        ttl=settings.image_cache_ttl_seconds,
+        stale_while_revalidate=settings.image_cache_stale_seconds,
+    )
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import imghdr
+import logging
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, BinaryIO
+from urllib.parse import urlparse
+
+import httpx
+
+from app.core.config import get_settings
+from app.core.metrics import upstream_event_hooks
+from app.services.image_cache import CachedImage, cache_key, get_image_cache
+from app.services.image_transform import ImageVariant, get_image_transformer
+
+logger = logging.getLogger(__name__)
+
+
+class ImageFetchError(RuntimeError):
+    """Raised when an upstream image cannot be fetched or is not an image."""
+
+    def __init__(self, status_code: int, detail: str) -> None:
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+STREAM_CHUNK_SIZE = 64 * 1024
+# Enough leading bytes for imghdr to recognise every format it supports.
+SNIFF_BYTES = 32
+
+UPSTREAM_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Referer": "https://culture.seoul.go.kr/",
+    "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1"
+}
+
+ALLOWED_DOMAINS = [
+    "culture.seoul.go.kr",
+    "data.seoul.go.kr", 
+    "www.seoul.go.kr",
+    "*.seoul.go.kr"
+]
+
+def is_allowed_domain(url: str) -> bool:
+    """Check if the image URL domain is allowed"""
+    try:
+        parsed = urlparse(url)
+        domain = parsed.hostname
+        
+        if not domain:
+            return False
+            
+        # Check exact matches and wildcard matches
+        for allowed in ALLOWED_DOMAINS:
+            if allowed.startswith("*."):
+                # Wildcard domain check
+                allowed_suffix = allowed[2:]  # Remove "*."
+                if domain.endswith(allowed_suffix):
+                    return True
+            elif domain == allowed:
+                return True
+                
+        return False
+    except Exception:
+        return False
+
+
+def image_ttl(url: str) -> float:
+    """Cache lifetime for ``url``, from IMAGE_CACHE_DOMAIN_TTLS when configured."""
+
+    settings = get_settings()
+    domain = urlparse(url).hostname or ""
+    for pattern, ttl in settings.image_cache_domain_ttls.items():
+        if domain == pattern or (pattern.startswith("*.") and domain.endswith(pattern[1:])):
+            return float(ttl)
+    return settings.image_cache_ttl_seconds
+
+
+def response_etag(entry: CachedImage) -> str:
+    """ETag for the served representation.
+
+    Originals forward the upstream ETag; variants and originals without one
+    get an ETag derived from the cache key and the upstream version.
+    """
+
+    if entry.source_version is None and entry.etag:
+        return entry.etag
+    basis = entry.source_version or entry.last_modified or f"{entry.stored_at:.0f}"
+    digest = hashlib.blake2b(f"{entry.key}:{basis}".encode("utf-8"), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def is_not_modified(request_headers: Mapping[str, str], etag: str, last_modified: str | None) -> bool:
+    """Evaluate ``If-None-Match`` / ``If-Modified-Since`` against a cached entry."""
+
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or etag.removeprefix("W/") in candidates
+
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+async def fetch_upstream_image(
+    url: str, timeout: float | None, destination: Path, previous: CachedImage | None = None
+) -> dict[str, Any] | None:
+    """Stream ``url`` into ``destination`` and return its cache metadata.
+
+    Chunks are written as they arrive and the next one is only read once the
+    previous write finished, so memory per request stays at about one chunk.
+    The content type is sniffed from the first bytes when upstream omits it.
+    With a ``previous`` entry the request is conditional, and ``None`` is
+    returned when upstream answers 304 Not Modified.
+    """
+
+    max_bytes = get_settings().image_proxy_max_bytes
+    headers = dict(UPSTREAM_HEADERS)
+    if previous is not None and previous.etag:
+        headers["If-None-Match"] = previous.etag
+    if previous is not None and previous.last_modified:
+        headers["If-Modified-Since"] = previous.last_modified
+
+    async with httpx.AsyncClient(timeout=timeout, event_hooks=upstream_event_hooks()) as client:
+        logger.info(f"Proxying image request: {url}")
+        async with client.stream("GET", url, headers=headers, follow_redirects=True) as response:
+            if response.status_code == 304 and previous is not None:
+                logger.debug("Proxied image not modified upstream", extra={"url": url})
+                return None
+            if response.status_code != 200:
+                logger.error(f"Failed to fetch image: {url} - Status: {response.status_code}")
+                raise ImageFetchError(response.status_code, f"Failed to fetch image: HTTP {response.status_code}")
+
+            content_length = response.headers.get("content-length")
+            if content_length is not None and content_length.isdigit() and int(content_length) > max_bytes:
+                raise _too_large(url)
+
+            content_type = response.headers.get("content-type", "").lower()
+            received = 0
+            head = b""
+            output = await asyncio.to_thread(destination.open, "wb")
+            try:
+                async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                    received += len(chunk)
+                    if received > max_bytes:
+                        raise _too_large(url)
+                    if len(head) < SNIFF_BYTES:
+                        head += chunk[: SNIFF_BYTES - len(head)]
+                        if len(head) == SNIFF_BYTES:
+                            content_type = _checked_content_type(url, content_type, head)
+                    await asyncio.to_thread(output.write, chunk)
+            finally:
+                await asyncio.to_thread(output.close)
+
+    if len(head) < SNIFF_BYTES:
+        content_type = _checked_content_type(url, content_type, head)
+    return {
+        "url": url,
+        "content_type": content_type or "image/jpeg",
+        "etag": response.headers.get("etag"),
+        "last_modified": response.headers.get("last-modified"),
+    }
+
+
+def _checked_content_type(url: str, content_type: str, head: bytes) -> str:
+    if content_type.startswith("image/"):
+        return content_type
+
+    detected_format = imghdr.what(None, head)
+    if detected_format:
+        logger.debug(
+            "Adjusted content-type for proxied image", 
+            extra={"url": url, "detected_format": detected_format}
+        )
+        return f"image/{detected_format}"
+
+    logger.warning(
+        "Non-image content returned from proxy source",
+        extra={"url": url, "content_type": content_type or "<missing>"}
+    )
+    raise ImageFetchError(400, "URL does not return image content")
+
+
+def _too_large(url: str) -> ImageFetchError:
+    logger.warning(f"Proxied image exceeds size limit: {url}")
+    return ImageFetchError(502, "Upstream image exceeds size limit")
+
+
+async def open_image(url: str, variant: ImageVariant, timeout: float | None) -> tuple[CachedImage, BinaryIO]:
+    """Load ``url`` like ``load_image`` and open its body for serving.
+
+    Serving from an open handle keeps the response consistent with its
+    headers even if the entry is evicted or refreshed meanwhile; an entry
+    evicted before it could be opened is loaded once more.
+    """
+
+    cached = await load_image(url, variant, timeout)
+    try:
+        return await get_image_cache().open(cached.key)
+    except FileNotFoundError:
+        cached = await load_image(url, variant, timeout)
+        return await get_image_cache().open(cached.key)
+
+
+async def load_image(url: str, variant: ImageVariant, timeout: float | None) -> CachedImage:
+    """Return the cached original or variant of ``url``, producing it on a miss."""
+
+    cache = get_image_cache()
+    original_key = cache_key(url)
+    ttl = image_ttl(url)
+
+    async def fetch_original(destination: Path, previous: CachedImage | None) -> dict[str, Any] | None:
+        return await fetch_upstream_image(url, timeout, destination, previous)
+
+    if variant.is_original:
+        return await cache.get(original_key, fetch_original, ttl=ttl)
+
+    async def render_variant(destination: Path, previous: CachedImage | None) -> dict[str, Any] | None:
+        original = await cache.get(original_key, fetch_original, ttl=ttl)
+        source_version = response_etag(original)
+        if previous is not None and previous.source_version == source_version:
+            return None
+        content_type = await get_image_transformer().transform(original.path, destination, variant)
+        return {
+            "url": url,
+            "variant": variant.cache_suffix(),
+            "content_type": content_type,
+            "last_modified": original.last_modified,
+            "source_version": source_version,
+        }
+
+    return await cache.get(cache_key(url + variant.cache_suffix()), render_variant, ttl=ttl)
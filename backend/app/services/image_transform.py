@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from pathlib import Path
+from typing import Literal, NamedTuple
+
+from PIL import Image, ImageOps
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+ImageFit = Literal["contain", "cover"]
+ImageFormat = Literal["webp", "avif", "jpeg", "png"]
+
+CONTENT_TYPES: dict[str, str] = {
+    "webp": "image/webp",
+    "avif": "image/avif",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+}
+SAVE_OPTIONS: dict[str, dict[str, object]] = {
+    "webp": {"quality": 80, "method": 4},
+    "avif": {"quality": 60, "speed": 8},
+    "jpeg": {"quality": 82, "optimize": True, "progressive": True},
+    "png": {"optimize": True},
+}
+
+# Posters from the open-data portal can be huge; refuse anything that would
+# decode to more than this many pixels.
+MAX_SOURCE_PIXELS = 50_000_000
+
+
+class ImageTransformError(ValueError):
+    """Raised when a source image cannot be decoded or re-encoded."""
+
+
+class ImageTransformUnavailable(RuntimeError):
+    """Raised when a transform worker died; the pool is rebuilt on the next call."""
+
+
+class ImageVariant(NamedTuple):
+    width: int | None
+    height: int | None
+    fit: ImageFit
+    format: ImageFormat | None
+
+    @property
+    def is_original(self) -> bool:
+        return self.width is None and self.height is None and self.format is None
+
+    def cache_suffix(self) -> str:
+        return f"#w={self.width or ''}&h={self.height or ''}&fit={self.fit}&format={self.format or ''}"
+
+
+def transform_image(source: str, destination: str, variant: ImageVariant) -> str:
+    """Resize and re-encode ``source`` into ``destination``; return its content type.
+
+    Runs inside a worker process. Images are never upscaled; ``cover``
+    crops to fill both dimensions, ``contain`` fits inside them.
+    """
+
+    Image.MAX_IMAGE_PIXELS = MAX_SOURCE_PIXELS
+    try:
+        return _transform(source, destination, variant)
+    except (OSError, ValueError, Image.DecompressionBombError) as exc:
+        # Re-raise as a plain picklable error the event loop side understands.
+        raise ImageTransformError(f"{type(exc).__name__}: {exc}") from None
+
+
+def _transform(source: str, destination: str, variant: ImageVariant) -> str:
+    with Image.open(source) as opened:
+        target_format = variant.format or (opened.format or "jpeg").lower()
+        if target_format not in CONTENT_TYPES:
+            target_format = "jpeg"
+        if variant.width or variant.height:
+            opened.draft("RGB", (variant.width or opened.width, variant.height or opened.height))
+        image = ImageOps.exif_transpose(opened)
+
+        width = min(variant.width or image.width, image.width)
+        height = min(variant.height or image.height, image.height)
+        if variant.fit == "cover" and variant.width and variant.height:
+            image = ImageOps.fit(image, (width, height), Image.Resampling.LANCZOS)
+        elif (width, height) != image.size:
+            image = ImageOps.contain(image, (width, height), Image.Resampling.LANCZOS)
+
+        if target_format == "jpeg" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        elif image.mode not in ("RGB", "RGBA", "L", "LA"):
+            image = image.convert("RGBA")
+        image.save(destination, format=target_format.upper(), **SAVE_OPTIONS[target_format])
+    return CONTENT_TYPES[target_format]
+
+
+class ImageTransformer:
+    """Bounded process pool for CPU-bound image work.
+
+    At most ``max_pending`` transforms are queued or running at once; callers
+    beyond that wait on a semaphore, so a burst cannot queue unbounded work.
+    Workers are spawned rather than forked from the running event loop, and
+    a pool broken by a dying worker is replaced instead of reused.
+    """
+
+    def __init__(self, *, workers: int, max_pending: int) -> None:
+        self._workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._slots = asyncio.Semaphore(max_pending)
+
+    async def transform(self, source: Path, destination: Path, variant: ImageVariant) -> str:
+        async with self._slots:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            executor = self._executor
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(
+                    executor, transform_image, str(source), str(destination), variant
+                )
+            except BrokenProcessPool as exc:
+                if self._executor is executor:
+                    logger.error("Image transform worker died; restarting the pool")
+                    self._executor = None
+                    executor.shutdown(wait=False, cancel_futures=True)
+                raise ImageTransformUnavailable("Image transform worker exited unexpectedly") from exc
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+@lru_cache(maxsize=1)
+def get_image_transformer() -> ImageTransformer:
+    """Provide the process-wide image transformer."""
+
+    settings = get_settings()
+    return ImageTransformer(
+        workers=settings.image_transform_workers,
+        max_pending=settings.image_transform_max_pending,
+    )
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db.models.event import Event, EventRow
+from app.services.image_cache import cache_key, get_image_cache
+from app.services.image_proxy import is_allowed_domain, load_image
+from app.services.image_transform import ImageVariant
+
+logger = logging.getLogger(__name__)
+
+# The original, from which every variant is rendered, plus the proxy width
+# step that event cards and carousels request most (ProxyImage snaps srcset
+# widths to 320/640/960/1280/1920 webp; 640 covers 1x screens).
+WARM_VARIANTS = (
+    ImageVariant(None, None, "contain", None),
+    ImageVariant(640, None, "contain", "webp"),
+)
+
+WARM_TIMEOUT_SECONDS = 30.0
+
+_warming_tasks: set[asyncio.Task[Any]] = set()
+
+
+async def load_image_urls(session: AsyncSession) -> dict[int, str | None]:
+    result = await session.execute(select(Event.id, Event.main_img))
+    return {row.id: row.main_img for row in result}
+
+
+def changed_image_urls(previous: Mapping[int, str | None], rows: Iterable[EventRow]) -> list[str]:
+    """Return allowed ``main_img`` URLs that are new or differ from ``previous``."""
+
+    urls: dict[str, None] = {}
+    for row in rows:
+        url = row.main_img
+        if url and previous.get(row.id) != url and is_allowed_domain(url):
+            urls[url] = None
+    return list(urls)
+
+
+class _BandwidthBudget:
+    """Delay new downloads so the average rate stays under ``bytes_per_second``."""
+
+    def __init__(self, bytes_per_second: float) -> None:
+        self._rate = bytes_per_second
+        self._started = time.monotonic()
+        self._spent = 0
+
+    async def wait(self) -> None:
+        if self._rate <= 0:
+            return
+        delay = self._spent / self._rate - (time.monotonic() - self._started)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def spend(self, size: int) -> None:
+        self._spent += size
+
+
+async def warm_image_cache(urls: Iterable[str], *, concurrency: int, bytes_per_second: float) -> dict[str, int]:
+    """Fetch ``urls`` and their common thumbnails into the image cache.
+
+    Runs at most ``concurrency`` images at a time and paces upstream
+    downloads to ``bytes_per_second``, so live proxy traffic keeps most of
+    the bandwidth and transform workers. Failures are logged and skipped.
+    """
+
+    cache = get_image_cache()
+    budget = _BandwidthBudget(bytes_per_second)
+    slots = asyncio.Semaphore(concurrency)
+    stats = {"warmed": 0, "failed": 0, "downloaded_bytes": 0}
+
+    async def warm(url: str) -> None:
+        async with slots:
+            cached = await cache.lookup(cache_key(url))
+            if cached is None:
+                await budget.wait()
+            try:
+                for variant in WARM_VARIANTS:
+                    entry = await load_image(url, variant, WARM_TIMEOUT_SECONDS)
+                    if cached is None and variant.is_original:
+                        budget.spend(entry.size)
+                        stats["downloaded_bytes"] += entry.size
+            except Exception as exc:
+                stats["failed"] += 1
+                logger.warning("Image warming failed for %s: %s", url, exc)
+                return
+            stats["warmed"] += 1
+
+    await asyncio.gather(*(warm(url) for url in urls))
+    return stats
+
+
+def schedule_image_warming(urls: list[str]) -> int:
+    """Warm ``urls`` in a background task; returns the number queued."""
+
+    if not urls:
+        return 0
+    settings = get_settings()
+    task = asyncio.create_task(
+        warm_image_cache(
+            urls,
+            concurrency=settings.image_warm_concurrency,
+            bytes_per_second=settings.image_warm_bytes_per_second,
+        ),
+        name="image-cache-warming",
+    )
+    _warming_tasks.add(task)
+    task.add_done_callback(_warming_done)
+    return len(urls)
+
+
+def _warming_done(task: asyncio.Task[Any]) -> None:
+    _warming_tasks.discard(task)
+    if task.cancelled():
+        return
+    if task.exception() is not None:
+        logger.warning("Image warming stopped: %s", task.exception())
+    else:
+        logger.info("Image warming finished: %s", task.result())
+
+
+async def cancel_image_warming() -> None:
+    for task in list(_warming_tasks):
+        task.cancel()
+    await asyncio.gather(*_warming_tasks, return_exceptions=True)
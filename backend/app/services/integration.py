@@ -5,6 +5,7 @@ from datetime import date
 from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from app.db.models.event import Event
 from app.db.models.weather import Weather
@@ -18,7 +19,7 @@ async def get_event_with_weather(
 ) -> tuple[Event, Weather | None]:
     """Return an event and the matching weather record, if available."""
 
-    event = await session.get(Event, event_id)
+    event = await session.get(Event, event_id, options=[joinedload(Event.details)])
     if event is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
 
@@ -1,16 +1,79 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Mapping
+import re
+from datetime import date, datetime
+from functools import lru_cache
 
 from dateutil import parser
 
+DATE_CACHE_SIZE = 4096
+
+# Shapes the Seoul API actually sends: "2024-10-18", "2024-10-18 00:00:00.0",
+# "20241018". Anything else goes through the general parsers.
+_DATETIME_SHAPE = re.compile(
+    r"([0-9]{4})-([0-9]{2})-([0-9]{2})(?:[ T]([0-9]{2}):([0-9]{2})(?::([0-9]{2})(?:\.([0-9]{1,6}))?)?)?"
+)
+_DATE_SHAPE = re.compile(r"([0-9]{4})-?([0-9]{2})-?([0-9]{2})")
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _valid_date(year: int, month: int, day: int) -> bool:
+    if not 1 <= month <= 12 or day < 1 or year < 1:
+        return False
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return day <= 29
+    return day <= _DAYS_IN_MONTH[month]
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def match_datetime(value: str) -> datetime | None:
+    """Recognise the API's datetime shapes as a naive datetime, without raising.
+
+    Returns ``None`` for other shapes and out-of-range values so callers can
+    fall back to their general parser. API dumps repeat the same few dates
+    thousands of times, hence the memo cache.
+    """
+
+    match = _DATETIME_SHAPE.fullmatch(value)
+    if match is None:
+        match = _DATE_SHAPE.fullmatch(value)
+        if match is None or "-" in value:
+            return None
+    year, month, day = int(match[1]), int(match[2]), int(match[3])
+    if not _valid_date(year, month, day):
+        return None
+    if match.re is _DATE_SHAPE or match[4] is None:
+        return datetime(year, month, day)
+    hour, minute = int(match[4]), int(match[5])
+    second = int(match[6]) if match[6] else 0
+    if hour > 23 or minute > 59 or second > 59:
+        return None
+    fraction = match[7]
+    microsecond = int(fraction.ljust(6, "0")) if fraction else 0
+    return datetime(year, month, day, hour, minute, second, microsecond)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def match_date(value: str) -> date | None:
+    """Recognise ``YYYY-MM-DD`` and ``YYYYMMDD`` dates, without raising."""
+
+    match = _DATE_SHAPE.fullmatch(value)
+    if match is None or value.count("-") == 1:
+        return None
+    year, month, day = int(match[1]), int(match[2]), int(match[3])
+    if not _valid_date(year, month, day):
+        return None
+    return date(year, month, day)
+
 
 def parse_datetime(value: str | None) -> datetime | None:
     """Parse an ISO-like datetime string from the API into UTC-aware datetime."""
 
     if not value:
         return None
+    parsed = match_datetime(value)
+    if parsed is not None:
+        return parsed.replace(tzinfo=datetime.utcnow().astimezone().tzinfo)
     try:
         dt = parser.parse(value)
     except (ValueError, TypeError):
@@ -18,76 +81,3 @@ def parse_datetime(value: str | None) -> datetime | None:
     if not dt.tzinfo:
         return dt.replace(tzinfo=datetime.utcnow().astimezone().tzinfo)
     return dt.astimezone(tz=None)
-
-
-class EventRecordTransformer:
-    """Transform raw Seoul Open Data API rows into DB-ready dictionaries."""
-
-    EVENT_ID_FIELD = "CODENAME_SEQ"
-
-    def __init__(self, record: Mapping[str, Any]) -> None:
-        self.record = record
-
-    def as_dict(self) -> dict[str, Any]:
-        return {
-            "id": self._int_field("CODENAME_SEQ"),
-            "codename": self._str_field("CODENAME"),
-            "guname": self._str_field("GUNAME"),
-            "title": self._str_field("TITLE", required=True),
-            "date": self._str_field("DATE"),
-            "start_date": parse_datetime(self._str_field("STRTDATE")),
-            "end_date": parse_datetime(self._str_field("END_DATE")),
-            "place": self._str_field("PLACE"),
-            "org_name": self._str_field("ORG_NAME"),
-            "use_trgt": self._str_field("USE_TRGT"),
-            "use_fee": self._str_field("USE_FEE"),
-            "player": self._str_field("PLAYER"),
-            "program": self._str_field("PROGRAM"),
-            "etc_desc": self._str_field("ETC_DESC"),
-            "ticket": self._str_field("TICKET"),
-            "theme_code": self._str_field("THEME_CODE"),
-            "org_link": self._str_field("ORG_LINK"),
-            "main_img": self._str_field("MAIN_IMG"),
-            "hmpg_addr": self._str_field("HMPG_ADDR"),
-            "rgst_date": self._parse_date("RGSTDATE"),
-            "lot": self._float_field("LOT"),
-            "lat": self._float_field("LAT"),
-            "is_free": self._str_field("IS_FREE"),
-        }
-
-    def _str_field(self, key: str, required: bool = False) -> str | None:
-        value = self.record.get(key)
-        if isinstance(value, str):
-            value = value.strip()
-            if value:
-                return value
-        if required:
-            raise ValueError(f"Missing required field: {key}")
-        return None
-
-    def _int_field(self, key: str) -> int:
-        value = self.record.get(key)
-        if isinstance(value, int):
-            return value
-        if isinstance(value, str) and value.isdigit():
-            return int(value)
-        raise ValueError(f"Invalid integer field: {key} -> {value}")
-
-    def _float_field(self, key: str) -> float | None:
-        value = self.record.get(key)
-        if value in (None, ""):
-            return None
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return None
-
-    def _parse_date(self, key: str):
-        value = self.record.get(key)
-        if not value:
-            return None
-        try:
-            dt = parser.parse(str(value)).date()
-        except (ValueError, TypeError):
-            return None
-        return dt
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db.session import async_session_factory
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "user_actions"
+PARTITION_PREFIX = "user_actions_p"
+DEFAULT_PARTITION = "user_actions_default"
+# Every worker runs maintenance from its lifespan; this transaction-level
+# advisory lock makes them take turns instead of racing on CREATE TABLE.
+MAINTENANCE_LOCK_KEY = 0x75615F7061727473  # "ua_parts"
+_PARTITION_NAME = re.compile(rf"^{PARTITION_PREFIX}(\d{{4}})_(\d{{2}})$")
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + (month.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _partition_name(month: date) -> str:
+    return f"{PARTITION_PREFIX}{month.year:04d}_{month.month:02d}"
+
+
+def _current_month(now: datetime | None = None) -> date:
+    now = now or datetime.now(timezone.utc)
+    return date(now.year, now.month, 1)
+
+
+async def list_partitions(session: AsyncSession) -> dict[date, str]:
+    """Return the monthly partitions currently attached to ``user_actions``."""
+
+    result = await session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :parent"
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    partitions: dict[date, str] = {}
+    for name in result.scalars().all():
+        match = _PARTITION_NAME.match(name)
+        if match:
+            partitions[date(int(match.group(1)), int(match.group(2)), 1)] = name
+    return partitions
+
+
+async def create_partition(session: AsyncSession, month: date) -> str:
+    """Create the partition for ``month``, moving its rows out of the default partition.
+
+    Postgres refuses to add a partition whose range already has rows in the
+    DEFAULT partition, so the table is built detached, filled from the
+    default partition, and then attached.
+    """
+
+    name = _partition_name(month)
+    upper_month = _add_months(month, 1)
+    lower = datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+    upper = datetime(upper_month.year, upper_month.month, 1, tzinfo=timezone.utc)
+    await session.execute(
+        text(f'CREATE TABLE "{name}" (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+    )
+    moved = await session.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+            f"WHERE timestamp >= :lower AND timestamp < :upper RETURNING *) "
+            f'INSERT INTO "{name}" SELECT * FROM moved'
+        ),
+        {"lower": lower, "upper": upper},
+    )
+    if moved.rowcount:
+        logger.info("Moved %d rows from %s into %s", moved.rowcount, DEFAULT_PARTITION, name)
+    await session.execute(
+        text(
+            f'ALTER TABLE {PARENT_TABLE} ATTACH PARTITION "{name}" '
+            f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+    )
+    return name
+
+
+async def ensure_future_partitions(session: AsyncSession, *, months_ahead: int) -> list[str]:
+    """Create any missing partitions from the current month to ``months_ahead``.
+
+    Holds the maintenance advisory lock until the caller's transaction ends,
+    and only then reads the existing partitions, so a worker that waited
+    sees what the previous holder created.
+    """
+
+    await session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY})
+    existing = await list_partitions(session)
+    created: list[str] = []
+    current = _current_month()
+    for offset in range(months_ahead + 1):
+        month = _add_months(current, offset)
+        if month not in existing:
+            created.append(await create_partition(session, month))
+    return created
+
+
+async def drop_expired_partitions(session: AsyncSession, *, retention_months: int) -> list[str]:
+    """Detach and drop partitions that lie entirely before the retention cutoff.
+
+    Dropping a whole partition is a metadata operation, unlike ``DELETE``,
+    which would leave dead tuples for vacuum to clean up.
+    """
+
+    cutoff = _add_months(_current_month(), -retention_months)
+    dropped: list[str] = []
+    for month, name in sorted((await list_partitions(session)).items()):
+        if _add_months(month, 1) > cutoff:
+            continue
+        await session.execute(text(f'ALTER TABLE {PARENT_TABLE} DETACH PARTITION "{name}"'))
+        await session.execute(text(f'DROP TABLE "{name}"'))
+        dropped.append(name)
+    return dropped
+
+
+async def purge_expired_default_rows(session: AsyncSession, *, retention_months: int) -> int:
+    """Delete rows in the default partition that are older than the retention cutoff."""
+
+    cutoff = _add_months(_current_month(), -retention_months)
+    result = await session.execute(
+        text(f"DELETE FROM {DEFAULT_PARTITION} WHERE timestamp < :cutoff"),
+        {"cutoff": datetime(cutoff.year, cutoff.month, 1, tzinfo=timezone.utc)},
+    )
+    return max(result.rowcount or 0, 0)
+
+
+async def run_partition_maintenance() -> dict[str, list[str] | int]:
+    """Create upcoming partitions and apply the configured retention policy."""
+
+    settings = get_settings()
+    async with async_session_factory() as session:
+        created = await ensure_future_partitions(session, months_ahead=settings.user_actions_partitions_ahead)
+        dropped: list[str] = []
+        purged = 0
+        if settings.user_actions_retention_months:
+            dropped = await drop_expired_partitions(
+                session, retention_months=settings.user_actions_retention_months
+            )
+            purged = await purge_expired_default_rows(
+                session, retention_months=settings.user_actions_retention_months
+            )
+        pending = (await session.execute(text(f"SELECT count(*) FROM {DEFAULT_PARTITION}"))).scalar_one()
+        await session.commit()
+
+    if created or dropped or purged:
+        logger.info("user_actions partitions created=%s dropped=%s default_purged=%d", created, dropped, purged)
+    if pending:
+        logger.warning("%d user_actions rows are outside the monthly partitions (in %s)", pending, DEFAULT_PARTITION)
+    return {"created": created, "dropped": dropped, "default_purged": purged, "default_rows": pending}
+
+
+async def partition_maintenance_loop() -> None:
+    """Run partition maintenance periodically until cancelled."""
+
+    interval = get_settings().partition_maintenance_interval_hours * 3600
+    while True:
+        try:
+            await run_partition_maintenance()
+        except Exception:  # pragma: no cover - database failure
+            logger.exception("user_actions partition maintenance failed")
+        await asyncio.sleep(interval)
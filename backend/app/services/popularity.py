@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import math
+import time
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from datetime import datetime, timedelta, timezone
+from typing import Any, Literal
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.action_counter import ActionCounter
+
+PopularityWindow = Literal["1h", "24h", "7d", "all"]
+
+WINDOW_DELTAS: dict[str, timedelta] = {
+    "1h": timedelta(hours=1),
+    "24h": timedelta(hours=24),
+    "7d": timedelta(days=7),
+}
+
+CACHE_TTL_SECONDS = 60.0
+
+
+def bucket_start(timestamp: datetime) -> datetime:
+    """Truncate a timestamp to the start of its UTC hour bucket."""
+
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+async def record_action_counts(session: AsyncSession, rows: Iterable[Mapping[str, Any]]) -> None:
+    """Add freshly ingested actions to the hourly counters.
+
+    Runs inside the caller's transaction so counters and raw rows commit
+    together. Keys are written in sorted order to keep concurrent flushes
+    from deadlocking on each other.
+    """
+
+    counts = Counter(
+        (row["action_type"], bucket_start(row["timestamp"]), row["target_id"])
+        for row in rows
+        if row.get("target_id") is not None
+    )
+    if not counts:
+        return
+
+    values = [
+        {"action_type": action_type, "bucket_start": bucket, "target_id": target_id, "count": count}
+        for (action_type, bucket, target_id), count in sorted(counts.items())
+    ]
+    insert_stmt = insert(ActionCounter).values(values)
+    statement = insert_stmt.on_conflict_do_update(
+        index_elements=[ActionCounter.action_type, ActionCounter.bucket_start, ActionCounter.target_id],
+        set_={"count": ActionCounter.count + insert_stmt.excluded.count},
+    )
+    await session.execute(statement)
+
+
+class PopularityCache:
+    """Top-K results kept in memory until the next ingestion flush.
+
+    Entries also expire after ``ttl`` seconds because windowed rankings
+    drift as time passes even without new actions.
+    """
+
+    def __init__(self, ttl: float = CACHE_TTL_SECONDS) -> None:
+        self._ttl = ttl
+        self._entries: dict[tuple, tuple[float, list[dict[str, Any]]]] = {}
+
+    def get(self, key: tuple) -> list[dict[str, Any]] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self._ttl:
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: tuple, value: list[dict[str, Any]]) -> None:
+        self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self) -> None:
+        self._entries.clear()
+
+
+popularity_cache = PopularityCache()
+
+
+async def get_popular_targets(
+    session: AsyncSession,
+    *,
+    action_type: str,
+    window: PopularityWindow,
+    limit: int,
+    half_life_hours: float | None = None,
+) -> list[dict[str, Any]]:
+    """Rank targets by counter totals, optionally with exponential time decay."""
+
+    cache_key = (action_type, window, limit, half_life_hours)
+    cached = popularity_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    hits = func.sum(ActionCounter.count)
+    if half_life_hours:
+        now = datetime.now(timezone.utc)
+        age_hours = func.extract("epoch", now - ActionCounter.bucket_start) / 3600.0
+        score = func.sum(ActionCounter.count * func.exp(-math.log(2) * age_hours / half_life_hours))
+    else:
+        score = hits
+
+    statement = (
+        select(ActionCounter.target_id, hits.label("hits"), score.label("score"))
+        .where(ActionCounter.action_type == action_type)
+        .group_by(ActionCounter.target_id)
+        .order_by(score.desc(), ActionCounter.target_id.asc())
+        .limit(limit)
+    )
+    delta = WINDOW_DELTAS.get(window)
+    if delta is not None:
+        statement = statement.where(ActionCounter.bucket_start >= bucket_start(datetime.now(timezone.utc) - delta))
+
+    result = await session.execute(statement)
+    ranking = [
+        {"target_id": row.target_id, "action_count": int(row.hits), "score": float(row.score)}
+        for row in result.all()
+    ]
+    popularity_cache.set(cache_key, ranking)
+    return ranking
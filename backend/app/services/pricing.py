@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import re
+from typing import NamedTuple
+
+
+class PriceInfo(NamedTuple):
+    """Structured price summary extracted from the free-text fee fields."""
+
+    is_free: bool
+    min_price: int | None
+    max_price: int | None
+    # What costs extra for partially paid events, e.g. "재료비" or "체험 프로그램".
+    note: str | None = None
+
+
+_UNIT_MULTIPLIERS = {"만": 10000, "천": 1000}
+
+_ANY_WON_PATTERN = re.compile(r"\d+\s*원")
+_COMMA_PRICE_PATTERN = re.compile(r"(\d{1,3}(?:,\d{3})+)\s*원")
+_UNIT_PRICE_PATTERN = re.compile(r"(\d+)\s*(만|천)\s*원")
+_PLAIN_PRICE_PATTERN = re.compile(r"(\d{4,})\s*원")
+
+_SEAT_TYPE = r"([VIPRS석]+|전석|일반석|프리미엄석)"
+_SEAT_UNIT_PATTERN = re.compile(_SEAT_TYPE + r"\s*(\d+)\s*(만|천)\s*원")
+_SEAT_COMMA_PATTERN = re.compile(_SEAT_TYPE + r"\s*(\d{1,3}(?:,\d{3})+)\s*원")
+_SEAT_PLAIN_PATTERN = re.compile(_SEAT_TYPE + r"\s*(\d{4,})\s*원")
+
+_PROMOTION_PATTERN = re.compile(
+    r"(할인|오픈기념할인|특가)\s*:\s*(\d{1,3}(?:,\d{3})+|\d+)\s*원?\s*\(\s*정가\s*(\d{1,3}(?:,\d{3})+|\d+)\s*원\s*\)"
+)
+_UNIT_RANGE_PATTERN = re.compile(r"(\d+)\s*(만|천)\s*원\s*[-~]\s*(\d+)\s*(만|천)\s*원")
+_RANGE_PATTERN = re.compile(r"(\d{1,3}(?:,\d{3})*)\s*원?\s*[-~]\s*(\d{1,3}(?:,\d{3})*)\s*원")
+
+_PARTIAL_PAID_PATTERNS = (
+    re.compile(r"일부\s*유료\s*\(([^)]+)\)"),
+    re.compile(r"별도\s*비용\s*\(([^)]+)\)"),
+    re.compile(r"추가\s*비용\s*\(([^)]+)\)"),
+    re.compile(r"(재료비|교재비|체험비)\s*별도"),
+    re.compile(r"(재료비|교재비|체험비|입장료)\s*:\s*([^,\n]+)"),
+    re.compile(r"\*\s*([^:]+)\s*:\s*([^/\n]+)"),
+)
+
+PRICE_NOTE_MAX_LENGTH = 255
+
+_FREE_INDICATORS = ("무료", "free", "0원", "입장료 없음", "참가비 없음", "관람료 없음")
+_PARTIAL_PAID_INDICATORS = ("일부 유료", "별도 비용", "추가 비용", "재료비", "교재비", "체험비")
+_FREE_FLAGS = {"무료", "free"}
+
+
+def _to_int(digits: str) -> int:
+    return int(digits.replace(",", ""))
+
+
+def _text_says_free(text: str) -> bool:
+    normalized = text.lower().strip()
+    if any(indicator in normalized for indicator in _PARTIAL_PAID_INDICATORS):
+        return False
+    return any(indicator in normalized for indicator in _FREE_INDICATORS)
+
+
+def _seat_prices(text: str) -> list[int]:
+    prices: list[int] = []
+    for match in _SEAT_UNIT_PATTERN.finditer(text):
+        prices.append(int(match.group(2)) * _UNIT_MULTIPLIERS[match.group(3)])
+    for pattern in (_SEAT_COMMA_PATTERN, _SEAT_PLAIN_PATTERN):
+        for match in pattern.finditer(text):
+            prices.append(_to_int(match.group(2)))
+    return [price for price in prices if price > 0]
+
+
+def _range_price(text: str) -> tuple[int, int] | None:
+    match = _UNIT_RANGE_PATTERN.search(text)
+    if match:
+        low = int(match.group(1)) * _UNIT_MULTIPLIERS[match.group(2)]
+        high = int(match.group(3)) * _UNIT_MULTIPLIERS[match.group(4)]
+        return min(low, high), max(low, high)
+
+    match = _RANGE_PATTERN.search(text)
+    if match:
+        low = _to_int(match.group(1))
+        high = _to_int(match.group(2))
+        return min(low, high), max(low, high)
+    return None
+
+
+def _partial_paid_note(text: str) -> str | None:
+    for pattern in _PARTIAL_PAID_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            note = next((group for group in match.groups() if group), match.group(0))
+            return note.strip()[:PRICE_NOTE_MAX_LENGTH]
+    return None
+
+
+def _individual_prices(text: str) -> list[int]:
+    prices = [_to_int(match.group(1)) for match in _COMMA_PRICE_PATTERN.finditer(text)]
+    prices = [price for price in prices if price > 0]
+    prices.extend(
+        int(match.group(1)) * _UNIT_MULTIPLIERS[match.group(2)]
+        for match in _UNIT_PRICE_PATTERN.finditer(text)
+    )
+    for match in _PLAIN_PRICE_PATTERN.finditer(text):
+        price = int(match.group(1))
+        if price > 0 and price not in prices:
+            prices.append(price)
+    return prices
+
+
+def parse_price_info(use_fee: str | None, ticket: str | None, is_free_flag: str | None) -> PriceInfo:
+    """Extract a normalised price range from the Seoul API fee fields.
+
+    Mirrors the heuristics the frontend used to run on every render so the
+    result can be stored once per sync. Free events are stored with a 0..0
+    range so that price filters and sorting treat them as the cheapest option.
+    """
+
+    raw_text = " ".join(part for part in (use_fee, ticket) if part).strip()
+    flag_free = (is_free_flag or "").strip() in _FREE_FLAGS
+
+    if flag_free or (_text_says_free(raw_text) and not _ANY_WON_PATTERN.search(raw_text)):
+        return PriceInfo(is_free=True, min_price=0, max_price=0)
+
+    match = _PROMOTION_PATTERN.search(raw_text)
+    if match:
+        return PriceInfo(is_free=False, min_price=_to_int(match.group(2)), max_price=_to_int(match.group(3)))
+
+    seat_prices = _seat_prices(raw_text)
+    if seat_prices:
+        return PriceInfo(is_free=False, min_price=min(seat_prices), max_price=max(seat_prices))
+
+    price_range = _range_price(raw_text)
+    if price_range is not None:
+        return PriceInfo(is_free=False, min_price=price_range[0], max_price=price_range[1])
+
+    note = _partial_paid_note(raw_text)
+    if note is not None:
+        return PriceInfo(is_free=False, min_price=None, max_price=None, note=note)
+
+    prices = _individual_prices(raw_text)
+    if not prices:
+        return PriceInfo(is_free=False, min_price=None, max_price=None)
+    return PriceInfo(is_free=False, min_price=min(prices), max_price=max(prices))
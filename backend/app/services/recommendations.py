@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy import String, case, cast, delete, func, insert, literal, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db.models.event import Event
+from app.db.models.event_relation import EventRelation
+from app.db.models.user_action import UserAction
+
+# Relative strength of each interaction when building the user x event matrix.
+ACTION_WEIGHTS: dict[str, float] = {"view": 1.0, "click": 2.0, "favorite": 4.0}
+
+# Users touching more events than this are almost always crawlers; they add
+# O(n^2) pairs to the co-occurrence product while carrying little signal.
+MAX_EVENTS_PER_USER = 500
+
+INSERT_CHUNK_SIZE = 1000
+
+
+async def load_interactions(
+    session: AsyncSession, *, since: datetime
+) -> tuple[list[str], list[int], list[float]]:
+    """Return (user key, event id, weight) triples aggregated per user and event.
+
+    Signed-in users are keyed by ``user_id``; anonymous actions fall back to
+    ``metadata.session_id`` and are skipped when neither is present.
+    """
+
+    user_key = func.coalesce(
+        literal("u:") + cast(UserAction.user_id, String),
+        literal("s:") + UserAction.metadata_json["session_id"].astext,
+    )
+    weight = case(ACTION_WEIGHTS, value=UserAction.action_type, else_=0.0)
+    statement = (
+        select(user_key.label("user_key"), UserAction.target_id, func.sum(weight).label("weight"))
+        .join(Event, Event.id == UserAction.target_id)
+        .where(
+            UserAction.action_type.in_(ACTION_WEIGHTS),
+            UserAction.timestamp >= since,
+            user_key.isnot(None),
+        )
+        .group_by(literal_column("user_key"), UserAction.target_id)
+    )
+    result = await session.execute(statement)
+
+    user_keys: list[str] = []
+    event_ids: list[int] = []
+    weights: list[float] = []
+    for row in result:
+        user_keys.append(row.user_key)
+        event_ids.append(row.target_id)
+        weights.append(float(row.weight))
+    return user_keys, event_ids, weights
+
+
+def build_related_pairs(
+    user_keys: Sequence[str],
+    event_ids: Sequence[int],
+    weights: Sequence[float],
+    *,
+    top_n: int,
+) -> list[tuple[int, int, int, float]]:
+    """Compute the top-N cosine neighbours of every event.
+
+    Builds a sparse user x event matrix (log-damped weights), multiplies it
+    by its transpose to get item-item co-occurrence, normalises to cosine
+    similarity and keeps the best ``top_n`` entries per row. Returns
+    ``(event_id, rank, related_event_id, score)`` tuples.
+    """
+
+    if not event_ids:
+        return []
+
+    users, user_index = np.unique(np.asarray(user_keys, dtype=object), return_inverse=True)
+    items, item_index = np.unique(np.asarray(event_ids, dtype=np.int64), return_inverse=True)
+    values = np.log1p(np.asarray(weights, dtype=np.float64))
+
+    matrix = sparse.csr_matrix((values, (user_index, item_index)), shape=(len(users), len(items)))
+    events_per_user = np.diff(matrix.indptr)
+    if (events_per_user > MAX_EVENTS_PER_USER).any():
+        keep = sparse.diags((events_per_user <= MAX_EVENTS_PER_USER).astype(np.float64))
+        matrix = (keep @ matrix).tocsr()
+        matrix.eliminate_zeros()
+
+    cooccurrence = (matrix.T @ matrix).tocsr()
+    norms = np.sqrt(cooccurrence.diagonal())
+    inverse_norms = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+    scale = sparse.diags(inverse_norms)
+    similarity = (scale @ cooccurrence @ scale).tocsr()
+    similarity.setdiag(0)
+    similarity.eliminate_zeros()
+
+    pairs: list[tuple[int, int, int, float]] = []
+    indptr, indices, data = similarity.indptr, similarity.indices, similarity.data
+    for row in range(similarity.shape[0]):
+        start, end = indptr[row], indptr[row + 1]
+        if start == end:
+            continue
+        scores = data[start:end]
+        columns = indices[start:end]
+        if len(scores) > top_n:
+            candidates = np.argpartition(-scores, top_n)[:top_n]
+        else:
+            candidates = np.arange(len(scores))
+        ordered = candidates[np.lexsort((items[columns[candidates]], -scores[candidates]))]
+        event_id = int(items[row])
+        for rank, position in enumerate(ordered, start=1):
+            pairs.append((event_id, rank, int(items[columns[position]]), float(scores[position])))
+    return pairs
+
+
+async def rebuild_event_relations(session: AsyncSession) -> dict[str, int]:
+    """Recompute and replace the precomputed related-events table."""
+
+    settings = get_settings()
+    since = datetime.now(timezone.utc) - timedelta(days=settings.related_events_lookback_days)
+    user_keys, event_ids, weights = await load_interactions(session, since=since)
+
+    # The sparse products are CPU-bound; keep them off the event loop.
+    pairs = await asyncio.to_thread(
+        build_related_pairs, user_keys, event_ids, weights, top_n=settings.related_events_top_n
+    )
+
+    await session.execute(delete(EventRelation))
+    values = [
+        {"event_id": event_id, "rank": rank, "related_event_id": related_id, "score": score}
+        for event_id, rank, related_id, score in pairs
+    ]
+    for index in range(0, len(values), INSERT_CHUNK_SIZE):
+        await session.execute(insert(EventRelation).values(values[index : index + INSERT_CHUNK_SIZE]))
+    await session.commit()
+
+    return {
+        "interactions": len(event_ids),
+        "events": len({pair[0] for pair in pairs}),
+        "relations": len(pairs),
+    }
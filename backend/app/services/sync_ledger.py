@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.tracing import describe_error, start_span
+from app.db.models.sync_run import SyncRun
+from app.db.session import async_session_factory
+
+logger = logging.getLogger(__name__)
+
+
+class SyncRunRecorder:
+    """Collect stage timings and volume counters for one sync run."""
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self.started_at = datetime.now(timezone.utc)
+        self.stage_durations_ms: dict[str, int] = {}
+        self.pages = 0
+        self.rows_fetched = 0
+        self.rows_upserted = 0
+        self.bytes_downloaded = 0
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str, **attributes: Any) -> Iterator[None]:
+        """Time a pipeline stage; repeated stages accumulate."""
+
+        started = time.perf_counter()
+        try:
+            with start_span(f"sync_{self.kind}.{name}", **attributes):
+                yield
+        finally:
+            elapsed_ms = round((time.perf_counter() - started) * 1000)
+            self.stage_durations_ms[name] = self.stage_durations_ms.get(name, 0) + elapsed_ms
+
+    def page(self, size_bytes: int) -> None:
+        self.pages += 1
+        self.bytes_downloaded += size_bytes
+
+    def to_row(self, error: str | None) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "status": "failed" if error else "success",
+            "started_at": self.started_at,
+            "finished_at": datetime.now(timezone.utc),
+            "duration_ms": round((time.perf_counter() - self._started) * 1000),
+            "stage_durations_ms": self.stage_durations_ms,
+            "pages": self.pages,
+            "rows_fetched": self.rows_fetched,
+            "rows_upserted": self.rows_upserted,
+            "bytes_downloaded": self.bytes_downloaded,
+            "error": error,
+        }
+
+
+@asynccontextmanager
+async def track_sync_run(kind: str) -> AsyncIterator[SyncRunRecorder]:
+    """Record the wrapped sync in the ``sync_runs`` ledger, whether it succeeds or fails.
+
+    The row is written in its own session so a failed sync transaction
+    cannot prevent it from being stored.
+    """
+
+    recorder = SyncRunRecorder(kind)
+    error: str | None = None
+    try:
+        yield recorder
+    except BaseException as exc:
+        error = describe_error(exc)
+        raise
+    finally:
+        try:
+            async with async_session_factory() as session:
+                session.add(SyncRun(**recorder.to_row(error)))
+                await session.commit()
+        except Exception:
+            logger.exception("Could not record %s sync run", kind)
+
+
+async def list_sync_runs(session: AsyncSession, *, kind: str | None, limit: int) -> list[SyncRun]:
+    statement = select(SyncRun).order_by(SyncRun.started_at.desc()).limit(limit)
+    if kind:
+        statement = statement.where(SyncRun.kind == kind)
+    result = await session.execute(statement)
+    return list(result.scalars().all())
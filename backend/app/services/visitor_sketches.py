@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.event import Event
+from app.db.models.event_visitor_sketch import EventVisitorSketch
+
+KST = timezone(timedelta(hours=9))
+
+# 2^11 one-byte registers: 2 KiB per event-day, ~2.3% standard error.
+PRECISION = 11
+REGISTER_COUNT = 1 << PRECISION
+
+VISITOR_ACTION_TYPES = frozenset({"view"})
+
+
+class HyperLogLog:
+    """Mergeable distinct-count sketch over 64-bit hashes."""
+
+    __slots__ = ("registers",)
+
+    def __init__(self, registers: np.ndarray | None = None) -> None:
+        self.registers = registers if registers is not None else np.zeros(REGISTER_COUNT, dtype=np.uint8)
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> HyperLogLog:
+        return cls(np.frombuffer(payload, dtype=np.uint8).copy())
+
+    def to_bytes(self) -> bytes:
+        return self.registers.tobytes()
+
+    def add(self, key: str) -> None:
+        hashed = int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+        index = hashed >> (64 - PRECISION)
+        remainder = hashed & ((1 << (64 - PRECISION)) - 1)
+        rank = (64 - PRECISION) - remainder.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: HyperLogLog | bytes) -> None:
+        other_registers = (
+            np.frombuffer(other, dtype=np.uint8) if isinstance(other, bytes) else other.registers
+        )
+        np.maximum(self.registers, other_registers, out=self.registers)
+
+    def estimate(self) -> int:
+        m = float(REGISTER_COUNT)
+        alpha = 0.7213 / (1.0 + 1.079 / m)
+        raw = alpha * m * m / float(np.sum(np.ldexp(1.0, -self.registers.astype(np.int32))))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return int(round(m * np.log(m / zeros)))
+        return int(round(raw))
+
+
+def visitor_key(row: Mapping[str, Any]) -> str | None:
+    """Identify the visitor behind an action row, if it carries any identity."""
+
+    if row.get("user_id") is not None:
+        return f"u:{row['user_id']}"
+    metadata = row.get("metadata_json") or {}
+    for key in ("session_id", "anonymous_id"):
+        value = metadata.get(key)
+        if value:
+            return f"s:{value}"
+    return None
+
+
+def _kst_day(timestamp: datetime) -> date:
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(KST).date()
+
+
+async def record_visitor_sketches(session: AsyncSession, rows: Iterable[Mapping[str, Any]]) -> None:
+    """Fold ingested view actions into the per-event daily sketches.
+
+    Batch sketches are merged into stored ones by the ``hll_merge`` SQL
+    function in the upsert, so concurrent flushes never lose registers.
+    """
+
+    sketches: dict[tuple[int, date], HyperLogLog] = {}
+    for row in rows:
+        if row["action_type"] not in VISITOR_ACTION_TYPES or row.get("target_id") is None:
+            continue
+        visitor = visitor_key(row)
+        if visitor is None:
+            continue
+        key = (row["target_id"], _kst_day(row["timestamp"]))
+        sketch = sketches.get(key)
+        if sketch is None:
+            sketch = sketches[key] = HyperLogLog()
+        sketch.add(visitor)
+    if not sketches:
+        return
+
+    # Sketches reference events, and a foreign-key failure would abort the
+    # caller's whole ingestion transaction, so drop unknown targets first.
+    target_ids = {event_id for event_id, _ in sketches}
+    result = await session.execute(select(Event.id).where(Event.id.in_(target_ids)))
+    known_ids = set(result.scalars().all())
+
+    values = [
+        {"event_id": event_id, "day": day, "registers": sketch.to_bytes()}
+        for (event_id, day), sketch in sorted(sketches.items())
+        if event_id in known_ids
+    ]
+    if not values:
+        return
+
+    insert_stmt = insert(EventVisitorSketch).values(values)
+    statement = insert_stmt.on_conflict_do_update(
+        index_elements=[EventVisitorSketch.event_id, EventVisitorSketch.day],
+        set_={"registers": func.hll_merge(EventVisitorSketch.registers, insert_stmt.excluded.registers)},
+    )
+    await session.execute(statement)
+
+
+async def estimate_unique_visitors(
+    session: AsyncSession,
+    *,
+    event_ids: Sequence[int],
+    guname: str | None,
+    date_from: date,
+    date_to: date,
+) -> dict[str, int]:
+    """Merge stored sketches for the selection and estimate distinct visitors.
+
+    Rows are streamed and folded into a single register array, so memory
+    stays constant regardless of how many event-days are selected.
+    """
+
+    statement = select(EventVisitorSketch.registers).where(
+        EventVisitorSketch.day >= date_from, EventVisitorSketch.day <= date_to
+    )
+    if event_ids:
+        statement = statement.where(EventVisitorSketch.event_id.in_(event_ids))
+    if guname:
+        statement = statement.join(Event, Event.id == EventVisitorSketch.event_id).where(Event.guname == guname)
+
+    merged = HyperLogLog()
+    sketch_count = 0
+    stream = await session.stream_scalars(statement.execution_options(yield_per=500))
+    async for registers in stream:
+        merged.merge(registers)
+        sketch_count += 1
+
+    return {"unique_visitors": merged.estimate(), "sketches": sketch_count}
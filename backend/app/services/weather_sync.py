@@ -11,7 +11,10 @@ from httpx import RequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
+from app.core.metrics import record_upstream_error, upstream_event_hooks
+from app.core.tracing import describe_error, start_span
 from app.repositories import WeatherRepository
+from app.services.sync_ledger import SyncRunRecorder, track_sync_run
 
 KST = timezone(timedelta(hours=9))
 KMA_BASE_HOURS = (2, 5, 8, 11, 14, 17, 20, 23)
@@ -43,6 +46,7 @@ async def fetch_short_term_forecast(
     base_time: str,
     nx: int,
     ny: int,
+    recorder: SyncRunRecorder | None = None,
 ) -> list[Mapping[str, Any]]:
     settings = get_settings()
 
@@ -58,11 +62,17 @@ async def fetch_short_term_forecast(
     }
 
     url = f"{settings.kma_api_base}/getVilageFcst"
-    try:
-        response = await client.get(url, params=params, timeout=30.0)
-    except RequestError as exc:  # pragma: no cover - network failure
-        raise WeatherSyncError(f"기상청 API 호출 실패: {exc}") from exc
+    with start_span("kma.getVilageFcst", kind="client", nx=nx, ny=ny, base_date=base_date) as span:
+        try:
+            response = await client.get(url, params=params, timeout=30.0)
+        except RequestError as exc:  # pragma: no cover - network failure
+            record_upstream_error("kma")
+            raise WeatherSyncError(f"기상청 API 호출 실패: {describe_error(exc)}") from exc
+        if span is not None:
+            span.set(**{"http.status_code": response.status_code, "http.response_size": len(response.content)})
     response.raise_for_status()
+    if recorder is not None:
+        recorder.page(len(response.content))
 
     payload = response.json()
     response_body = payload.get("response", {}).get("body", {})
@@ -148,19 +158,29 @@ async def sync_weather(
 
     base_date, base_time, _ = _determine_base_datetime(base_datetime)
 
-    async with httpx.AsyncClient(verify=settings.external_api_verify_ssl) as client:
-        items = await fetch_short_term_forecast(
-            client,
-            base_date=base_date,
-            base_time=base_time,
-            nx=nx_value,
-            ny=ny_value,
-        )
-
-    payloads = transform_forecast(items, location=loc)
-
-    repository = WeatherRepository(session)
-    processed = await repository.upsert_many(payloads)
+    async with track_sync_run("weather") as recorder:
+        with recorder.stage("fetch"):
+            async with httpx.AsyncClient(
+                verify=settings.external_api_verify_ssl,
+                event_hooks=upstream_event_hooks("kma"),
+            ) as client:
+                items = await fetch_short_term_forecast(
+                    client,
+                    base_date=base_date,
+                    base_time=base_time,
+                    nx=nx_value,
+                    ny=ny_value,
+                    recorder=recorder,
+                )
+        recorder.rows_fetched = len(items)
+
+        with recorder.stage("transform", items=len(items)):
+            payloads = transform_forecast(items, location=loc)
+
+        with recorder.stage("upsert", rows=len(payloads)):
+            repository = WeatherRepository(session)
+            processed = await repository.upsert_many(payloads)
+        recorder.rows_upserted = processed
 
     return {
         "fetched": len(items),
@@ -0,0 +1 @@
+"""Reproducible load benchmarks for the Seoul Now API (not part of the app)."""
@@ -0,0 +1,49 @@
+"""Compare two saved benchmark results.
+
+    python -m benchmarks.compare benchmarks/results/before.json benchmarks/results/after.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+METRICS = ("throughput_rps", "p50_ms", "p95_ms", "p99_ms")
+
+
+def _change(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("before", type=Path)
+    parser.add_argument("after", type=Path)
+    args = parser.parse_args()
+
+    before = json.loads(args.before.read_text(encoding="utf-8"))
+    after = json.loads(args.after.read_text(encoding="utf-8"))
+    print(f"before: {before.get('label')} @ {before.get('git_sha')}   after: {after.get('label')} @ {after.get('git_sha')}")
+    if before.get("config") != after.get("config"):
+        print("warning: runs used different configurations")
+
+    header = f"{'scenario':<28}" + "".join(f"{metric:>24}" for metric in METRICS)
+    print(header)
+    print("-" * len(header))
+    rows = [(name, before["scenarios"].get(name), after["scenarios"].get(name)) for name in after["scenarios"]]
+    if "total" in before and "total" in after:
+        rows.append(("TOTAL", before["total"], after["total"]))
+    for name, old, new in rows:
+        if old is None or new is None:
+            continue
+        cells = "".join(
+            f"{f'{old[m]:.1f} -> {new[m]:.1f} ({_change(old[m], new[m])})':>24}" for m in METRICS
+        )
+        print(f"{name:<28}{cells}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Deterministic synthetic dataset shaped like the Seoul cultural events feed."""
+
+from __future__ import annotations
+
+import json
+import random
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta, timezone
+from itertools import accumulate
+
+# Rough shares observed in culturalEventInfo: central districts dominate.
+DISTRICTS: dict[str, float] = {
+    "종로구": 14, "중구": 12, "마포구": 8, "강남구": 7, "서초구": 7, "용산구": 6, "송파구": 5,
+    "영등포구": 4, "성동구": 4, "광진구": 3, "서대문구": 3, "성북구": 3, "강동구": 3, "노원구": 2,
+    "동대문구": 2, "은평구": 2, "관악구": 2, "구로구": 2, "양천구": 2, "강서구": 2, "동작구": 2,
+    "중랑구": 1, "도봉구": 1, "강북구": 1, "금천구": 1,
+}
+CATEGORIES: dict[str, float] = {
+    "전시/미술": 30, "교육/체험": 18, "클래식": 9, "콘서트": 7, "연극": 7, "뮤지컬/오페라": 5,
+    "국악": 4, "무용": 3, "독주/독창회": 3, "영화": 3, "축제-문화/예술": 3, "축제-전통/역사": 2,
+    "축제-자연/경관": 2, "축제-시민화합": 1, "축제-기타": 1, "기타": 2,
+}
+THEMES = ("어린이/청소년 문화행사", "가족 문화행사", "여성 문화행사", "문화가 있는 날", "")
+TITLE_PREFIXES = ("2024", "제12회", "서울", "한여름밤의", "찾아가는", "기획전", "특별전", "시민과 함께하는", "")
+TITLE_SUBJECTS = (
+    "재즈 페스티벌", "현대미술展", "국악 한마당", "어린이 뮤지컬", "클래식 음악회", "사진전", "도자기 공예 체험",
+    "독립영화 상영회", "전통문화 체험", "거리 공연", "북 콘서트", "미디어아트 전시", "합창 공연", "발레 갈라",
+)
+TITLE_SUFFIXES = ("", "<봄>", "- 서울의 빛", "in 서울숲", "특별공연", ": 다시, 봄", "(앙코르)")
+FEES = ("무료", "전석 30,000원", "R석 70,000원, S석 50,000원", "성인 10,000원, 청소년 5,000원", "1만원", "")
+ACTION_TYPES = {"view": 85, "click": 12, "favorite": 3}
+
+SEOUL_CENTER = (37.5665, 126.9780)
+
+
+def _chooser(rng: random.Random, weights: dict[str, float]):
+    keys = list(weights)
+    cumulative = list(accumulate(weights.values()))
+
+    def choose() -> str:
+        return rng.choices(keys, cum_weights=cumulative)[0]
+
+    return choose
+
+
+def generate_events(count: int, *, seed: int, today: date) -> tuple[list[tuple], list[tuple]]:
+    """Return (events rows, event_details rows) in table column order."""
+
+    rng = random.Random(seed)
+    district = _chooser(rng, DISTRICTS)
+    category = _chooser(rng, CATEGORIES)
+    now = datetime.now(timezone.utc)
+
+    events: list[tuple] = []
+    details: list[tuple] = []
+    for event_id in range(1, count + 1):
+        start = datetime.combine(today + timedelta(days=rng.randint(-120, 180)), datetime.min.time(), timezone.utc)
+        end = start + timedelta(days=rng.choice((0, 0, 1, 2, 6, 13, 30, 60, 90)))
+        fee = rng.choice(FEES)
+        is_free = fee in ("무료", "")
+        price = 0 if is_free else rng.choice((5000, 10000, 20000, 30000, 50000, 70000))
+        title = " ".join(
+            part for part in (rng.choice(TITLE_PREFIXES), rng.choice(TITLE_SUBJECTS), rng.choice(TITLE_SUFFIXES)) if part
+        )
+        events.append(
+            (
+                event_id,
+                category(),
+                district(),
+                title,
+                f"{start:%Y-%m-%d}~{end:%Y-%m-%d}",
+                start,
+                end,
+                f"{rng.choice(('세종문화회관', '예술의전당', '서울시립미술관', '북서울꿈의숲', '돈의문박물관마을'))} {rng.randint(1, 5)}관",
+                rng.choice(("서울특별시", "서울문화재단", "구청", "민간")),
+                rng.choice(("누구나", "8세 이상", "성인", "어린이 및 가족")),
+                rng.choice(("기관", "시민")),
+                rng.choice(THEMES) or None,
+                f"https://culture.seoul.go.kr/culture/culture/cultureEvent/view.do?cultcode={event_id}",
+                f"https://culture.seoul.go.kr/cmmn/file/getImage.do?atchFileId={event_id:032x}&thumb=Y",
+                f"https://culture.seoul.go.kr/culture/culture/cultureEvent/view.do?cultcode={event_id}",
+                (start - timedelta(days=rng.randint(7, 60))).date(),
+                SEOUL_CENTER[1] + rng.gauss(0, 0.06),
+                SEOUL_CENTER[0] + rng.gauss(0, 0.05),
+                "무료" if is_free else "유료",
+                price,
+                price if is_free else price * rng.choice((1, 1, 2)),
+                None,
+                is_free,
+                now,
+                now,
+            )
+        )
+        details.append(
+            (
+                event_id,
+                fee or None,
+                rng.choice(("서울시립교향악단", "지역 예술인", "초청 작가", None)),
+                rng.choice(("1부: 공연 2부: 관객과의 대화", "상설 전시 및 도슨트 해설", None)),
+                None,
+            )
+        )
+    return events, details
+
+
+def generate_actions(
+    count: int, *, event_count: int, seed: int, days: int, chunk_size: int = 100_000
+) -> Iterator[list[tuple]]:
+    """Yield user_actions rows (user_id, action_type, target_id, timestamp, metadata) in chunks.
+
+    Targets follow a Zipf-like popularity curve and timestamps are spread
+    over the last ``days`` days, so hot events and recent buckets dominate
+    as they do in production.
+    """
+
+    rng = random.Random(seed + 1)
+    action_type = _chooser(rng, ACTION_TYPES)
+    popularity = list(accumulate(1.0 / rank**0.9 for rank in range(1, event_count + 1)))
+    ranked_ids = list(range(1, event_count + 1))
+    rng.shuffle(ranked_ids)
+    sessions = max(count // 20, 1)
+    end = datetime.now(timezone.utc)
+    span_seconds = days * 86400
+
+    produced = 0
+    while produced < count:
+        size = min(chunk_size, count - produced)
+        targets = rng.choices(ranked_ids, cum_weights=popularity, k=size)
+        chunk = [
+            (
+                None,
+                action_type(),
+                target,
+                end - timedelta(seconds=span_seconds * rng.random() ** 1.5),
+                json.dumps({"session_id": f"bench-{rng.randrange(sessions)}"}),
+            )
+            for target in targets
+        ]
+        produced += size
+        yield chunk
@@ -0,0 +1,141 @@
+"""Compare the date parsers used by the sync against their previous versions.
+
+    python -m benchmarks.date_parsing --repeat 5
+
+Every corpus string is checked for identical results first, then the
+parsers are timed on the date strings of the events fixture (or synthetic
+ones), where the same values repeat many times.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable, Iterable
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+from dateutil import parser as dateutil_parser
+
+from app.services import event_sync, parsers
+from benchmarks.fixtures import EVENTS_API, FIXTURES_DIR, event_rows, fixture_path, load_fixture, synthesize_event_pages
+
+EDGE_CASES = (
+    "2024-10-18", "2024-10-18 00:00:00.0", "2024-10-18 19:30", "2024-10-18 19:30:15", "2024-10-18 19:30:15.123456",
+    "2024-10-18 19:30:15.5", "2024-10-18T19:30:00", "2024-10-18T19:30:00+09:00", "2024-10-18 19:30:00 +0900",
+    "20241018", "2024-1-5", "2024-1-5 3:04", "2024-02-29", "2023-02-29", "2024-13-01", "2024-10-32",
+    "2024-10-18 24:00", "2024-10-18 23:60", "2024-10-18 23:59:60", "2024-10-18 12:00:00.1234567", "0000-01-01",
+    "2024/10/18", "2024.10.18", "18 Oct 2024", "2024-10-18 오후 7시", "상시", "20241399", "2024101", "2024-1018",
+)
+
+
+def legacy_event_sync_datetime(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S.%f"):
+        try:
+            parsed = datetime.strptime(value, fmt)
+            return parsed.replace(tzinfo=timezone.utc)
+        except ValueError:
+            continue
+    try:
+        parsed = dateutil_parser.parse(value)
+    except (ValueError, TypeError):
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def legacy_event_sync_date(value: str | None) -> date | None:
+    if not value:
+        return None
+    for fmt in ("%Y-%m-%d", "%Y%m%d"):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def legacy_parsers_datetime(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        dt = dateutil_parser.parse(value)
+    except (ValueError, TypeError):
+        return None
+    if not dt.tzinfo:
+        return dt.replace(tzinfo=datetime.utcnow().astimezone().tzinfo)
+    return dt.astimezone(tz=None)
+
+
+PAIRS: dict[str, tuple[Callable, Callable]] = {
+    "event_sync._parse_datetime": (legacy_event_sync_datetime, event_sync._parse_datetime),
+    "event_sync._parse_date": (legacy_event_sync_date, event_sync._parse_date),
+    "parsers.parse_datetime": (legacy_parsers_datetime, parsers.parse_datetime),
+}
+
+
+def _same(left: object, right: object) -> bool:
+    # Equal instants are not enough: the offset must match as well.
+    if isinstance(left, datetime) and isinstance(right, datetime):
+        return left == right and left.utcoffset() == right.utcoffset()
+    return left == right
+
+
+def check_identical(values: Iterable[str]) -> int:
+    mismatches = 0
+    for value in values:
+        for name, (legacy, current) in PAIRS.items():
+            expected, actual = legacy(value), current(value)
+            if not _same(expected, actual):
+                mismatches += 1
+                print(f"MISMATCH {name}({value!r}): {expected!r} != {actual!r}")
+    return mismatches
+
+
+def corpus(fixtures: Path) -> tuple[list[str], list[str]]:
+    if fixture_path(EVENTS_API, fixtures).is_file():
+        rows = event_rows(load_fixture(EVENTS_API, fixtures))
+    else:
+        rows = event_rows(synthesize_event_pages(5000, seed=20241018))
+    datetimes = [row[key].strip() for row in rows for key in ("STRTDATE", "END_DATE") if row.get(key)]
+    dates = [row["RGSTDATE"].strip() for row in rows if row.get("RGSTDATE")]
+    return datetimes, dates
+
+
+def timed(func: Callable, values: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for value in values:
+            func(value)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    datetimes, dates = corpus(args.fixtures)
+    mismatches = check_identical([*EDGE_CASES, *set(datetimes), *set(dates)])
+    print(f"checked {len(EDGE_CASES) + len(set(datetimes)) + len(set(dates))} distinct strings, {mismatches} mismatches\n")
+
+    print(f"{'parser':<28}{'values':>8}{'legacy ms':>12}{'new ms':>10}{'speedup':>9}")
+    for name, (legacy, current) in PAIRS.items():
+        values = dates if name.endswith("_date") else datetimes
+        parsers.match_datetime.cache_clear()
+        parsers.match_date.cache_clear()
+        before = timed(legacy, values, args.repeat)
+        after = timed(current, values, args.repeat)
+        print(f"{name:<28}{len(values):>8}{before * 1000:>12.1f}{after * 1000:>10.1f}{before / after:>8.1f}x")
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
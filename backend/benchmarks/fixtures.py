@@ -0,0 +1,254 @@
+"""Record and load compressed upstream fixtures for offline sync benchmarks.
+
+Fixtures are gzip-compressed JSON files in ``benchmarks/fixtures/``, one per
+upstream API, holding the paged responses exactly as received (service keys
+are never stored)::
+
+    python -m benchmarks.fixtures record            # needs real API keys and network
+    python -m benchmarks.fixtures synthesize        # deterministic, no network
+
+``benchmarks.stub_server`` replays them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import json
+import logging
+import random
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from app.core.config import get_settings
+from app.services.event_sync import fetch_seoul_events
+from app.services.weather_sync import KST, _determine_base_datetime, fetch_short_term_forecast
+from benchmarks.dataset import generate_events
+
+logger = logging.getLogger("benchmarks.fixtures")
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+EVENTS_API = "culturalEventInfo"
+FORECAST_API = "getVilageFcst"
+
+Page = dict[str, Any]
+
+
+def fixture_path(api: str, directory: Path = FIXTURES_DIR) -> Path:
+    return directory / f"{api}.json.gz"
+
+
+def save_fixture(api: str, pages: list[Page], *, source: str, directory: Path = FIXTURES_DIR) -> Path:
+    path = fixture_path(api, directory)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "api": api,
+        "source": source,
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "pages": pages,
+    }
+    with gzip.open(path, "wt", encoding="utf-8", compresslevel=9) as output:
+        json.dump(document, output, ensure_ascii=False)
+    logger.info("Saved %d %s pages to %s (%d bytes)", len(pages), api, path, path.stat().st_size)
+    return path
+
+
+def load_fixture(api: str, directory: Path = FIXTURES_DIR) -> list[Page]:
+    path = fixture_path(api, directory)
+    if not path.is_file():
+        raise SystemExit(f"Missing fixture {path}; run `python -m benchmarks.fixtures synthesize` first.")
+    with gzip.open(path, "rt", encoding="utf-8") as source:
+        return json.load(source)["pages"]
+
+
+def event_rows(pages: list[Page]) -> list[dict[str, Any]]:
+    """All culturalEventInfo rows in page order."""
+
+    rows: list[dict[str, Any]] = []
+    for page in pages:
+        if page["status"] == 200:
+            rows.extend(page["body"].get(EVENTS_API, {}).get("row", []))
+    return rows
+
+
+def forecast_items(pages: list[Page]) -> list[dict[str, Any]]:
+    items: list[dict[str, Any]] = []
+    for page in pages:
+        if page["status"] == 200:
+            items.extend(page["body"].get("response", {}).get("body", {}).get("items", {}).get("item", []))
+    return items
+
+
+class _Recorder:
+    """httpx response hook keeping each upstream page without credentials."""
+
+    def __init__(self) -> None:
+        self.pages: list[Page] = []
+
+    async def __call__(self, response: httpx.Response) -> None:
+        await response.aread()
+        url = response.request.url
+        request: dict[str, Any]
+        if EVENTS_API in url.path:
+            # .../{key}/json/culturalEventInfo/{start}/{end}
+            start, end = url.path.rstrip("/").split("/")[-2:]
+            request = {"start": int(start), "end": int(end)}
+        else:
+            request = {key: value for key, value in url.params.items() if key != "serviceKey"}
+        try:
+            body = response.json()
+        except ValueError:
+            body = response.text
+        self.pages.append({"request": request, "status": response.status_code, "body": body})
+
+
+async def record(directory: Path) -> None:
+    settings = get_settings()
+
+    recorder = _Recorder()
+    async with httpx.AsyncClient(
+        verify=settings.external_api_verify_ssl, event_hooks={"response": [recorder]}
+    ) as client:
+        await fetch_seoul_events(client)
+    save_fixture(EVENTS_API, recorder.pages, source="recorded", directory=directory)
+
+    recorder = _Recorder()
+    base_date, base_time, _ = _determine_base_datetime()
+    async with httpx.AsyncClient(
+        verify=settings.external_api_verify_ssl, event_hooks={"response": [recorder]}
+    ) as client:
+        await fetch_short_term_forecast(
+            client, base_date=base_date, base_time=base_time, nx=settings.kma_default_nx, ny=settings.kma_default_ny
+        )
+    save_fixture(FORECAST_API, recorder.pages, source="recorded", directory=directory)
+
+
+def _event_row(event: tuple, detail: tuple) -> dict[str, str]:
+    (
+        event_id, codename, guname, title, date_range, start, end, place, org_name, use_trgt, ticket, theme_code,
+        org_link, main_img, hmpg_addr, rgst_date, lot, lat, is_free, *_,
+    ) = event
+    return {
+        "CODENAME": codename,
+        "GUNAME": guname,
+        "TITLE": title,
+        "DATE": date_range,
+        "PLACE": place,
+        "ORG_NAME": org_name,
+        "USE_TRGT": use_trgt,
+        "USE_FEE": detail[1] or "",
+        "PLAYER": detail[2] or "",
+        "PROGRAM": detail[3] or "",
+        "ETC_DESC": "",
+        "ORG_LINK": org_link,
+        "MAIN_IMG": main_img,
+        "RGSTDATE": rgst_date.isoformat(),
+        "TICKET": ticket,
+        # The API sends midnight timestamps with a trailing fraction.
+        "STRTDATE": f"{start:%Y-%m-%d %H:%M:%S}.0",
+        "END_DATE": f"{end:%Y-%m-%d %H:%M:%S}.0",
+        "THEMECODE": theme_code or "",
+        "LOT": f"{lot:.7f}",
+        "LAT": f"{lat:.7f}",
+        "IS_FREE": is_free,
+        "HMPG_ADDR": hmpg_addr,
+    }
+
+
+def synthesize_event_pages(count: int, *, seed: int, page_size: int = 1000) -> list[Page]:
+    events, details = generate_events(count, seed=seed, today=datetime.now(KST).date())
+    rows = [_event_row(event, detail) for event, detail in zip(events, details)]
+    pages: list[Page] = []
+    for start in range(1, count + 1, page_size):
+        end = start + page_size - 1
+        body = {
+            EVENTS_API: {
+                "list_total_count": count,
+                "RESULT": {"CODE": "INFO-000", "MESSAGE": "정상 처리되었습니다"},
+                "row": rows[start - 1 : end],
+            }
+        }
+        pages.append({"request": {"start": start, "end": end}, "status": 200, "body": body})
+    return pages
+
+
+def synthesize_forecast_pages(*, seed: int, nx: int, ny: int) -> list[Page]:
+    rng = random.Random(seed)
+    base_date, base_time, base_day = _determine_base_datetime()
+    items: list[dict[str, Any]] = []
+    for day_offset in range(4):
+        forecast_day: date = base_day + timedelta(days=day_offset)
+        for hour in range(24):
+            temp = 14 + 6 * rng.random() + (4 if 10 <= hour <= 16 else 0)
+            values = {
+                "TMP": f"{temp:.0f}",
+                "UUU": f"{rng.uniform(-3, 3):.1f}",
+                "VVV": f"{rng.uniform(-3, 3):.1f}",
+                "VEC": str(rng.randrange(360)),
+                "WSD": f"{rng.uniform(0, 6):.1f}",
+                "SKY": str(rng.choice((1, 3, 4))),
+                "PTY": "0",
+                "POP": str(rng.choice((0, 0, 10, 20, 30, 60))),
+                "WAV": "0",
+                "PCP": "강수없음",
+                "REH": str(rng.randrange(30, 95, 5)),
+                "SNO": "적설없음",
+            }
+            for category, value in values.items():
+                items.append(
+                    {
+                        "baseDate": base_date,
+                        "baseTime": base_time,
+                        "category": category,
+                        "fcstDate": f"{forecast_day:%Y%m%d}",
+                        "fcstTime": f"{hour:02d}00",
+                        "fcstValue": value,
+                        "nx": nx,
+                        "ny": ny,
+                    }
+                )
+    body = {
+        "response": {
+            "header": {"resultCode": "00", "resultMsg": "NORMAL_SERVICE"},
+            "body": {
+                "dataType": "JSON",
+                "items": {"item": items[:1000]},
+                "pageNo": 1,
+                "numOfRows": 1000,
+                "totalCount": len(items),
+            },
+        }
+    }
+    request = {"pageNo": "1", "numOfRows": "1000", "dataType": "JSON", "base_date": base_date,
+               "base_time": base_time, "nx": str(nx), "ny": str(ny)}
+    return [{"request": request, "status": 200, "body": body}]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=("record", "synthesize"))
+    parser.add_argument("--dir", type=Path, default=FIXTURES_DIR)
+    parser.add_argument("--events", type=int, default=5000, help="synthetic event rows")
+    parser.add_argument("--seed", type=int, default=20241018)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    if args.command == "record":
+        asyncio.run(record(args.dir))
+        return
+    settings = get_settings()
+    save_fixture(EVENTS_API, synthesize_event_pages(args.events, seed=args.seed), source="synthetic", directory=args.dir)
+    save_fixture(
+        FORECAST_API,
+        synthesize_forecast_pages(seed=args.seed, nx=settings.kma_default_nx, ny=settings.kma_default_ny),
+        source="synthetic",
+        directory=args.dir,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""Drive the running API with a weighted mix of real requests.
+
+Start the backend against a seeded database, then from ``backend/``::
+
+    python -m benchmarks.load --concurrency 32 --duration 60 --label baseline
+
+Each worker picks a scenario by weight and issues it back to back. After a
+warm-up period, latencies are recorded per scenario; the summary is printed
+and saved as JSON under ``benchmarks/results/`` for ``benchmarks.compare``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import subprocess
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import httpx
+
+from benchmarks.dataset import CATEGORIES, DISTRICTS, TITLE_SUBJECTS
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+@dataclass
+class Scenario:
+    name: str
+    weight: float
+    request: Callable[[httpx.AsyncClient, random.Random], Awaitable[httpx.Response]]
+
+
+@dataclass
+class ScenarioStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: dict[str, int] = field(default_factory=dict)
+
+
+def build_scenarios(event_ids: list[int]) -> list[Scenario]:
+    districts = list(DISTRICTS)
+    categories = list(CATEGORIES)
+    today = datetime.now(timezone.utc).date()
+
+    def list_default(client: httpx.AsyncClient, rng: random.Random):
+        return client.get("/events/", params={"limit": 20, "offset": rng.choice((0, 0, 0, 20, 40))})
+
+    def list_district(client: httpx.AsyncClient, rng: random.Random):
+        return client.get("/events/", params={"guname": rng.choice(districts), "limit": 20})
+
+    def list_free_upcoming(client: httpx.AsyncClient, rng: random.Random):
+        start_after = today + timedelta(days=rng.randint(0, 30))
+        return client.get(
+            "/events/", params={"is_free": "무료", "start_after": start_after.isoformat(), "limit": 20}
+        )
+
+    def list_search(client: httpx.AsyncClient, rng: random.Random):
+        term = rng.choice(TITLE_SUBJECTS).split()[0]
+        return client.get("/events/", params={"search": term, "limit": 20})
+
+    def list_category_price(client: httpx.AsyncClient, rng: random.Random):
+        params = {
+            "codename": rng.choice(categories),
+            "price_max": rng.choice((0, 10000, 30000)),
+            "sort": "price_asc",
+            "limit": 20,
+        }
+        return client.get("/events/", params=params)
+
+    def locations(client: httpx.AsyncClient, rng: random.Random):
+        return client.get("/events/locations", params={"limit": 1000})
+
+    def with_weather(client: httpx.AsyncClient, rng: random.Random):
+        return client.get(f"/events/{rng.choice(event_ids)}/with-weather")
+
+    def record_action(client: httpx.AsyncClient, rng: random.Random):
+        payload = {
+            "action_type": "view",
+            "target_id": rng.choice(event_ids),
+            "metadata": {"session_id": f"load-{rng.randrange(10_000)}"},
+        }
+        return client.post("/actions/", json=payload)
+
+    def popular(client: httpx.AsyncClient, rng: random.Random):
+        return client.get("/actions/popular", params={"window": rng.choice(("1h", "24h", "7d")), "limit": 10})
+
+    return [
+        Scenario("list_events", 20, list_default),
+        Scenario("list_events_guname", 12, list_district),
+        Scenario("list_events_free_upcoming", 8, list_free_upcoming),
+        Scenario("list_events_search", 6, list_search),
+        Scenario("list_events_codename_price", 4, list_category_price),
+        Scenario("locations", 5, locations),
+        Scenario("with_weather", 15, with_weather),
+        Scenario("actions_create", 20, record_action),
+        Scenario("actions_popular", 10, popular),
+    ]
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(pct / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def summarize(stats: ScenarioStats, elapsed: float) -> dict:
+    latencies = sorted(stats.latencies)
+    return {
+        "requests": len(latencies),
+        "errors": stats.errors,
+        "statuses": stats.statuses,
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+    }
+
+
+async def sample_event_ids(client: httpx.AsyncClient, size: int) -> list[int]:
+    response = await client.get("/events/", params={"limit": size})
+    response.raise_for_status()
+    ids = [item["id"] for item in response.json()["items"]]
+    if not ids:
+        raise SystemExit("No events found; run `python -m benchmarks.seed` first.")
+    return ids
+
+
+async def run(args: argparse.Namespace) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        event_ids = await sample_event_ids(client, 500)
+        scenarios = build_scenarios(event_ids)
+        weights = [scenario.weight for scenario in scenarios]
+        stats = {scenario.name: ScenarioStats() for scenario in scenarios}
+
+        loop = asyncio.get_running_loop()
+        measure_from = loop.time() + args.warmup
+        stop_at = measure_from + args.duration
+
+        async def worker(index: int) -> None:
+            rng = random.Random(args.seed + index)
+            while (now := loop.time()) < stop_at:
+                scenario = rng.choices(scenarios, weights=weights)[0]
+                started = time.perf_counter()
+                try:
+                    response = await scenario.request(client, rng)
+                except httpx.HTTPError:
+                    outcome = "error"
+                else:
+                    outcome = str(response.status_code)
+                elapsed = time.perf_counter() - started
+                if now < measure_from:
+                    continue
+                entry = stats[scenario.name]
+                entry.statuses[outcome] = entry.statuses.get(outcome, 0) + 1
+                if outcome == "error" or outcome.startswith("5"):
+                    entry.errors += 1
+                else:
+                    entry.latencies.append(elapsed)
+
+        await asyncio.gather(*(worker(index) for index in range(args.concurrency)))
+
+    total = ScenarioStats()
+    for entry in stats.values():
+        total.latencies.extend(entry.latencies)
+        total.errors += entry.errors
+        for outcome, count in entry.statuses.items():
+            total.statuses[outcome] = total.statuses.get(outcome, 0) + count
+
+    return {
+        "label": args.label,
+        "git_sha": git_sha(),
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "host": platform.node(),
+        "python": platform.python_version(),
+        "config": {
+            "base_url": args.base_url,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "warmup": args.warmup,
+            "seed": args.seed,
+        },
+        "total": summarize(total, args.duration),
+        "scenarios": {name: summarize(entry, args.duration) for name, entry in stats.items()},
+    }
+
+
+def git_sha() -> str | None:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def print_report(result: dict) -> None:
+    header = f"{'scenario':<28}{'req':>8}{'err':>6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}"
+    print(header)
+    print("-" * len(header))
+    rows = list(result["scenarios"].items()) + [("TOTAL", result["total"])]
+    for name, summary in rows:
+        print(
+            f"{name:<28}{summary['requests']:>8}{summary['errors']:>6}{summary['throughput_rps']:>9.1f}"
+            f"{summary['p50_ms']:>9.1f}{summary['p95_ms']:>9.1f}{summary['p99_ms']:>9.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000/api")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=5.0, help="seconds of unrecorded requests first")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--label", default="run")
+    parser.add_argument("--output", type=Path, help="result file (default: benchmarks/results/<time>-<label>.json)")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    print_report(result)
+
+    output = args.output or RESULTS_DIR / f"{date.today():%Y%m%d}-{datetime.now():%H%M%S}-{args.label}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\nSaved {output}")
+
+
+if __name__ == "__main__":
+    main()
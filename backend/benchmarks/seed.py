@@ -0,0 +1,125 @@
+"""Load the synthetic benchmark dataset into a local Postgres.
+
+Run from ``backend/`` after ``alembic upgrade head``::
+
+    python -m benchmarks.seed --events 100000 --actions 2000000 --reset
+
+The connection uses ``DATABASE_URL`` like the application. Rows are loaded
+with ``COPY`` and the derived ``action_counters`` table is rebuilt from the
+loaded actions, so the popularity endpoints see consistent data.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import asyncpg
+
+from app.core.config import get_settings
+from app.services.partition_maintenance import PARENT_TABLE, PARTITION_PREFIX
+from benchmarks.dataset import generate_actions, generate_events
+
+logger = logging.getLogger("benchmarks.seed")
+
+EVENT_COLUMNS = (
+    "id", "codename", "guname", "title", "date", "start_date", "end_date", "place", "org_name", "use_trgt",
+    "ticket", "theme_code", "org_link", "main_img", "hmpg_addr", "rgst_date", "lot", "lat", "is_free",
+    "min_price", "max_price", "price_note", "is_free_normalized", "created_at", "updated_at",
+)
+DETAIL_COLUMNS = ("event_id", "use_fee", "player", "program", "etc_desc")
+ACTION_COLUMNS = ("user_id", "action_type", "target_id", "timestamp", "metadata")
+
+
+def asyncpg_dsn(database_url: str) -> str:
+    return database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+def _month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def _next_month(value: date) -> date:
+    return date(value.year + value.month // 12, value.month % 12 + 1, 1)
+
+
+async def ensure_partitions(conn: asyncpg.Connection, first: date, last: date) -> None:
+    month = _month_start(first)
+    while month <= last:
+        upper = _next_month(month)
+        await conn.execute(
+            f'CREATE TABLE IF NOT EXISTS "{PARTITION_PREFIX}{month.year:04d}_{month.month:02d}" '
+            f"PARTITION OF {PARENT_TABLE} FOR VALUES FROM ('{month.isoformat()}T00:00:00+00:00') "
+            f"TO ('{upper.isoformat()}T00:00:00+00:00')"
+        )
+        month = upper
+
+
+async def seed(args: argparse.Namespace) -> None:
+    conn = await asyncpg.connect(asyncpg_dsn(get_settings().database_url))
+    today = datetime.now(timezone.utc).date()
+    try:
+        if args.reset:
+            logger.info("Truncating benchmark tables")
+            await conn.execute(
+                "TRUNCATE events, event_details, user_actions, action_counters, weather RESTART IDENTITY CASCADE"
+            )
+
+        started = time.perf_counter()
+        events, details = generate_events(args.events, seed=args.seed, today=today)
+        await conn.copy_records_to_table("events", records=events, columns=EVENT_COLUMNS)
+        await conn.copy_records_to_table("event_details", records=details, columns=DETAIL_COLUMNS)
+        logger.info("Loaded %d events in %.1fs", len(events), time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await ensure_partitions(conn, today - timedelta(days=args.days), today)
+        loaded = 0
+        for chunk in generate_actions(args.actions, event_count=args.events, seed=args.seed, days=args.days):
+            await conn.copy_records_to_table(PARENT_TABLE, records=chunk, columns=ACTION_COLUMNS)
+            loaded += len(chunk)
+            logger.info("Loaded %d/%d user actions", loaded, args.actions)
+        logger.info("Loaded user actions in %.1fs", time.perf_counter() - started)
+
+        await conn.execute(
+            """
+            INSERT INTO action_counters (action_type, bucket_start, target_id, count)
+            SELECT action_type, date_trunc('hour', timestamp AT TIME ZONE 'UTC') AT TIME ZONE 'UTC', target_id, count(*)
+            FROM user_actions
+            WHERE target_id IS NOT NULL
+            GROUP BY 1, 2, 3
+            ON CONFLICT (action_type, bucket_start, target_id) DO UPDATE SET count = EXCLUDED.count
+            """
+        )
+        await conn.executemany(
+            """
+            INSERT INTO weather (date, location, temp, rain_prob, pm10) VALUES ($1, '서울', $2, $3, $4)
+            ON CONFLICT (date, location) DO NOTHING
+            """,
+            [
+                (today + timedelta(days=offset), 15.0 + (offset % 10), float(offset * 7 % 100), 20 + offset % 60)
+                for offset in range(-180, 181)
+            ],
+        )
+        await conn.execute("ANALYZE")
+        logger.info("Benchmark dataset ready")
+    finally:
+        await conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--actions", type=int, default=2_000_000)
+    parser.add_argument("--days", type=int, default=60, help="spread user actions over this many days")
+    parser.add_argument("--seed", type=int, default=20241018)
+    parser.add_argument("--reset", action="store_true", help="truncate the tables before loading")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    asyncio.run(seed(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Local stand-in for the Seoul open data and KMA APIs, replaying fixtures.
+
+    python -m benchmarks.stub_server --port 8089 --latency-ms 80 --jitter-ms 40 --error-rate 0.02
+
+Point the backend at it with ``SEOUL_OPEN_DATA_API_BASE=http://127.0.0.1:8089``
+and ``KMA_API_BASE=http://127.0.0.1:8089/kma``. Benchmarks can also mount
+the app in-process through ``httpx.ASGITransport``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from benchmarks.fixtures import EVENTS_API, FIXTURES_DIR, FORECAST_API, event_rows, load_fixture
+
+
+@dataclass(frozen=True)
+class FaultConfig:
+    """Latency and failures injected into every stub response."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    seed: int | None = None
+
+
+def create_stub_app(directory: Path = FIXTURES_DIR, faults: FaultConfig = FaultConfig()) -> Starlette:
+    rows = event_rows(load_fixture(EVENTS_API, directory))
+    forecast_pages = [page for page in load_fixture(FORECAST_API, directory) if page["status"] == 200]
+    rng = random.Random(faults.seed)
+    counts = {"requests": 0, "errors": 0}
+
+    async def inject() -> JSONResponse | None:
+        counts["requests"] += 1
+        delay = faults.latency + (rng.uniform(0, faults.jitter) if faults.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        if faults.error_rate and rng.random() < faults.error_rate:
+            counts["errors"] += 1
+            return JSONResponse({"error": "injected failure"}, status_code=faults.error_status)
+        return None
+
+    async def cultural_event_info(request: Request) -> JSONResponse:
+        if (failure := await inject()) is not None:
+            return failure
+        start = request.path_params["start"]
+        end = request.path_params["end"]
+        page = rows[max(start - 1, 0) : end]
+        if not page:
+            return JSONResponse({"RESULT": {"CODE": "INFO-200", "MESSAGE": "해당하는 데이터가 없습니다."}})
+        return JSONResponse(
+            {
+                EVENTS_API: {
+                    "list_total_count": len(rows),
+                    "RESULT": {"CODE": "INFO-000", "MESSAGE": "정상 처리되었습니다"},
+                    "row": page,
+                }
+            }
+        )
+
+    async def village_forecast(request: Request) -> JSONResponse:
+        if (failure := await inject()) is not None:
+            return failure
+        nx, ny = request.query_params.get("nx"), request.query_params.get("ny")
+        for page in forecast_pages:
+            if page["request"].get("nx") == nx and page["request"].get("ny") == ny:
+                return JSONResponse(page["body"])
+        if forecast_pages:
+            return JSONResponse(forecast_pages[0]["body"])
+        return JSONResponse(
+            {"response": {"header": {"resultCode": "03", "resultMsg": "NO_DATA"}, "body": {"items": {"item": []}}}}
+        )
+
+    async def stats(request: Request) -> JSONResponse:
+        return JSONResponse(counts)
+
+    app = Starlette(
+        routes=[
+            Route(f"/{{key}}/json/{EVENTS_API}/{{start:int}}/{{end:int}}", cultural_event_info),
+            Route(f"/{{prefix:path}}/{FORECAST_API}", village_forecast),
+            Route("/_stats", stats),
+        ]
+    )
+    app.state.counts = counts
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--dir", type=Path, default=FIXTURES_DIR)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests that fail")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    faults = FaultConfig(
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    uvicorn.run(create_stub_app(args.dir, faults), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Offline benchmarks for the sync pipeline, driven by replayed fixtures.
+
+    python -m benchmarks.fixtures synthesize
+    python -m benchmarks.sync_bench --repeat 20 --label baseline
+    python -m benchmarks.sync_bench --database      # also time the repository upserts
+
+Fetching goes through ``benchmarks.stub_server`` mounted in-process, so no
+network is used. ``--database`` writes to ``DATABASE_URL`` inside a
+transaction that is rolled back at the end, leaving the data untouched.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from app.core.config import get_settings
+from app.services.event_sync import fetch_seoul_events, transform_events
+from app.services.weather_sync import transform_forecast
+from benchmarks.fixtures import EVENTS_API, FIXTURES_DIR, FORECAST_API, event_rows, forecast_items, load_fixture
+from benchmarks.load import RESULTS_DIR, git_sha, percentile
+from benchmarks.stub_server import FaultConfig, create_stub_app
+
+
+def summarize(durations: list[float], rows: int, failures: int = 0) -> dict[str, Any]:
+    ordered = sorted(durations)
+    median = statistics.median(ordered) if ordered else 0.0
+    return {
+        "runs": len(ordered),
+        "failures": failures,
+        "rows": rows,
+        "throughput_rps": round(rows / median, 1) if median else 0.0,
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3) if ordered else 0.0,
+        "min_ms": round(ordered[0] * 1000, 3) if ordered else 0.0,
+        "p50_ms": round(median * 1000, 3),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+    }
+
+
+def bench_sync(func: Callable[[], Any], repeat: int) -> list[float]:
+    func()  # warm up caches and lazy imports
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+async def bench_async(func: Callable[[], Awaitable[Any]], repeat: int) -> tuple[list[float], int]:
+    durations = []
+    failures = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        try:
+            await func()
+        except (httpx.HTTPError, RuntimeError):
+            failures += 1
+            continue
+        durations.append(time.perf_counter() - started)
+    return durations, failures
+
+
+async def bench_fetch(args: argparse.Namespace, expected_rows: int) -> dict[str, Any]:
+    faults = FaultConfig(
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    transport = httpx.ASGITransport(app=create_stub_app(args.fixtures, faults))
+    async with httpx.AsyncClient(transport=transport) as client:
+        durations, failures = await bench_async(lambda: fetch_seoul_events(client), args.repeat)
+    return summarize(durations, expected_rows, failures)
+
+
+async def bench_upserts(events: list[dict], weather: list[dict], repeat: int) -> dict[str, dict[str, Any]]:
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from app.repositories import EventRepository, WeatherRepository
+
+    engine = create_async_engine(get_settings().database_url)
+    results = {}
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            # Repository commits only release a savepoint; the outer rollback discards everything.
+            session = AsyncSession(bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False)
+            try:
+                for name, repository, payloads in (
+                    ("upsert_events", EventRepository(session), events),
+                    ("upsert_weather", WeatherRepository(session), weather),
+                ):
+                    await repository.upsert_many(payloads)  # first run inserts, the timed runs update
+                    durations, failures = await bench_async(lambda: repository.upsert_many(payloads), repeat)
+                    results[name] = summarize(durations, len(payloads), failures)
+            finally:
+                await session.close()
+                await transaction.rollback()
+    finally:
+        await engine.dispose()
+    return results
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    records = event_rows(load_fixture(EVENTS_API, args.fixtures))
+    items = forecast_items(load_fixture(FORECAST_API, args.fixtures))
+    location = get_settings().kma_default_location
+
+    scenarios: dict[str, dict[str, Any]] = {}
+    scenarios["fetch_seoul_events"] = await bench_fetch(args, len(records))
+    scenarios["transform_events"] = summarize(bench_sync(lambda: transform_events(records), args.repeat), len(records))
+    scenarios["transform_forecast"] = summarize(
+        bench_sync(lambda: transform_forecast(items, location=location), args.repeat), len(items)
+    )
+    if args.database:
+        events = transform_events(records)
+        weather = transform_forecast(items, location=location)
+        scenarios.update(await bench_upserts(events, weather, max(args.repeat // 4, 3)))
+
+    return {
+        "label": args.label,
+        "git_sha": git_sha(),
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "host": platform.node(),
+        "python": platform.python_version(),
+        "config": {
+            "repeat": args.repeat,
+            "events": len(records),
+            "forecast_items": len(items),
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "error_rate": args.error_rate,
+        },
+        "scenarios": scenarios,
+    }
+
+
+def print_report(result: dict[str, Any]) -> None:
+    header = f"{'benchmark':<22}{'rows':>8}{'runs':>6}{'fail':>6}{'rows/s':>12}{'min':>10}{'p50':>10}{'p95':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, summary in result["scenarios"].items():
+        print(
+            f"{name:<22}{summary['rows']:>8}{summary['runs']:>6}{summary['failures']:>6}"
+            f"{summary['throughput_rps']:>12.0f}{summary['min_ms']:>10.2f}{summary['p50_ms']:>10.2f}"
+            f"{summary['p95_ms']:>10.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="stub latency per page")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of stub pages that fail")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--database", action="store_true", help="also benchmark the repository upserts")
+    parser.add_argument("--label", default="sync")
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    print_report(result)
+    output = args.output or RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}-{args.label}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\nSaved {output}")
+
+
+if __name__ == "__main__":
+    main()
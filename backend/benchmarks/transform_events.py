@@ -0,0 +1,220 @@
+"""Check the compiled event transformer against the previous row mapper and time both.
+
+    python -m benchmarks.transform_events --cases 20000 --repeat 5
+
+Randomised records (missing keys, padding, blanks, non-string values, odd
+dates and fees) plus the fixture rows must map to the same values as the
+dict-based ``transform_event`` this module keeps as a reference;
+``created_at``/``updated_at`` are only required to be equal to each other.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import random
+import time
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from app.services import event_sync
+from app.services.event_sync import EVENT_FIELD_SPEC, _parse_float, transform_event
+from app.services.pricing import parse_price_info
+from benchmarks.fixtures import EVENTS_API, FIXTURES_DIR, event_rows, fixture_path, load_fixture, synthesize_event_pages
+
+TIMESTAMP_FIELDS = ("created_at", "updated_at")
+# The reference mapper parsed every value afresh; the compiled one memoises.
+_parse_date = event_sync._parse_date.__wrapped__
+_parse_datetime = event_sync._parse_datetime.__wrapped__
+PARSE_CACHES = (event_sync._parse_date, event_sync._parse_datetime, event_sync._price_info)
+
+
+def legacy_transform_event(record: Mapping[str, object]) -> dict:
+    def get_str(key: str) -> str | None:
+        value = record.get(key)
+        if value is None:
+            return None
+        value = str(value).strip()
+        return value or None
+
+    def get_int(key: str) -> int | None:
+        value = record.get(key)
+        try:
+            return int(value) if value is not None else None
+        except (ValueError, TypeError):
+            return None
+
+    event_id = get_int("CULTCODE")
+    if event_id is None:
+        hmpg_addr = get_str("HMPG_ADDR")
+        if hmpg_addr:
+            query = parse_qs(urlparse(hmpg_addr).query)
+            for key in ("cultcode", "CULTCODE"):
+                values = query.get(key)
+                if values:
+                    try:
+                        event_id = int(values[0])
+                        break
+                    except (TypeError, ValueError):
+                        continue
+        if event_id is None:
+            digest_source = "|".join(
+                filter(
+                    None,
+                    [get_str("TITLE") or "", get_str("STRTDATE") or "", get_str("END_DATE") or "", get_str("PLACE") or ""],
+                )
+            )
+            digest = hashlib.sha1(digest_source.encode("utf-8"), usedforsecurity=False).hexdigest()
+            event_id = int(digest[:12], 16)
+
+    use_fee = get_str("USE_FEE")
+    ticket = get_str("TICKET")
+    is_free = get_str("IS_FREE")
+    price_info = parse_price_info(use_fee, ticket, is_free)
+    timestamp = datetime.now(timezone.utc)
+    return {
+        "id": event_id,
+        "codename": get_str("CODENAME"),
+        "guname": get_str("GUNAME"),
+        "title": get_str("TITLE") or "제목 미정",
+        "date": get_str("DATE"),
+        "start_date": _parse_datetime(get_str("STRTDATE")),
+        "end_date": _parse_datetime(get_str("END_DATE")),
+        "place": get_str("PLACE"),
+        "org_name": get_str("ORG_NAME"),
+        "use_trgt": get_str("USE_TRGT"),
+        "use_fee": use_fee,
+        "player": get_str("PLAYER"),
+        "program": get_str("PROGRAM"),
+        "etc_desc": get_str("ETC_DESC"),
+        "ticket": ticket,
+        "theme_code": get_str("THEMECODE"),
+        "org_link": get_str("ORG_LINK"),
+        "main_img": get_str("MAIN_IMG"),
+        "hmpg_addr": get_str("HMPG_ADDR"),
+        "rgst_date": _parse_date(get_str("RGSTDATE")),
+        "lot": _parse_float(get_str("LOT")),
+        "lat": _parse_float(get_str("LAT")),
+        "is_free": is_free,
+        "min_price": price_info.min_price,
+        "max_price": price_info.max_price,
+        "price_note": price_info.note,
+        "is_free_normalized": price_info.is_free,
+        "created_at": timestamp,
+        "updated_at": timestamp,
+    }
+
+
+SOURCE_KEYS = sorted({spec.source for spec in EVENT_FIELD_SPEC.values()} | {"CULTCODE"})
+CANDIDATES: dict[str, tuple[object, ...]] = {
+    "CULTCODE": ("12345", " 77 ", "", "abc", 42, 3.9, None),
+    "HMPG_ADDR": (
+        "https://culture.seoul.go.kr/culture/culture/cultureEvent/view.do?cultcode=150123&menuNo=200008",
+        "https://example.com/?CULTCODE=9",
+        "https://example.com/?cultcode=x&CULTCODE=5",
+        "https://example.com/event",
+        "https://example.com/?a=1&cultcode=&cultcode=12#cultcode=3",
+        "https://example.com/?%63ultcode=8&cultcode=9",
+        "https://example.com/?cultcode=+10",
+        "https://example.com/?cultcode=１１",
+        "https://example.com/?cultcode&CULTCODE=13=4",
+        "http://[bad/?cultcode=14",
+        "",
+    ),
+    "STRTDATE": ("2024-10-18 00:00:00.0", "2024-10-18", "2024-10-18 19:30", "20241018", "2024-02-30", "상시", ""),
+    "END_DATE": ("2024-12-31 00:00:00.0", "2024-12-31T23:59:59+09:00", "2024-1-5", "", None),
+    "RGSTDATE": ("2024-09-01", "20240901", "2024-09-01 10:00", "2024/09/01", "", None),
+    "USE_FEE": ("무료", "전석 30,000원", "R석 7만원, S석 5만원", "성인 10,000원 / 청소년 5,000원", "할인: 8,000원 (정가 10,000원)", ""),
+    "TICKET": ("기관", "시민", "", None),
+    "IS_FREE": ("무료", "유료", " 무료 ", "", None),
+    "LOT": ("126.9780", " 127.01 ", "", "경도", 126.5, None),
+    "LAT": ("37.5665", "", "위도", 37.1, None),
+    "TITLE": ("서울 재즈 페스티벌", "  ", "", None, 2024),
+}
+
+
+def random_record(rng: random.Random) -> dict[str, object]:
+    record: dict[str, object] = {}
+    for key in SOURCE_KEYS:
+        if rng.random() < 0.1:
+            continue  # missing key
+        options = CANDIDATES.get(key)
+        if options is not None:
+            record[key] = rng.choice(options)
+        else:
+            record[key] = rng.choice(("", "  ", None, f"{key.lower()} {rng.randrange(100)}", f" 값 {rng.randrange(5)} "))
+    return record
+
+
+def mismatch(record: Mapping[str, object]) -> str | None:
+    try:
+        expected = legacy_transform_event(record)
+    except ValueError as exc:
+        try:
+            transform_event(record)
+        except ValueError:
+            return None
+        return f"reference raised {exc!r}, compiled did not"
+    row = transform_event(record)
+    actual = row._asdict()
+    if set(actual) != set(expected):
+        return f"fields differ: {sorted(set(actual) ^ set(expected))}"
+    for field, value in expected.items():
+        if field in TIMESTAMP_FIELDS:
+            continue
+        if actual[field] != value or type(actual[field]) is not type(value):
+            return f"{field}: {value!r} != {actual[field]!r}"
+    if row.created_at != row.updated_at or row.created_at.tzinfo is None:
+        return "created_at/updated_at are not one aware timestamp"
+    return None
+
+
+def timed(func, records: list[Mapping[str, object]], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        # Each run starts cold, like the first sync after a restart.
+        for cache in PARSE_CACHES:
+            cache.cache_clear()
+        started = time.perf_counter()
+        for record in records:
+            func(record)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR)
+    parser.add_argument("--cases", type=int, default=20000, help="random records to check")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if fixture_path(EVENTS_API, args.fixtures).is_file():
+        rows = event_rows(load_fixture(EVENTS_API, args.fixtures))
+    else:
+        rows = event_rows(synthesize_event_pages(5000, seed=20241018))
+
+    rng = random.Random(args.seed)
+    failures = 0
+    for record in [*rows, *(random_record(rng) for _ in range(args.cases))]:
+        problem = mismatch(record)
+        if problem is not None:
+            failures += 1
+            if failures <= 20:
+                print(f"MISMATCH {problem}\n  record={record!r}")
+    print(f"checked {len(rows) + args.cases} records, {failures} mismatches\n")
+
+    before = timed(legacy_transform_event, rows, args.repeat)
+    after = timed(transform_event, rows, args.repeat)
+    print(f"{'transformer':<24}{'rows':>8}{'ms':>10}{'rows/s':>12}")
+    print(f"{'legacy transform_event':<24}{len(rows):>8}{before * 1000:>10.1f}{len(rows) / before:>12.0f}")
+    print(f"{'compiled transform_event':<24}{len(rows):>8}{after * 1000:>10.1f}{len(rows) / after:>12.0f}")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
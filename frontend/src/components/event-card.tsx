@@ -6,7 +6,7 @@ import { FavoriteButton } from "@/components/favorite-button";
 import { ProxyImage } from "@/components/proxy-image";
 import type { Event, Weather } from "@/lib/api-client";
 import { CalendarDays, MapPin, Ticket } from "lucide-react";
-import { parsePriceInfo, getSimplePriceDisplay } from "@/lib/price-utils";
+import { getSimplePriceDisplay } from "@/lib/price-utils";
 
 import { WeatherSummary } from "@/components/weather-summary";
 
@@ -35,21 +35,9 @@ export function EventCard({ event, weather, dateRange }: EventCardProps) {
     }
   }
   
-  // 가격 정보 파싱
-  const priceInfo = parsePriceInfo(event.use_fee, event.ticket, event.is_free);
-  const priceDisplay = getSimplePriceDisplay(priceInfo);
-  
-  // 디버깅 로그 (개발 환경에서만)
-  if (process.env.NODE_ENV === 'development' && Math.random() < 0.1) {
-    console.log('EventCard price debug:', {
-      title: event.title,
-      use_fee: event.use_fee,
-      ticket: event.ticket,
-      is_free: event.is_free,
-      priceInfo,
-      priceDisplay
-    });
-  }
+  // 가격 정보 (백엔드 동기화 시 구조화됨)
+  const isFree = Boolean(event.is_free_normalized);
+  const priceDisplay = getSimplePriceDisplay(event);
 
   const hasWeatherData =
     weather !== null && [weather.temp, weather.rain_prob, weather.pm10].some((value) => value !== null && value !== undefined);
@@ -90,13 +78,13 @@ export function EventCard({ event, weather, dateRange }: EventCardProps) {
                 </Badge>
               )}
               <Badge 
-                variant={priceInfo.isFree ? "outline" : "secondary"} 
-                className={priceInfo.isFree 
+                variant={isFree ? "outline" : "secondary"} 
+                className={isFree 
                   ? "border-green-500/30 text-green-600 bg-green-50" 
                   : "border-blue-500/30 text-blue-600 bg-blue-50"
                 }
               >
-                {priceInfo.isFree ? "무료" : "유료"}
+                {isFree ? "무료" : "유료"}
               </Badge>
             </div>
             {event.guname && (
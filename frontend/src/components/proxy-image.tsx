@@ -1,10 +1,19 @@
 "use client";
 
 import { useCallback, useEffect, useMemo, useState } from "react";
-import Image, { type ImageProps } from "next/image";
+import Image, { type ImageLoader, type ImageProps } from "next/image";
 
 const PLACEHOLDER_SRC = "/images/placeholder.jpg";
 
+// 프록시가 만드는 썸네일 폭 단계. 백엔드 image_warming.WARM_VARIANTS와 맞춰 둔다.
+const PROXY_WIDTHS = [320, 640, 960, 1280, 1920];
+const PROXY_FORMAT = "webp";
+
+const proxyLoader: ImageLoader = ({ src, width }) => {
+  const snapped = PROXY_WIDTHS.find((step) => step >= width) ?? PROXY_WIDTHS[PROXY_WIDTHS.length - 1];
+  return `${src}&w=${snapped}&format=${PROXY_FORMAT}`;
+};
+
 type ProxyImageProps = ImageProps & {
   fallbackSrc?: string;
   disableProxy?: boolean;
@@ -41,13 +50,15 @@ export function ProxyImage({
   alt,
   ...imageProps
 }: ProxyImageProps) {
-  const candidates = useMemo(() => {
+  const { candidates, proxyIndex } = useMemo(() => {
     const urls: Array<ImageProps["src"]> = [];
+    let proxyAt = -1;
 
     if (typeof src === "string") {
       if (!disableProxy) {
         const proxyUrl = buildProxyUrl(src);
         if (proxyUrl) {
+          proxyAt = urls.length;
           urls.push(proxyUrl as ImageProps["src"]);
         }
       }
@@ -60,7 +71,10 @@ export function ProxyImage({
       urls.push(fallbackSrc as ImageProps["src"]);
     }
 
-    return urls.length > 0 ? urls : [fallbackSrc as ImageProps["src"]];
+    return {
+      candidates: urls.length > 0 ? urls : [fallbackSrc as ImageProps["src"]],
+      proxyIndex: proxyAt,
+    };
   }, [src, fallbackSrc, disableProxy]);
 
   const [currentIndex, setCurrentIndex] = useState(0);
@@ -82,9 +96,15 @@ export function ProxyImage({
   );
 
   const resolvedSrc = candidates[currentIndex];
+  const isProxied = currentIndex === proxyIndex;
 
   const shouldBypassOptimizer = typeof resolvedSrc === "string" && resolvedSrc.startsWith("http://") && !disableProxy;
 
+  if (isProxied) {
+    // 프록시가 렌더링 폭에 맞춰 리사이즈·변환하므로 Next 최적화기를 거치지 않는다.
+    return <Image {...imageProps} alt={alt} src={resolvedSrc} onError={handleError} loader={proxyLoader} />;
+  }
+
   return (
     <Image
       {...imageProps}
@@ -54,6 +54,10 @@ export type Event = {
   use_fee?: string | null;
   ticket?: string | null;
   is_free?: string | null;
+  min_price?: number | null;
+  max_price?: number | null;
+  price_note?: string | null;
+  is_free_normalized?: boolean;
   lat?: number | null;
   lot?: number | null;
   created_at: string;
@@ -84,6 +88,9 @@ export type EventLocation = {
   start_date?: string | null;
   end_date?: string | null;
   is_free?: string | null;
+  min_price?: number | null;
+  max_price?: number | null;
+  is_free_normalized?: boolean;
 };
 
 export type EventQueryParams = {
@@ -93,6 +100,9 @@ export type EventQueryParams = {
   search?: string;
   start_after?: string;
   end_before?: string;
+  price_min?: number;
+  price_max?: number;
+  sort?: "start_date" | "price_asc" | "price_desc";
   limit?: number;
   offset?: number;
 };
@@ -257,36 +257,7 @@ export async function fetchEventData(
     return eventUtc >= todayUtc && eventUtc <= endUtc;
   });
 
-  const normalizeText = (value: string | null | undefined) => (value ? value.trim().toLowerCase() : "");
-  const isEventFree = (event: Event): boolean => {
-    const freeFlag = normalizeText(event.is_free);
-    if (freeFlag.includes("무료") || freeFlag.includes("free") || freeFlag === "y") {
-      return true;
-    }
-
-    const useFee = normalizeText(event.use_fee);
-    if (useFee.includes("무료") || useFee.includes("free") || useFee.includes("0원")) {
-      return true;
-    }
-
-    return false;
-  };
-
-  const extractPrice = (raw: string | null | undefined): number | null => {
-    if (!raw) {
-      return null;
-    }
-    const cleaned = raw.replace(/[,\s]/g, "");
-    const match = cleaned.match(/(\d+(?:\.\d+)?)/);
-    if (!match) {
-      return null;
-    }
-    const value = Number.parseFloat(match[1]);
-    if (Number.isNaN(value)) {
-      return null;
-    }
-    return value;
-  };
+  const isEventFree = (event: Event): boolean => Boolean(event.is_free_normalized);
 
   const average = (values: number[]): number | null => {
     if (values.length === 0) {
@@ -355,7 +326,7 @@ export async function fetchEventData(
     if (isEventFree(event)) {
       freeCount += 1;
     } else {
-      const price = extractPrice(event.use_fee ?? event.ticket ?? null);
+      const price = event.min_price ?? null;
       if (price !== null && price > 0) {
         paidPrices.push(price);
       }